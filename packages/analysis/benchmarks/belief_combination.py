@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+from pyds import MassFunction
+
+from judge_gym.aggregation_methods import (
+    GroupedBeliefAggregation,
+    aggregate_belief_groups,
+    aggregate_local_closed_world,
+    aggregate_local_tbm,
+    pack_verdict_masks,
+)
+
+
+def build_samples(sample_count: int, responses_per_sample: int, scale_size: int, *, seed: int = 0) -> list[list[dict]]:
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(sample_count):
+        responses = []
+        for _ in range(responses_per_sample):
+            abstained = rng.random() < 0.1
+            width = rng.choice([1, 1, 2, 3])
+            responses.append(
+                {
+                    "decoded_scores": [] if abstained else sorted(rng.sample(range(1, scale_size + 1), width)),
+                    "abstained": abstained,
+                    "score_expert_agreement_prob": rng.uniform(0.5, 0.95),
+                    "rubric_observability_score": rng.uniform(0.6, 1.0),
+                    "rubric_discriminability_score": rng.uniform(0.6, 1.0),
+                }
+            )
+        samples.append(responses)
+    return samples
+
+
+def pyds_mass(response: dict, scale_size: int, *, closed_world: bool) -> MassFunction | None:
+    theta = frozenset(range(1, scale_size + 1))
+    agreement = response["score_expert_agreement_prob"]
+    if response["abstained"]:
+        if closed_world:
+            return None
+        return MassFunction({frozenset(): agreement, theta: 1.0 - agreement})
+    verdict = frozenset(response["decoded_scores"])
+    verdict_mass = agreement
+    if not closed_world:
+        verdict_mass *= response["rubric_observability_score"] * response["rubric_discriminability_score"]
+    return MassFunction({verdict: verdict_mass, theta: 1.0 - verdict_mass})
+
+
+def pyds_aggregate(responses: list[dict], scale_size: int, *, closed_world: bool) -> tuple[float, list[float]]:
+    masses = [
+        mass
+        for mass in (pyds_mass(response, scale_size, closed_world=closed_world) for response in responses)
+        if mass is not None
+    ]
+    if closed_world:
+        unnormalized = masses[0]
+        conflict = 0.0
+        for mass in masses[1:]:
+            unnormalized = unnormalized.combine_conjunctive(mass, normalization=False)
+            conflict = float(unnormalized[frozenset()])
+        combined = masses[0]
+        if conflict < 0.9999:
+            for mass in masses[1:]:
+                combined = combined.combine_conjunctive(mass, normalization=True)
+    else:
+        combined = masses[0]
+        conflict = float(combined[frozenset()])
+        for mass in masses[1:]:
+            combined = combined.combine_conjunctive(mass, normalization=False)
+            conflict = float(combined[frozenset()])
+    if conflict >= 0.9999:
+        return conflict, [0.0] * scale_size
+    betp = combined.pignistic()
+    return conflict, [float(betp.get(frozenset([stage]), 0.0)) for stage in range(1, scale_size + 1)]
+
+
+def grouped_aggregate(samples: list[list[dict]], scale_size: int) -> GroupedBeliefAggregation:
+    responses = [response for sample in samples for response in sample]
+    return aggregate_belief_groups(
+        pack_verdict_masks([response["decoded_scores"] for response in responses], scale_size),
+        group_offsets=np.cumsum([0] + [len(sample) for sample in samples]),
+        scale_size=scale_size,
+        weights=[response["score_expert_agreement_prob"] for response in responses],
+        abstained=[response["abstained"] for response in responses],
+        observability=[response["rubric_observability_score"] for response in responses],
+        discriminability=[response["rubric_discriminability_score"] for response in responses],
+    )
+
+
+def best_of(repeats: int, run) -> tuple[float, list]:
+    best = float("inf")
+    result: list = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare pyds with the NumPy Dempster-Shafer engine, per sample and through aggregate_belief_groups"
+    )
+    parser.add_argument("--samples", type=int, default=300)
+    parser.add_argument("--responses-per-sample", type=int, default=10)
+    parser.add_argument("--scale-size", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--target-speedup", type=float, default=50.0)
+    args = parser.parse_args()
+
+    samples = build_samples(args.samples, args.responses_per_sample, args.scale_size)
+    report: dict[str, object] = {
+        "samples": args.samples,
+        "responses_per_sample": args.responses_per_sample,
+        "scale_size": args.scale_size,
+        "target_speedup": args.target_speedup,
+    }
+    grouped_seconds, grouped = best_of(args.repeats, lambda: grouped_aggregate(samples, args.scale_size))
+    pyds_total_seconds = 0.0
+    grouped_max_error = 0.0
+    for method, closed_world, aggregate, probabilities, conflicts in [
+        ("tbm", False, aggregate_local_tbm, grouped.tbm, grouped.tbm_conflict),
+        ("closed_world", True, aggregate_local_closed_world, grouped.closed_world, grouped.closed_world_conflict),
+    ]:
+        pyds_seconds, expected = best_of(
+            args.repeats,
+            lambda: [pyds_aggregate(sample, args.scale_size, closed_world=closed_world) for sample in samples],
+        )
+        engine_seconds, actual = best_of(
+            args.repeats,
+            lambda: [aggregate(sample, scale_size=args.scale_size) for sample in samples],
+        )
+        pyds_total_seconds += pyds_seconds
+        max_error = max(
+            max(
+                abs(result.conflict - conflict),
+                float(np.max(np.abs(np.array(result.stage_probabilities) - stage_probabilities))),
+            )
+            for result, (conflict, stage_probabilities) in zip(actual, expected)
+        )
+        grouped_max_error = max(
+            grouped_max_error,
+            max(
+                max(
+                    abs(conflicts[index] - conflict),
+                    float(np.max(np.abs(probabilities[index] - stage_probabilities))),
+                )
+                for index, (conflict, stage_probabilities) in enumerate(expected)
+            ),
+        )
+        report[method] = {
+            "pyds_us_per_sample": round(pyds_seconds / args.samples * 1e6, 2),
+            "engine_us_per_sample": round(engine_seconds / args.samples * 1e6, 2),
+            "speedup": round(pyds_seconds / engine_seconds, 2),
+            "meets_target": pyds_seconds / engine_seconds >= args.target_speedup,
+            "max_abs_error": max_error,
+        }
+    report["grouped"] = {
+        "pyds_us_per_sample": round(pyds_total_seconds / args.samples * 1e6, 2),
+        "engine_us_per_sample": round(grouped_seconds / args.samples * 1e6, 2),
+        "speedup": round(pyds_total_seconds / grouped_seconds, 2),
+        "meets_target": pyds_total_seconds / grouped_seconds >= args.target_speedup,
+        "max_abs_error": grouped_max_error,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
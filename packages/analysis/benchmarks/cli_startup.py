@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+LIGHT_COMMANDS = (
+    ("v3-figure-plan", "--help"),
+    ("v3-contract-check", "--help"),
+    ("v3-report", "--help"),
+)
+HEAVY_MODULES = (
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "pyds",
+    "scipy",
+    "seaborn",
+    "sentence_transformers",
+    "statsmodels",
+)
+
+
+def run_cli(command: tuple[str, ...], *, importtime: bool = False) -> subprocess.CompletedProcess[str]:
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-m", "judge_gym", *command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def best_wall_seconds(command: tuple[str, ...], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run_cli(command)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def import_times(command: tuple[str, ...]) -> list[tuple[str, int, int]]:
+    rows: list[tuple[str, int, int]] = []
+    for line in run_cli(command, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(cumulative_us), depth))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check CLI startup time and imports for the light subcommands")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=300.0)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    for command in LIGHT_COMMANDS:
+        imports = import_times(command)
+        top_level = sorted((row for row in imports if row[2] == 0), key=lambda row: row[1], reverse=True)
+        loaded = {name.split(".")[0] for name, _, _ in imports}
+        wall_seconds = best_wall_seconds(command, args.repeats)
+        results.append(
+            {
+                "command": " ".join(command),
+                "wall_ms": round(wall_seconds * 1000, 1),
+                "import_ms": round(sum(row[1] for row in top_level) / 1000, 1),
+                "slowest_imports_ms": {name: round(cumulative / 1000, 1) for name, cumulative, _ in top_level[: args.top]},
+                "heavy_modules": sorted(loaded.intersection(HEAVY_MODULES)),
+                "within_budget": wall_seconds * 1000 <= args.budget_ms,
+            }
+        )
+    print(json.dumps({"budget_ms": args.budget_ms, "commands": results}, indent=2))
+    if any(result["heavy_modules"] or not result["within_budget"] for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
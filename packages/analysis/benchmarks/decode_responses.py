@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from judge_gym.cache import CODED_RESPONSE_COLUMNS
+from judge_gym.datasets import _decode_response_frame, _json_loads
+
+EVIDENCE_COUNT = 400
+STRINGS = {
+    1: "exp_1",
+    2: "v3_demo",
+    3: "run_1",
+    4: "gpt-4.1",
+    5: "concept",
+    6: "subset",
+    7: "l2_neutralized",
+    8: "plan_1",
+    9: "window_round_robin",
+    10: "v1",
+}
+
+
+def build_raw_frame(response_count: int, *, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    refs = [rng.sample(range(1, EVIDENCE_COUNT + 1), 4) for _ in range(response_count)]
+    frame = pd.DataFrame(
+        {
+            "snapshot_id": "snapshot_1",
+            "response_id": [f"resp_{index}" for index in range(response_count)],
+            "sample_ordinal": np.arange(response_count) % 30,
+            "scale_size": 4,
+            "abstain_enabled": 1,
+            "abstained": 0,
+            "subset_size": 2,
+            "randomizations_json": json.dumps(["label_shuffle"]),
+            "decoded_scores_json": [json.dumps(sorted(rng.sample(range(1, 5), 2))) for _ in range(response_count)],
+            "evidence_refs_json": [json.dumps(values) for values in refs],
+            "evidence_positions_json": json.dumps([0, 1, 2, 3]),
+        }
+    )
+    for code, column in enumerate(CODED_RESPONSE_COLUMNS, start=1):
+        frame[f"{column}_code"] = code
+    return frame
+
+
+def evidence_refs() -> dict[int, tuple[str, ...]]:
+    return {
+        ref: (f"ev_{ref}", f"E{ref}", f"Evidence title {ref}", f"https://example.com/{ref}", f"window_{ref % 7}")
+        for ref in range(1, EVIDENCE_COUNT + 1)
+    }
+
+
+def decode_per_cell(frame: pd.DataFrame, refs: dict[int, tuple[str, ...]]) -> pd.DataFrame:
+    for column in CODED_RESPONSE_COLUMNS:
+        code_column = f"{column}_code"
+        frame.insert(frame.columns.get_loc(code_column), column, frame.pop(code_column).map(STRINGS))
+    for column in ["randomizations_json", "decoded_scores_json", "evidence_refs_json", "evidence_positions_json"]:
+        frame[column] = frame[column].apply(json.loads)
+    ref_lists = frame.pop("evidence_refs_json")
+    frame["randomizations"] = frame.pop("randomizations_json")
+    frame["decoded_scores"] = frame.pop("decoded_scores_json")
+    frame["evidence_ids"] = ref_lists.apply(lambda values: [refs[ref][0] for ref in values])
+    frame["evidence_labels"] = ref_lists.apply(lambda values: [refs[ref][1] for ref in values])
+    frame["evidence_titles"] = ref_lists.apply(lambda values: [refs[ref][2] for ref in values])
+    frame["evidence_urls"] = ref_lists.apply(lambda values: [refs[ref][3] for ref in values])
+    frame["window_ids"] = ref_lists.apply(lambda values: [refs[ref][4] for ref in values])
+    frame["evidence_positions"] = frame.pop("evidence_positions_json")
+    frame["abstain_enabled"] = frame["abstain_enabled"].astype(bool)
+    frame["abstained"] = frame["abstained"].astype(bool)
+    frame["bundle_label"] = frame["evidence_labels"].apply(lambda vals: " | ".join(vals))
+    frame["bundle_size"] = frame["evidence_ids"].apply(len)
+    frame["bundle_signature"] = frame["evidence_ids"].apply(
+        lambda vals: "|".join(sorted(str(value) for value in vals)),
+    )
+    frame["cluster_id"] = None
+    return frame
+
+
+def best_of(repeats: int, run) -> tuple[float, pd.DataFrame]:
+    best = float("inf")
+    result = pd.DataFrame()
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-cell and batched response frame decoding")
+    parser.add_argument("--responses", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    raw = build_raw_frame(args.responses)
+    refs = evidence_refs()
+    per_cell_seconds, expected = best_of(args.repeats, lambda: decode_per_cell(raw.copy(), refs))
+    batched_seconds, actual = best_of(
+        args.repeats,
+        lambda: _decode_response_frame(raw.copy(), strings=STRINGS, evidence_refs=refs),
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+
+    scale = 100_000 / args.responses
+    print(
+        json.dumps(
+            {
+                "responses": args.responses,
+                "json_backend": _json_loads.__module__,
+                "per_cell_seconds_per_100k": round(per_cell_seconds * scale, 4),
+                "batched_seconds_per_100k": round(batched_seconds * scale, 4),
+                "speedup": round(per_cell_seconds / batched_seconds, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
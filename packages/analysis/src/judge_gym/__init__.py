@@ -1,44 +1,100 @@
 """judge-gym analysis package — export, cache, and report tooling."""
 
-from .aggregation_methods import (
-    BeliefAggregationResult,
-    VerdictObservation,
-    aggregate_local_closed_world,
-    aggregate_local_tbm,
-    geometry_support_summary,
-    log_opinion_pool,
-    verdict_to_stage_probabilities,
-    weighted_linear_opinion_pool,
-)
-from .analysis_contract import load_analysis_contract, load_contract_artifacts
-from .aggregation_sensitivity import (
-    AggregationSensitivityOutputs,
-    run_aggregation_sensitivity,
-    write_aggregation_sensitivity_outputs,
-)
-from .collect import ExperimentData, pull_experiments
-from .datasets import ContractSnapshotBundle, SnapshotBundle, load_snapshot_bundle, load_snapshot_bundle_for_contract
-from .export import ConvexAnalysisClient, ExportedSnapshot, export_experiments
-from .figure_triage import build_repair_plan, load_figure_manifest
-from .investigate_v3 import generate_v3_investigation
-from .mine_v3 import mine_v3_findings, render_markdown_summary, write_mining_summary
-from .report_pilot import generate_pilot_report
-from .report_v3 import assemble_v3_report
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS_BY_MODULE = {
+    "aggregation_methods": (
+        "BeliefAggregationResult",
+        "GroupedBeliefAggregation",
+        "VerdictMatrix",
+        "VerdictObservation",
+        "aggregate_belief_groups",
+        "aggregate_local_closed_world",
+        "aggregate_local_tbm",
+        "build_verdict_matrix",
+        "geometry_support_summary",
+        "log_opinion_pool",
+        "pack_verdict_masks",
+        "verdict_matrix_from_masks",
+        "verdict_to_stage_probabilities",
+        "weighted_linear_opinion_pool",
+    ),
+    "analysis_contract": (
+        "load_analysis_contract",
+        "load_contract_artifacts",
+    ),
+    "aggregation_sensitivity": (
+        "AggregationSensitivityOutputs",
+        "run_aggregation_sensitivity",
+        "write_aggregation_sensitivity_outputs",
+    ),
+    "collect": (
+        "ExperimentData",
+        "pull_experiments",
+    ),
+    "datasets": (
+        "ContractSnapshotBundle",
+        "SnapshotBundle",
+        "load_snapshot_bundle",
+        "load_snapshot_bundle_for_contract",
+        "materialize_columnar_snapshots",
+    ),
+    "export": (
+        "AdaptivePageSizer",
+        "AsyncConvexAnalysisClient",
+        "ConvexAnalysisClient",
+        "ExportedSnapshot",
+        "RetryPolicy",
+        "export_experiments",
+        "export_experiments_async",
+    ),
+    "figure_triage": (
+        "build_repair_plan",
+        "load_figure_manifest",
+    ),
+    "investigate_v3": (
+        "generate_v3_investigation",
+    ),
+    "mine_v3": (
+        "mine_v3_findings",
+        "render_markdown_summary",
+        "write_mining_summary",
+    ),
+    "report_pilot": (
+        "generate_pilot_report",
+    ),
+    "report_v3": (
+        "assemble_v3_report",
+    ),
+}
+_EXPORT_MODULES = {name: module for module, names in _EXPORTS_BY_MODULE.items() for name in names}
+
 
 __all__ = [
+    "AdaptivePageSizer",
     "AggregationSensitivityOutputs",
+    "AsyncConvexAnalysisClient",
     "BeliefAggregationResult",
     "ContractSnapshotBundle",
     "ConvexAnalysisClient",
     "ExperimentData",
     "ExportedSnapshot",
+    "GroupedBeliefAggregation",
+    "RetryPolicy",
     "SnapshotBundle",
+    "VerdictMatrix",
     "VerdictObservation",
+    "aggregate_belief_groups",
     "aggregate_local_closed_world",
     "aggregate_local_tbm",
     "assemble_v3_report",
     "build_repair_plan",
+    "build_verdict_matrix",
     "export_experiments",
+    "export_experiments_async",
     "generate_v3_investigation",
     "mine_v3_findings",
     "geometry_support_summary",
@@ -49,11 +105,27 @@ __all__ = [
     "load_snapshot_bundle_for_contract",
     "load_snapshot_bundle",
     "log_opinion_pool",
+    "materialize_columnar_snapshots",
+    "pack_verdict_masks",
     "pull_experiments",
     "render_markdown_summary",
     "run_aggregation_sensitivity",
+    "verdict_matrix_from_masks",
     "verdict_to_stage_probabilities",
     "write_aggregation_sensitivity_outputs",
     "write_mining_summary",
     "weighted_linear_opinion_pool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,12 +2,23 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from itertools import chain
 from typing import Iterable, Mapping, Sequence
 
 import numpy as np
-from pyds import MassFunction
+
+from .dempster_shafer import (
+    _pignistic_matrix,
+    combine_simple_support,
+    combine_simple_support_groups,
+    pignistic,
+    simple_support_masses,
+    stage_mask,
+    theta_mask,
+)
 
 _ABSTAIN_POLICIES = {"zeros", "uniform"}
+_CONFLICT_THRESHOLD = 0.9999
 
 
 @dataclass(frozen=True)
@@ -20,6 +31,23 @@ class BeliefAggregationResult:
     stage_probabilities: tuple[float, ...]
 
 
+@dataclass(frozen=True)
+class GroupedBeliefAggregation:
+    scale_size: int
+    group_offsets: np.ndarray
+    n_observations: np.ndarray
+    abstain_count: np.ndarray
+    singleton_rate: np.ndarray
+    mean_subset_size: np.ndarray
+    geometry: np.ndarray
+    weighted_linear_pool: np.ndarray
+    log_opinion_pool: np.ndarray
+    tbm: np.ndarray
+    tbm_conflict: np.ndarray
+    closed_world: np.ndarray
+    closed_world_conflict: np.ndarray
+
+
 @dataclass(frozen=True)
 class VerdictObservation:
     decoded_scores: tuple[int, ...]
@@ -27,6 +55,19 @@ class VerdictObservation:
     weight: float = 1.0
 
 
+@dataclass(frozen=True)
+class VerdictMatrix:
+    probabilities: np.ndarray
+    members: np.ndarray
+    abstained: np.ndarray
+    subset_sizes: np.ndarray
+    scale_sizes: np.ndarray
+
+    @property
+    def verdict_masks(self) -> np.ndarray:
+        return self.members @ (1 << np.arange(self.members.shape[1], dtype=np.int64))
+
+
 def canonicalize_stage_set(decoded_scores: Sequence[int] | None, scale_size: int) -> tuple[int, ...]:
     if scale_size < 2:
         raise ValueError("scale_size must be at least 2")
@@ -39,6 +80,45 @@ def canonicalize_stage_set(decoded_scores: Sequence[int] | None, scale_size: int
     return tuple(canonical)
 
 
+def build_verdict_matrix(
+    decoded_scores: Iterable[Sequence[int] | None],
+    scale_size: int | Sequence[int] | np.ndarray,
+    *,
+    abstained: Sequence[bool] | np.ndarray | None = None,
+    abstain_policy: str = "zeros",
+) -> VerdictMatrix:
+    verdicts = list(map(_stage_values, decoded_scores))
+    scale_sizes, width = _resolve_scale_sizes(scale_size, len(verdicts))
+    lengths = np.fromiter(map(len, verdicts), dtype=np.int64, count=len(verdicts))
+    stages = np.fromiter(chain.from_iterable(verdicts), dtype=np.int64, count=int(lengths.sum()))
+    rows = np.repeat(np.arange(len(verdicts)), lengths)
+    outside = (stages < 1) | (stages > scale_sizes[rows])
+    if outside.any():
+        first = int(np.argmax(outside))
+        raise ValueError(f"stage {stages[first]} is outside 1..{scale_sizes[rows[first]]}")
+
+    members = np.zeros((len(verdicts), width), dtype=bool)
+    members[rows, stages - 1] = True
+    return _verdict_matrix(members, scale_sizes, abstained=abstained, abstain_policy=abstain_policy)
+
+
+def verdict_matrix_from_masks(
+    verdict_masks: Sequence[int] | np.ndarray,
+    scale_size: int | Sequence[int] | np.ndarray,
+    *,
+    abstained: Sequence[bool] | np.ndarray | None = None,
+    abstain_policy: str = "zeros",
+) -> VerdictMatrix:
+    masks = np.asarray(verdict_masks, dtype=np.int64).reshape(-1)
+    scale_sizes, width = _resolve_scale_sizes(scale_size, len(masks))
+    outside = (masks < 0) | (masks >> scale_sizes != 0)
+    if outside.any():
+        first = int(np.argmax(outside))
+        raise ValueError(f"verdict mask {masks[first]} is outside scale_size={scale_sizes[first]}")
+    members = ((masks[:, None] >> np.arange(width)) & 1).astype(bool)
+    return _verdict_matrix(members, scale_sizes, abstained=abstained, abstain_policy=abstain_policy)
+
+
 def verdict_to_stage_probabilities(
     decoded_scores: Sequence[int] | None,
     scale_size: int,
@@ -46,20 +126,12 @@ def verdict_to_stage_probabilities(
     abstained: bool = False,
     abstain_policy: str = "zeros",
 ) -> np.ndarray:
-    if abstain_policy not in _ABSTAIN_POLICIES:
-        raise ValueError(f"unsupported abstain_policy={abstain_policy!r}")
-    stage_set = canonicalize_stage_set(decoded_scores, scale_size)
-
-    if abstained or not stage_set:
-        if abstain_policy == "zeros":
-            return np.zeros(scale_size, dtype=float)
-        return np.full(scale_size, 1.0 / scale_size, dtype=float)
-
-    probabilities = np.zeros(scale_size, dtype=float)
-    share = 1.0 / len(stage_set)
-    for stage in stage_set:
-        probabilities[stage - 1] = share
-    return probabilities
+    return build_verdict_matrix(
+        [decoded_scores],
+        scale_size,
+        abstained=[abstained],
+        abstain_policy=abstain_policy,
+    ).probabilities[0]
 
 
 def weighted_linear_opinion_pool(
@@ -119,23 +191,16 @@ def geometry_support_summary(
             "stage_entropy": math.nan,
         }
 
-    abstained = np.array([obs.abstained or len(obs.decoded_scores) == 0 for obs in observations], dtype=bool)
-    subset_sizes = np.array(
-        [len(canonicalize_stage_set(obs.decoded_scores, scale_size)) for obs in observations],
-        dtype=float,
+    verdicts = build_verdict_matrix(
+        [obs.decoded_scores for obs in observations],
+        scale_size,
+        abstained=[obs.abstained for obs in observations],
+        abstain_policy=abstain_policy,
     )
+    abstained = verdicts.abstained
+    subset_sizes = verdicts.subset_sizes.astype(float)
     singleton = np.where(subset_sizes == 1, 1.0, 0.0)
-    vectors = np.vstack(
-        [
-            verdict_to_stage_probabilities(
-                obs.decoded_scores,
-                scale_size,
-                abstained=obs.abstained,
-                abstain_policy=abstain_policy,
-            )
-            for obs in observations
-        ]
-    )
+    vectors = verdicts.probabilities
 
     non_abstain_mask = ~abstained
     if non_abstain_mask.any():
@@ -176,8 +241,32 @@ def response_to_mass(
     rubric_observability_score: float | None = 1.0,
     rubric_discriminability_score: float | None = 1.0,
     closed_world: bool,
-) -> MassFunction | None:
-    theta = frozenset(range(1, scale_size + 1))
+) -> np.ndarray | None:
+    support = _response_simple_support(
+        decoded_scores=decoded_scores,
+        scale_size=scale_size,
+        abstained=abstained,
+        score_expert_agreement_prob=score_expert_agreement_prob,
+        rubric_observability_score=rubric_observability_score,
+        rubric_discriminability_score=rubric_discriminability_score,
+        closed_world=closed_world,
+    )
+    if support is None:
+        return None
+    return simple_support_masses([support[0]], [support[1]], scale_size)[0]
+
+
+def _response_simple_support(
+    *,
+    decoded_scores: Sequence[int] | None,
+    scale_size: int,
+    abstained: bool,
+    score_expert_agreement_prob: float | None,
+    rubric_observability_score: float | None,
+    rubric_discriminability_score: float | None,
+    closed_world: bool,
+) -> tuple[int, float] | None:
+    theta = theta_mask(scale_size)
     agreement = _clamp_unit(score_expert_agreement_prob if score_expert_agreement_prob is not None else 1.0)
 
     stage_set = canonicalize_stage_set(decoded_scores, scale_size)
@@ -185,20 +274,13 @@ def response_to_mass(
     if is_abstain:
         if closed_world:
             return None
-        mass = MassFunction()
-        mass[frozenset()] = agreement
-        mass[theta] = 1.0 - agreement
-        return mass
+        return 0, agreement
 
-    verdict = frozenset(stage_set)
+    verdict = stage_mask(stage_set)
     if verdict == theta:
-        mass = MassFunction()
         if closed_world:
-            mass[theta] = 1.0
-        else:
-            mass[theta] = agreement
-            mass[frozenset()] = 1.0 - agreement
-        return mass
+            return theta, 1.0
+        return 0, 1.0 - agreement
 
     if closed_world:
         verdict_mass = agreement
@@ -208,7 +290,7 @@ def response_to_mass(
             * _clamp_unit(rubric_observability_score if rubric_observability_score is not None else 1.0)
             * _clamp_unit(rubric_discriminability_score if rubric_discriminability_score is not None else 1.0)
         )
-    return MassFunction({verdict: verdict_mass, theta: 1.0 - verdict_mass})
+    return verdict, verdict_mass
 
 
 def aggregate_local_tbm(
@@ -233,14 +315,15 @@ def _aggregate_local_belief(
     scale_size: int,
     closed_world: bool,
 ) -> BeliefAggregationResult | None:
-    masses: list[MassFunction] = []
+    focal_masks: list[int] = []
+    weights: list[float] = []
     abstain_count = 0
     for response in responses:
         decoded_scores = response.get("decoded_scores")
         abstained = bool(response.get("abstained", False))
         if abstained or not decoded_scores:
             abstain_count += 1
-        mass = response_to_mass(
+        support = _response_simple_support(
             decoded_scores=decoded_scores if isinstance(decoded_scores, Sequence) else (),
             scale_size=scale_size,
             abstained=abstained,
@@ -249,60 +332,235 @@ def _aggregate_local_belief(
             rubric_discriminability_score=_float_or_default(response.get("rubric_discriminability_score"), 1.0),
             closed_world=closed_world,
         )
-        if mass is not None:
-            masses.append(mass)
+        if support is not None:
+            focal_masks.append(support[0])
+            weights.append(support[1])
 
-    if not masses:
+    if not focal_masks:
         return None
 
-    if closed_world:
-        combined_unnormalized = masses[0]
-        conflict = 0.0
-        for mass in masses[1:]:
-            combined_unnormalized = combined_unnormalized.combine_conjunctive(
-                mass,
-                normalization=False,
-            )
-            conflict = float(combined_unnormalized[frozenset()])
-
-        if conflict >= 0.9999:
-            combined = combined_unnormalized
-        else:
-            combined = masses[0]
-            for mass in masses[1:]:
-                combined = combined.combine_conjunctive(
-                    mass,
-                    normalization=True,
-                )
-    else:
-        combined = masses[0]
-        conflict = float(combined[frozenset()])
-        for mass in masses[1:]:
-            combined = combined.combine_conjunctive(
-                mass,
-                normalization=False,
-            )
-            conflict = float(combined[frozenset()])
-
-    if conflict >= 0.9999:
+    combined = combine_simple_support(focal_masks, weights, scale_size)
+    conflict = float(combined[0])
+
+    if conflict >= _CONFLICT_THRESHOLD:
         stage_probabilities = tuple(0.0 for _ in range(scale_size))
     else:
-        pignistic = combined.pignistic()
-        stage_probabilities = tuple(
-            float(pignistic.get(frozenset([stage]), 0.0))
-            for stage in range(1, scale_size + 1)
-        )
+        stage_probabilities = tuple(float(value) for value in pignistic(combined))
 
     return BeliefAggregationResult(
         method="closed_world" if closed_world else "tbm",
         scale_size=scale_size,
-        combined_count=len(masses),
+        combined_count=len(focal_masks),
         abstain_count=abstain_count,
         conflict=float(conflict),
         stage_probabilities=stage_probabilities,
     )
 
 
+def pack_verdict_masks(
+    decoded_scores: Iterable[Sequence[int] | None],
+    scale_size: int,
+) -> np.ndarray:
+    return build_verdict_matrix(decoded_scores, scale_size).verdict_masks
+
+
+def aggregate_belief_groups(
+    verdict_masks: Sequence[int] | np.ndarray,
+    *,
+    group_offsets: Sequence[int] | np.ndarray,
+    scale_size: int,
+    weights: Sequence[float] | np.ndarray | None = None,
+    abstained: Sequence[bool] | np.ndarray | None = None,
+    observability: Sequence[float] | np.ndarray | None = None,
+    discriminability: Sequence[float] | np.ndarray | None = None,
+    epsilon: float = 1e-12,
+) -> GroupedBeliefAggregation:
+    if scale_size < 2:
+        raise ValueError("scale_size must be at least 2")
+    if epsilon <= 0.0:
+        raise ValueError("epsilon must be positive")
+    masks = np.asarray(verdict_masks, dtype=np.int64).reshape(-1)
+    offsets = _validate_group_offsets(group_offsets, len(masks))
+    theta = theta_mask(scale_size)
+    if np.any((masks < 0) | (masks > theta)):
+        raise ValueError(f"verdict masks must lie in 0..{theta} for scale_size={scale_size}")
+    agreement = _response_array(weights, len(masks), "weights")
+    if np.any(agreement < 0.0):
+        raise ValueError("weights must be non-negative")
+    abstain = _response_array(abstained, len(masks), "abstained", default=False).astype(bool) | (masks == 0)
+
+    subset_sizes = np.bitwise_count(masks).astype(float)
+    answered = ~abstain
+    vectors = _pignistic_matrix(scale_size)[masks[answered]]
+    answered_offsets = _subset_offsets(offsets, answered)
+    answered_counts = np.diff(answered_offsets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        singleton_rate = _segment_sum(subset_sizes[answered] == 1, answered_offsets) / answered_counts
+        mean_subset_size = _segment_sum(subset_sizes[answered], answered_offsets) / answered_counts
+    geometry = _normalize_rows(_segment_sum(vectors, answered_offsets), answered_counts)
+
+    pool_weights = agreement[answered]
+    weight_totals = _segment_sum(pool_weights, answered_offsets)
+    unweighted = np.repeat(weight_totals <= 0.0, np.diff(answered_offsets))
+    pool_weights = np.where(unweighted, 1.0, pool_weights)
+    weighted_linear = _normalize_rows(_segment_sum(vectors * pool_weights[:, None], answered_offsets), answered_counts)
+    log_vectors = np.log(np.clip(vectors, epsilon, 1.0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_pooled = _segment_sum(log_vectors * pool_weights[:, None], answered_offsets) / _segment_sum(
+            pool_weights, answered_offsets
+        )[:, None]
+    log_pool = _normalize_rows(np.exp(log_pooled), answered_counts)
+
+    belief_agreement = np.clip(agreement, 0.0, 1.0)
+    verdict_mass = (
+        belief_agreement
+        * np.clip(_response_array(observability, len(masks), "observability"), 0.0, 1.0)
+        * np.clip(_response_array(discriminability, len(masks), "discriminability"), 0.0, 1.0)
+    )
+    is_theta = masks == theta
+    tbm_focal = np.where(abstain | is_theta, 0, masks)
+    tbm_weights = np.where(
+        abstain,
+        belief_agreement,
+        np.where(is_theta, 1.0 - belief_agreement, np.clip(verdict_mass, 0.0, 1.0)),
+    )
+    tbm, tbm_conflict = _combine_groups(tbm_focal, tbm_weights, offsets, scale_size)
+    closed_world, closed_world_conflict = _combine_groups(
+        masks[answered],
+        np.where(is_theta, 1.0, belief_agreement)[answered],
+        answered_offsets,
+        scale_size,
+    )
+
+    counts = np.diff(offsets)
+    return GroupedBeliefAggregation(
+        scale_size=scale_size,
+        group_offsets=offsets,
+        n_observations=counts,
+        abstain_count=counts - answered_counts,
+        singleton_rate=singleton_rate,
+        mean_subset_size=mean_subset_size,
+        geometry=geometry,
+        weighted_linear_pool=weighted_linear,
+        log_opinion_pool=log_pool,
+        tbm=tbm,
+        tbm_conflict=tbm_conflict,
+        closed_world=closed_world,
+        closed_world_conflict=closed_world_conflict,
+    )
+
+
+def _resolve_scale_sizes(scale_size: int | Sequence[int] | np.ndarray, count: int) -> tuple[np.ndarray, int]:
+    requested_sizes = np.asarray(scale_size, dtype=np.int64)
+    if np.any(requested_sizes < 2):
+        raise ValueError("scale_size must be at least 2")
+    return np.broadcast_to(requested_sizes, (count,)).copy(), int(requested_sizes.max(initial=2))
+
+
+def _verdict_matrix(
+    members: np.ndarray,
+    scale_sizes: np.ndarray,
+    *,
+    abstained: Sequence[bool] | np.ndarray | None,
+    abstain_policy: str,
+) -> VerdictMatrix:
+    if abstain_policy not in _ABSTAIN_POLICIES:
+        raise ValueError(f"unsupported abstain_policy={abstain_policy!r}")
+    subset_sizes = members.sum(axis=1)
+    abstain = subset_sizes == 0
+    if abstained is not None:
+        abstain |= np.asarray(abstained, dtype=bool)
+    probabilities = np.divide(
+        members,
+        subset_sizes[:, None],
+        out=np.zeros(members.shape, dtype=float),
+        where=~abstain[:, None],
+    )
+    if abstain_policy == "uniform":
+        within_scale = np.arange(members.shape[1])[None, :] < scale_sizes[:, None]
+        probabilities[abstain] = within_scale[abstain] / scale_sizes[abstain, None]
+    return VerdictMatrix(
+        probabilities=probabilities,
+        members=members,
+        abstained=abstain,
+        subset_sizes=subset_sizes,
+        scale_sizes=scale_sizes,
+    )
+
+
+def _stage_values(decoded_scores: Iterable[int] | None) -> Sequence[int]:
+    if decoded_scores is None:
+        return ()
+    if isinstance(decoded_scores, (list, tuple, np.ndarray)):
+        return decoded_scores
+    return tuple(decoded_scores)
+
+
+def _validate_group_offsets(group_offsets: Sequence[int] | np.ndarray, count: int) -> np.ndarray:
+    offsets = np.asarray(group_offsets, dtype=np.int64).reshape(-1)
+    if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != count:
+        raise ValueError("group_offsets must start at 0 and end at the number of responses")
+    if np.any(np.diff(offsets) < 0):
+        raise ValueError("group_offsets must be non-decreasing")
+    return offsets
+
+
+def _response_array(
+    values: Sequence[float] | Sequence[bool] | np.ndarray | None,
+    count: int,
+    name: str,
+    *,
+    default: float | bool = 1.0,
+) -> np.ndarray:
+    if values is None:
+        return np.full(count, default)
+    array = np.asarray(values)
+    if array.shape != (count,):
+        raise ValueError(f"{name} length must match the number of responses")
+    return array if isinstance(default, bool) else array.astype(float)
+
+
+def _subset_offsets(offsets: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    kept = np.concatenate([[0], np.cumsum(keep, dtype=np.int64)])
+    return kept[offsets]
+
+
+def _segment_sum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    return _segment_reduce(np.add, np.asarray(values, dtype=float), offsets, identity=0.0)
+
+
+def _segment_reduce(ufunc: np.ufunc, values: np.ndarray, offsets: np.ndarray, *, identity: float) -> np.ndarray:
+    counts = np.diff(offsets)
+    reduced = np.full((len(counts),) + values.shape[1:], identity, dtype=float)
+    nonempty = counts > 0
+    if nonempty.any():
+        reduced[nonempty] = ufunc.reduceat(values, offsets[:-1][nonempty], axis=0)
+    return reduced
+
+
+def _normalize_rows(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    totals = values.sum(axis=-1, keepdims=True)
+    normalized = np.divide(values, totals, out=np.zeros_like(values), where=totals > 0.0)
+    normalized[counts == 0] = np.nan
+    return normalized
+
+
+def _combine_groups(
+    focal_masks: np.ndarray,
+    weights: np.ndarray,
+    offsets: np.ndarray,
+    scale_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    combined = combine_simple_support_groups(focal_masks, weights, offsets, scale_size)
+    conflict = combined[:, 0].copy()
+    probabilities = pignistic(combined)
+    probabilities[conflict >= _CONFLICT_THRESHOLD] = 0.0
+    empty = np.diff(offsets) == 0
+    probabilities[empty] = np.nan
+    conflict[empty] = np.nan
+    return probabilities, conflict
+
+
 def _prepare_stage_matrix(
     stage_vectors: Sequence[Sequence[float] | np.ndarray],
     *,
@@ -7,18 +7,10 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .aggregation_methods import (
-    VerdictObservation,
-    aggregate_local_closed_world,
-    aggregate_local_tbm,
-    geometry_support_summary,
-    log_opinion_pool,
-    verdict_to_stage_probabilities,
-    weighted_linear_opinion_pool,
-)
+from .aggregation_methods import GroupedBeliefAggregation, aggregate_belief_groups, pack_verdict_masks
 from .analysis_contract import load_analysis_contract, load_contrast_registry
 from .contracts import resolve_repo_path
-from .datasets import load_snapshot_bundle_for_contract
+from .datasets import list_cells, load_snapshot_bundle_for_contract
 
 _SAMPLE_KEYS = ["experiment_tag", "sample_ordinal", "model_id", "scale_size"]
 _METHOD_ORDER = [
@@ -29,6 +21,17 @@ _METHOD_ORDER = [
     "local_closed_world",
 ]
 _SENSITIVITY_ENDPOINTS = ["expected_stage", "entropy_norm", "top1_prob", "conflict"]
+_RESPONSE_COLUMNS = [
+    "experiment_tag",
+    "sample_ordinal",
+    "model",
+    "scale_size",
+    "verdict_mask",
+    "abstained",
+    "score_expert_agreement_prob",
+    "rubric_observability_score",
+    "rubric_discriminability_score",
+]
 
 
 @dataclass(frozen=True)
@@ -51,6 +54,8 @@ def run_aggregation_sensitivity(
     bundle = load_snapshot_bundle_for_contract(
         contract_path=str(contract.path),
         cache_db_path=cache_db_path,
+        columns={"responses": _RESPONSE_COLUMNS},
+        lazy=True,
         validate_cache=True,
     ).bundle
     sample_methods = compute_sample_method_metrics(bundle.responses)
@@ -122,21 +127,11 @@ def compute_sample_method_metrics(
     normalized["model_id"] = normalized["model"].astype(str)
     normalized["scale_size"] = normalized["scale_size"].astype(int)
 
-    records: list[dict[str, Any]] = []
-    grouped = normalized.groupby(_SAMPLE_KEYS, dropna=False, sort=True)
-    for (experiment_tag, sample_ordinal, model_id, scale_size), group in grouped:
-        records.extend(
-            _compute_for_sample(
-                experiment_tag=str(experiment_tag),
-                sample_ordinal=int(sample_ordinal),
-                model_id=str(model_id),
-                scale_size=int(scale_size),
-                responses=group,
-            ),
-        )
-    frame = pd.DataFrame.from_records(records)
-    if frame.empty:
-        return frame
+    frames = [
+        _compute_for_scale(scale_frame, scale_size=int(scale_size))
+        for scale_size, scale_frame in normalized.groupby("scale_size", sort=True)
+    ]
+    frame = pd.concat(frames, ignore_index=True)
     frame["method"] = pd.Categorical(frame["method"], categories=_METHOD_ORDER, ordered=True)
     return frame.sort_values(_SAMPLE_KEYS + ["method"]).reset_index(drop=True)
 
@@ -193,133 +188,81 @@ def write_aggregation_sensitivity_outputs(
     return mapping
 
 
-def _compute_for_sample(
-    *,
-    experiment_tag: str,
-    sample_ordinal: int,
-    model_id: str,
-    scale_size: int,
-    responses: pd.DataFrame,
-) -> list[dict[str, Any]]:
-    observations: list[VerdictObservation] = []
-    stage_vectors: list[np.ndarray] = []
-    weights: list[float] = []
-    response_payloads: list[dict[str, Any]] = []
-
-    for row in responses.itertuples(index=False):
-        decoded_scores = _as_int_list(getattr(row, "decoded_scores", []))
-        abstained = bool(getattr(row, "abstained", False))
-        observations.append(VerdictObservation(tuple(decoded_scores), abstained=abstained))
-        stage_vectors.append(
-            verdict_to_stage_probabilities(
-                decoded_scores,
-                scale_size,
-                abstained=abstained,
-                abstain_policy="zeros",
+def _compute_for_scale(responses: pd.DataFrame, *, scale_size: int) -> pd.DataFrame:
+    codes = responses.groupby(_SAMPLE_KEYS, dropna=False, sort=True).ngroup().to_numpy()
+    ordered = responses.iloc[np.argsort(codes, kind="stable")]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(codes))])
+    result = aggregate_belief_groups(
+        _verdict_masks(ordered, scale_size),
+        group_offsets=offsets,
+        scale_size=scale_size,
+        weights=_non_negative_column(ordered, "score_expert_agreement_prob"),
+        abstained=ordered["abstained"].astype(bool).to_numpy(),
+        observability=_non_negative_column(ordered, "rubric_observability_score"),
+        discriminability=_non_negative_column(ordered, "rubric_discriminability_score"),
+    )
+    keys = ordered.iloc[offsets[:-1]]
+    shared = {
+        "experiment_tag": keys["experiment_tag"].astype(str).to_numpy(),
+        "sample_ordinal": keys["sample_ordinal"].astype(int).to_numpy(),
+        "model_id": keys["model_id"].to_numpy(),
+        "scale_size": np.full(len(keys), scale_size),
+        "n_observations": result.n_observations,
+        "abstain_rate": result.abstain_count / result.n_observations,
+        "singleton_rate": result.singleton_rate,
+        "mean_subset_size": result.mean_subset_size,
+    }
+    frames = []
+    for method, distributions, conflict in _method_distributions(result):
+        frames.append(
+            pd.DataFrame(
+                {
+                    **shared,
+                    "method": method,
+                    **_distribution_metrics(distributions),
+                    "conflict": conflict,
+                },
             ),
         )
-        weights.append(_safe_non_negative(getattr(row, "score_expert_agreement_prob", 1.0), fallback=1.0))
-        response_payloads.append(
-            {
-                "decoded_scores": decoded_scores,
-                "abstained": abstained,
-                "score_expert_agreement_prob": _safe_non_negative(
-                    getattr(row, "score_expert_agreement_prob", 1.0),
-                    fallback=1.0,
-                ),
-                "rubric_observability_score": _safe_non_negative(
-                    getattr(row, "rubric_observability_score", 1.0),
-                    fallback=1.0,
-                ),
-                "rubric_discriminability_score": _safe_non_negative(
-                    getattr(row, "rubric_discriminability_score", 1.0),
-                    fallback=1.0,
-                ),
-            },
-        )
+    return pd.concat(frames, ignore_index=True)
 
-    geometry = geometry_support_summary(observations, scale_size)
-    geometry_distribution = _mean_non_abstain_distribution(stage_vectors)
-    retained_vectors, retained_weights = _retain_nonzero_stage_vectors(stage_vectors, weights)
-    pooling_weights = retained_weights if sum(retained_weights) > 0.0 else None
-    weighted_distribution = weighted_linear_opinion_pool(retained_vectors, weights=pooling_weights)
-    log_distribution = log_opinion_pool(retained_vectors, weights=pooling_weights)
-
-    tbm_result = aggregate_local_tbm(response_payloads, scale_size=scale_size)
-    closed_world_result = aggregate_local_closed_world(response_payloads, scale_size=scale_size)
-
-    shared = {
-        "experiment_tag": experiment_tag,
-        "sample_ordinal": sample_ordinal,
-        "model_id": model_id,
-        "scale_size": scale_size,
-        "n_observations": int(len(responses)),
-        "abstain_rate": _to_float(geometry.get("abstain_rate")),
-        "singleton_rate": _to_float(geometry.get("singleton_rate")),
-        "mean_subset_size": _to_float(geometry.get("mean_subset_size")),
-    }
 
+def _method_distributions(
+    result: GroupedBeliefAggregation,
+) -> list[tuple[str, np.ndarray, np.ndarray]]:
+    no_conflict = np.full(len(result.n_observations), np.nan)
     return [
-        {
-            **shared,
-            "method": "geometry_first",
-            "expected_stage": _to_float(geometry.get("expected_stage")),
-            "mid_scale_mass": _to_float(geometry.get("mid_scale_mass")),
-            "entropy_norm": _entropy_norm(geometry_distribution),
-            "top1_prob": _top1_prob(geometry_distribution),
-            "conflict": np.nan,
-        },
-        {
-            **shared,
-            "method": "weighted_linear_pool",
-            "expected_stage": _expected_stage(weighted_distribution),
-            "mid_scale_mass": _mid_scale_mass(weighted_distribution),
-            "entropy_norm": _entropy_norm(weighted_distribution),
-            "top1_prob": _top1_prob(weighted_distribution),
-            "conflict": np.nan,
-        },
-        {
-            **shared,
-            "method": "log_opinion_pool",
-            "expected_stage": _expected_stage(log_distribution),
-            "mid_scale_mass": _mid_scale_mass(log_distribution),
-            "entropy_norm": _entropy_norm(log_distribution),
-            "top1_prob": _top1_prob(log_distribution),
-            "conflict": np.nan,
-        },
-        {
-            **shared,
-            "method": "local_tbm",
-            "expected_stage": _expected_stage(tbm_result.stage_probabilities if tbm_result else None),
-            "mid_scale_mass": _mid_scale_mass(tbm_result.stage_probabilities if tbm_result else None),
-            "entropy_norm": _entropy_norm(tbm_result.stage_probabilities if tbm_result else None),
-            "top1_prob": _top1_prob(tbm_result.stage_probabilities if tbm_result else None),
-            "conflict": float(tbm_result.conflict) if tbm_result else np.nan,
-        },
-        {
-            **shared,
-            "method": "local_closed_world",
-            "expected_stage": _expected_stage(closed_world_result.stage_probabilities if closed_world_result else None),
-            "mid_scale_mass": _mid_scale_mass(closed_world_result.stage_probabilities if closed_world_result else None),
-            "entropy_norm": _entropy_norm(closed_world_result.stage_probabilities if closed_world_result else None),
-            "top1_prob": _top1_prob(closed_world_result.stage_probabilities if closed_world_result else None),
-            "conflict": float(closed_world_result.conflict) if closed_world_result else np.nan,
-        },
+        ("geometry_first", result.geometry, no_conflict),
+        ("weighted_linear_pool", result.weighted_linear_pool, no_conflict),
+        ("log_opinion_pool", result.log_opinion_pool, no_conflict),
+        ("local_tbm", result.tbm, result.tbm_conflict),
+        ("local_closed_world", result.closed_world, result.closed_world_conflict),
     ]
 
 
-def _retain_nonzero_stage_vectors(
-    stage_vectors: list[np.ndarray],
-    weights: list[float],
-) -> tuple[list[np.ndarray], list[float]]:
-    retained_vectors: list[np.ndarray] = []
-    retained_weights: list[float] = []
-    for vector, weight in zip(stage_vectors, weights, strict=False):
-        if float(np.asarray(vector, dtype=float).sum()) <= 0.0:
-            continue
-        retained_vectors.append(vector)
-        retained_weights.append(weight)
-    return retained_vectors, retained_weights
+def _distribution_metrics(distributions: np.ndarray) -> dict[str, np.ndarray]:
+    totals = distributions.sum(axis=1)
+    valid = totals > 0.0
+    probs = np.divide(
+        distributions,
+        totals[:, None],
+        out=np.zeros_like(distributions),
+        where=valid[:, None],
+    )
+    scale_size = distributions.shape[1]
+    terms = np.zeros_like(probs)
+    positive = probs > 0.0
+    terms[positive] = -probs[positive] * np.log2(probs[positive])
+    if scale_size > 2:
+        mid_scale_mass = np.where(valid, probs[:, 1:-1].sum(axis=1), np.nan)
+    else:
+        mid_scale_mass = np.where(np.isnan(totals), np.nan, 0.0)
+    return {
+        "expected_stage": np.where(valid, probs @ np.arange(1, scale_size + 1, dtype=float), np.nan),
+        "mid_scale_mass": mid_scale_mass,
+        "entropy_norm": np.where(valid, terms.sum(axis=1) / np.log2(scale_size), np.nan),
+        "top1_prob": np.where(valid, probs.max(axis=1), np.nan),
+    }
 
 
 def _build_method_summary(sample_methods: pd.DataFrame) -> pd.DataFrame:
@@ -529,14 +472,25 @@ def _validate_response_columns(responses: pd.DataFrame) -> None:
         "sample_ordinal",
         "model",
         "scale_size",
-        "decoded_scores",
         "abstained",
     }
     missing = required - set(responses.columns)
+    if not {"decoded_scores", "verdict_mask"} & set(responses.columns):
+        missing.add("decoded_scores")
     if missing:
         raise ValueError(f"responses missing required columns: {sorted(missing)}")
 
 
+def _verdict_masks(responses: pd.DataFrame, scale_size: int) -> np.ndarray:
+    if "verdict_mask" in responses.columns:
+        masks = pd.to_numeric(responses["verdict_mask"], errors="coerce")
+        if masks.notna().all():
+            return masks.to_numpy(dtype=np.int64)
+    if "decoded_scores" not in responses.columns:
+        raise ValueError("responses include rows without a precomputed verdict_mask")
+    return pack_verdict_masks((_as_int_list(value) for value in list_cells(responses["decoded_scores"])), scale_size)
+
+
 def _as_int_list(value: Any) -> list[int]:
     if value is None:
         return []
@@ -551,99 +505,11 @@ def _as_int_list(value: Any) -> list[int]:
     return []
 
 
-def _safe_non_negative(value: Any, *, fallback: float) -> float:
-    try:
-        numeric = float(value)
-    except (TypeError, ValueError):
-        return fallback
-    if np.isnan(numeric):
-        return fallback
-    return float(max(0.0, numeric))
-
-
-def _mean_non_abstain_distribution(stage_vectors: list[np.ndarray]) -> np.ndarray:
-    if not stage_vectors:
-        return np.array([], dtype=float)
-    matrix = np.vstack(stage_vectors)
-    row_sums = matrix.sum(axis=1)
-    keep = row_sums > 0.0
-    if not keep.any():
-        return np.zeros(matrix.shape[1], dtype=float)
-    mean = matrix[keep].mean(axis=0)
-    total = float(mean.sum())
-    if total <= 0.0:
-        return np.zeros(matrix.shape[1], dtype=float)
-    return mean / total
-
-
-def _expected_stage(values: Any) -> float:
-    vector = _as_vector(values)
-    if vector.size == 0:
-        return np.nan
-    total = float(vector.sum())
-    if total <= 0.0:
-        return np.nan
-    probs = vector / total
-    support = np.arange(1, len(probs) + 1, dtype=float)
-    return float(np.dot(probs, support))
-
-
-def _entropy_norm(values: Any) -> float:
-    vector = _as_vector(values)
-    if vector.size == 0:
-        return np.nan
-    total = float(vector.sum())
-    if total <= 0.0:
-        return np.nan
-    probs = vector / total
-    positive = probs[probs > 0.0]
-    if positive.size == 0:
-        return 0.0
-    entropy = float(-(positive * np.log2(positive)).sum())
-    max_entropy = float(np.log2(len(probs))) if len(probs) > 1 else 0.0
-    if max_entropy <= 0.0:
-        return 0.0
-    return entropy / max_entropy
-
-
-def _mid_scale_mass(values: Any) -> float:
-    vector = _as_vector(values)
-    if vector.size <= 2:
-        return 0.0 if vector.size > 0 else np.nan
-    total = float(vector.sum())
-    if total <= 0.0:
-        return np.nan
-    probs = vector / total
-    return float(np.sum(probs[1:-1]))
-
-
-def _top1_prob(values: Any) -> float:
-    vector = _as_vector(values)
-    if vector.size == 0:
-        return np.nan
-    total = float(vector.sum())
-    if total <= 0.0:
-        return np.nan
-    probs = vector / total
-    return float(np.max(probs))
-
-
-def _as_vector(values: Any) -> np.ndarray:
-    if values is None:
-        return np.array([], dtype=float)
-    vector = np.asarray(values, dtype=float)
-    if vector.ndim != 1:
-        return np.array([], dtype=float)
-    return vector
-
-
-def _to_float(value: Any) -> float:
-    if value is None:
-        return np.nan
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return np.nan
+def _non_negative_column(responses: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in responses.columns:
+        return np.ones(len(responses), dtype=float)
+    values = pd.to_numeric(responses[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    return np.clip(np.where(np.isnan(values), 1.0, values), 0.0, None)
 
 
 def _nanmean_or_nan(values: Any) -> float:
@@ -4,11 +4,140 @@ import json
 import sqlite3
 import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
 APPLICATION_ID = 0x4A47414D  # "JGAM"
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 5
+PENDING_SNAPSHOT_TTL_MS = 7 * 24 * 60 * 60 * 1000
+SNAPSHOT_TABLES = (
+    "analysis_responses",
+    "analysis_response_items",
+    "analysis_rubrics",
+    "analysis_evidence",
+    "analysis_samples",
+)
+INHERITED_TABLES = (
+    "analysis_responses",
+    "analysis_response_items",
+    "analysis_rubrics",
+)
+INHERITED_ROW_IDS = {
+    "analysis_responses": "response_id",
+    "analysis_response_items": "response_id",
+    "analysis_rubrics": "rubric_id",
+}
+CRITIC_COLUMNS = {
+    "analysis_responses": (
+        "score_critic_id",
+        "score_expert_agreement_prob",
+        "rubric_critic_id",
+        "rubric_observability_score",
+        "rubric_discriminability_score",
+    ),
+    "analysis_rubrics": ("observability_score", "discriminability_score"),
+}
+CODED_RESPONSE_COLUMNS = (
+    "experiment_id",
+    "experiment_tag",
+    "run_id",
+    "model",
+    "concept",
+    "scoring_method",
+    "evidence_view",
+    "bundle_plan_tag",
+    "bundle_strategy",
+    "bundle_strategy_version",
+)
+EVIDENCE_REF_FIELDS = ("evidence_id", "label", "title", "url", "window_id")
+EVIDENCE_ITEM_COLUMNS = ("evidence_id", "evidence_label", "evidence_title", "evidence_url", "window_id")
+MIGRATION_BATCH_SIZE = 5_000
+MAX_VERDICT_STAGE = 62
+
+ANALYSIS_RESPONSES_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+  snapshot_id TEXT NOT NULL,
+  response_id TEXT NOT NULL,
+  experiment_id_code INTEGER NOT NULL,
+  experiment_tag_code INTEGER NOT NULL,
+  run_id_code INTEGER NOT NULL,
+  sample_id TEXT NOT NULL,
+  sample_ordinal INTEGER NOT NULL,
+  score_target_id TEXT NOT NULL,
+  score_critic_id TEXT,
+  rubric_id TEXT,
+  rubric_critic_id TEXT,
+  model_code INTEGER NOT NULL,
+  concept_code INTEGER NOT NULL,
+  scale_size INTEGER NOT NULL,
+  scoring_method_code INTEGER NOT NULL,
+  abstain_enabled INTEGER NOT NULL,
+  evidence_view_code INTEGER NOT NULL,
+  evidence_bundle_size INTEGER NOT NULL,
+  bundle_plan_tag_code INTEGER,
+  bundle_strategy_code INTEGER,
+  bundle_strategy_version_code INTEGER,
+  clustering_seed INTEGER,
+  bundle_signature TEXT,
+  cluster_id TEXT,
+  randomizations_json TEXT NOT NULL,
+  decoded_scores_json TEXT NOT NULL,
+  abstained INTEGER NOT NULL,
+  subset_size INTEGER NOT NULL,
+  justification TEXT NOT NULL,
+  score_expert_agreement_prob REAL,
+  rubric_observability_score REAL,
+  rubric_discriminability_score REAL,
+  evidence_refs_json TEXT NOT NULL,
+  evidence_positions_json TEXT NOT NULL,
+  verdict_mask INTEGER,
+  verdict_subset_size INTEGER
+)
+"""
+ANALYSIS_RESPONSES_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_analysis_responses_snapshot
+  ON analysis_responses (snapshot_id, experiment_tag_code)
+"""
+ANALYSIS_RESPONSE_ITEMS_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+  snapshot_id TEXT NOT NULL,
+  response_id TEXT NOT NULL,
+  experiment_tag TEXT NOT NULL,
+  run_id TEXT NOT NULL,
+  sample_id TEXT NOT NULL,
+  sample_ordinal INTEGER NOT NULL,
+  score_target_id TEXT NOT NULL,
+  bundle_plan_tag TEXT,
+  bundle_strategy TEXT,
+  bundle_signature TEXT NOT NULL,
+  cluster_id TEXT,
+  bundle_size INTEGER NOT NULL,
+  abstained INTEGER NOT NULL,
+  subset_size INTEGER NOT NULL,
+  evidence_ref INTEGER NOT NULL,
+  position INTEGER NOT NULL
+)
+"""
+ANALYSIS_RESPONSE_ITEMS_INDEX_SQL = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_analysis_response_items_snapshot
+      ON analysis_response_items (snapshot_id, experiment_tag)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_analysis_response_items_response
+      ON analysis_response_items (snapshot_id, response_id)
+    """,
+)
+
+
+@dataclass(frozen=True)
+class ExportCheckpoint:
+    table: str
+    continue_cursor: str | None
+    row_count: int
+    is_done: bool
+    last_row_id: str | None = None
 
 
 def default_cache_path() -> Path:
@@ -26,6 +155,13 @@ def connect_cache(path: str | Path | None = None) -> sqlite3.Connection:
     return connection
 
 
+def connect_cache_readonly(path: str | Path | None = None) -> sqlite3.Connection:
+    db_path = Path(path) if path is not None else default_cache_path()
+    connection = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
 def ensure_schema(connection: sqlite3.Connection) -> None:
     connection.executescript(
         """
@@ -41,80 +177,26 @@ def ensure_schema(connection: sqlite3.Connection) -> None:
           source_manifest_json TEXT NOT NULL
         );
 
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_snapshot_identity
-          ON export_snapshots (deployment_url, run_id, export_schema_version, status);
+        DROP INDEX IF EXISTS idx_snapshot_identity;
+        CREATE INDEX IF NOT EXISTS idx_snapshot_run
+          ON export_snapshots (deployment_url, run_id, export_schema_version, status, created_at_ms DESC);
         CREATE INDEX IF NOT EXISTS idx_snapshot_experiment
           ON export_snapshots (experiment_tag, created_at_ms DESC);
 
-        CREATE TABLE IF NOT EXISTS analysis_responses (
-          snapshot_id TEXT NOT NULL,
-          response_id TEXT NOT NULL,
-          experiment_id TEXT NOT NULL,
-          experiment_tag TEXT NOT NULL,
-          run_id TEXT NOT NULL,
-          sample_id TEXT NOT NULL,
-          sample_ordinal INTEGER NOT NULL,
-          score_target_id TEXT NOT NULL,
-          score_critic_id TEXT,
-          rubric_id TEXT,
-          rubric_critic_id TEXT,
-          model TEXT NOT NULL,
-          concept TEXT NOT NULL,
-          scale_size INTEGER NOT NULL,
-          scoring_method TEXT NOT NULL,
-          abstain_enabled INTEGER NOT NULL,
-          evidence_view TEXT NOT NULL,
-          evidence_bundle_size INTEGER NOT NULL,
-          bundle_plan_tag TEXT,
-          bundle_strategy TEXT,
-          bundle_strategy_version TEXT,
-          clustering_seed INTEGER,
-          bundle_signature TEXT,
-          cluster_id TEXT,
-          randomizations_json TEXT NOT NULL,
-          decoded_scores_json TEXT NOT NULL,
-          abstained INTEGER NOT NULL,
-          subset_size INTEGER NOT NULL,
-          justification TEXT NOT NULL,
-          score_expert_agreement_prob REAL,
-          rubric_observability_score REAL,
-          rubric_discriminability_score REAL,
-          evidence_ids_json TEXT NOT NULL,
-          evidence_labels_json TEXT NOT NULL,
-          evidence_titles_json TEXT NOT NULL,
-          evidence_urls_json TEXT NOT NULL,
-          window_ids_json TEXT NOT NULL,
-          evidence_positions_json TEXT NOT NULL
+        CREATE TABLE IF NOT EXISTS analysis_strings (
+          string_id INTEGER PRIMARY KEY,
+          value TEXT NOT NULL UNIQUE
         );
-        CREATE INDEX IF NOT EXISTS idx_analysis_responses_snapshot
-          ON analysis_responses (snapshot_id, experiment_tag);
 
-        CREATE TABLE IF NOT EXISTS analysis_response_items (
-          snapshot_id TEXT NOT NULL,
-          response_id TEXT NOT NULL,
-          experiment_tag TEXT NOT NULL,
-          run_id TEXT NOT NULL,
-          sample_id TEXT NOT NULL,
-          sample_ordinal INTEGER NOT NULL,
-          score_target_id TEXT NOT NULL,
-          bundle_plan_tag TEXT,
-          bundle_strategy TEXT,
-          bundle_signature TEXT NOT NULL,
-          cluster_id TEXT,
-          bundle_size INTEGER NOT NULL,
-          abstained INTEGER NOT NULL,
-          subset_size INTEGER NOT NULL,
+        CREATE TABLE IF NOT EXISTS analysis_evidence_refs (
+          evidence_ref INTEGER PRIMARY KEY,
           evidence_id TEXT NOT NULL,
-          evidence_label TEXT NOT NULL,
-          evidence_title TEXT NOT NULL,
-          evidence_url TEXT NOT NULL,
+          label TEXT NOT NULL,
+          title TEXT NOT NULL,
+          url TEXT NOT NULL,
           window_id TEXT NOT NULL,
-          position INTEGER NOT NULL
+          UNIQUE (evidence_id, label, title, url, window_id)
         );
-        CREATE INDEX IF NOT EXISTS idx_analysis_response_items_snapshot
-          ON analysis_response_items (snapshot_id, experiment_tag);
-        CREATE INDEX IF NOT EXISTS idx_analysis_response_items_response
-          ON analysis_response_items (snapshot_id, response_id);
 
         CREATE TABLE IF NOT EXISTS analysis_rubrics (
           snapshot_id TEXT NOT NULL,
@@ -169,6 +251,16 @@ def ensure_schema(connection: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_analysis_samples_snapshot
           ON analysis_samples (snapshot_id, experiment_tag);
 
+        CREATE TABLE IF NOT EXISTS export_checkpoints (
+          snapshot_id TEXT NOT NULL,
+          table_name TEXT NOT NULL,
+          continue_cursor TEXT,
+          row_count INTEGER NOT NULL,
+          is_done INTEGER NOT NULL,
+          updated_at_ms INTEGER NOT NULL,
+          PRIMARY KEY (snapshot_id, table_name)
+        );
+
         CREATE TABLE IF NOT EXISTS analysis_artifacts (
           snapshot_id TEXT NOT NULL,
           report_name TEXT NOT NULL,
@@ -181,14 +273,127 @@ def ensure_schema(connection: sqlite3.Connection) -> None:
           ON analysis_artifacts (snapshot_id, report_name);
         """
     )
+    _ensure_column(connection, "export_snapshots", "parent_snapshot_id", "TEXT")
+    _ensure_column(connection, "export_checkpoints", "last_row_id", "TEXT")
+    migrated = _ensure_analysis_responses(connection)
+    migrated = _ensure_analysis_response_items(connection) or migrated
+    connection.execute(f"PRAGMA user_version={SCHEMA_VERSION};")
+    connection.commit()
+    if migrated:
+        connection.execute("VACUUM")
+
+
+def _table_columns(connection: sqlite3.Connection, table: str) -> set[str]:
+    return {
+        str(row["name"])
+        for row in connection.execute(f"PRAGMA table_info({table})").fetchall()
+    }
+
+
+def _ensure_analysis_responses(connection: sqlite3.Connection) -> bool:
+    columns = _table_columns(connection, "analysis_responses")
+    if not columns:
+        connection.execute(ANALYSIS_RESPONSES_SQL.format(table="analysis_responses"))
+        connection.execute(ANALYSIS_RESPONSES_INDEX_SQL)
+        return False
+    if "evidence_labels_json" not in columns:
+        if "verdict_mask" not in columns:
+            _index_response_verdicts(connection)
+        return False
+
     _ensure_column(connection, "analysis_responses", "bundle_plan_tag", "TEXT")
     _ensure_column(connection, "analysis_responses", "bundle_strategy", "TEXT")
     _ensure_column(connection, "analysis_responses", "bundle_strategy_version", "TEXT")
     _ensure_column(connection, "analysis_responses", "clustering_seed", "INTEGER")
     _ensure_column(connection, "analysis_responses", "bundle_signature", "TEXT")
     _ensure_column(connection, "analysis_responses", "cluster_id", "TEXT")
-    connection.execute(f"PRAGMA user_version={SCHEMA_VERSION};")
     connection.commit()
+    connection.execute("BEGIN")
+    try:
+        connection.execute("DROP TABLE IF EXISTS analysis_responses_v3")
+        connection.execute(ANALYSIS_RESPONSES_SQL.format(table="analysis_responses_v3"))
+        dictionary = CacheDictionary(connection)
+        legacy = connection.execute("SELECT * FROM analysis_responses ORDER BY rowid")
+        while batch := legacy.fetchmany(MIGRATION_BATCH_SIZE):
+            serialized = [
+                _serialize_row(str(row["snapshot_id"]), "analysis_responses", _legacy_response_row(row), dictionary)
+                for row in batch
+            ]
+            _insert_serialized_rows(connection, "analysis_responses_v3", serialized)
+        connection.execute("DROP TABLE analysis_responses")
+        connection.execute("ALTER TABLE analysis_responses_v3 RENAME TO analysis_responses")
+        connection.execute(ANALYSIS_RESPONSES_INDEX_SQL)
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    return True
+
+
+def _ensure_analysis_response_items(connection: sqlite3.Connection) -> bool:
+    columns = _table_columns(connection, "analysis_response_items")
+    if not columns:
+        connection.execute(ANALYSIS_RESPONSE_ITEMS_SQL.format(table="analysis_response_items"))
+        for statement in ANALYSIS_RESPONSE_ITEMS_INDEX_SQL:
+            connection.execute(statement)
+        return False
+    if "evidence_ref" in columns:
+        return False
+
+    connection.commit()
+    connection.execute("BEGIN")
+    try:
+        connection.execute("DROP TABLE IF EXISTS analysis_response_items_v2")
+        connection.execute(ANALYSIS_RESPONSE_ITEMS_SQL.format(table="analysis_response_items_v2"))
+        dictionary = CacheDictionary(connection)
+        legacy = connection.execute("SELECT * FROM analysis_response_items ORDER BY rowid")
+        while batch := legacy.fetchmany(MIGRATION_BATCH_SIZE):
+            serialized = [
+                _serialize_row(str(row["snapshot_id"]), "analysis_response_items", dict(row), dictionary)
+                for row in batch
+            ]
+            _insert_serialized_rows(connection, "analysis_response_items_v2", serialized)
+        connection.execute("DROP TABLE analysis_response_items")
+        connection.execute("ALTER TABLE analysis_response_items_v2 RENAME TO analysis_response_items")
+        for statement in ANALYSIS_RESPONSE_ITEMS_INDEX_SQL:
+            connection.execute(statement)
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    return True
+
+
+def _index_response_verdicts(connection: sqlite3.Connection) -> None:
+    _ensure_column(connection, "analysis_responses", "verdict_mask", "INTEGER")
+    _ensure_column(connection, "analysis_responses", "verdict_subset_size", "INTEGER")
+    last_rowid = 0
+    while batch := connection.execute(
+        "SELECT rowid, decoded_scores_json FROM analysis_responses WHERE rowid > ? ORDER BY rowid LIMIT ?",
+        (last_rowid, MIGRATION_BATCH_SIZE),
+    ).fetchall():
+        connection.executemany(
+            "UPDATE analysis_responses SET verdict_mask = ?, verdict_subset_size = ? WHERE rowid = ?",
+            [(*encode_verdict(json.loads(row[1])), row[0]) for row in batch],
+        )
+        last_rowid = int(batch[-1][0])
+    connection.commit()
+
+
+def _legacy_response_row(row: sqlite3.Row) -> dict[str, Any]:
+    record = dict(row)
+    for column in [
+        "randomizations",
+        "decoded_scores",
+        "evidence_ids",
+        "evidence_labels",
+        "evidence_titles",
+        "evidence_urls",
+        "window_ids",
+        "evidence_positions",
+    ]:
+        record[column] = json.loads(record.pop(f"{column}_json"))
+    return record
 
 
 def _ensure_column(
@@ -197,15 +402,20 @@ def _ensure_column(
     column: str,
     definition: str,
 ) -> None:
-    columns = {
-        str(row["name"])
-        for row in connection.execute(f"PRAGMA table_info({table})").fetchall()
-    }
-    if column in columns:
+    if column in _table_columns(connection, table):
         return
     connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
 
 
+def encode_verdict(decoded_scores: Iterable[Any] | None) -> tuple[int | None, int | None]:
+    mask = 0
+    for stage in decoded_scores or ():
+        if isinstance(stage, bool) or not isinstance(stage, int) or not 1 <= stage <= MAX_VERDICT_STAGE:
+            return None, None
+        mask |= 1 << (stage - 1)
+    return mask, mask.bit_count()
+
+
 def existing_snapshot_id(
     connection: sqlite3.Connection,
     *,
@@ -229,11 +439,35 @@ def existing_snapshot_id(
     return None if row is None else str(row["snapshot_id"])
 
 
+def pending_snapshot_id(
+    connection: sqlite3.Connection,
+    *,
+    deployment_url: str,
+    run_id: str,
+    export_schema_version: int,
+) -> str | None:
+    row = connection.execute(
+        """
+        SELECT snapshot_id
+        FROM export_snapshots
+        WHERE deployment_url = ?
+          AND run_id = ?
+          AND export_schema_version = ?
+          AND status = 'pending'
+        ORDER BY created_at_ms DESC
+        LIMIT 1
+        """,
+        (deployment_url, run_id, export_schema_version),
+    ).fetchone()
+    return None if row is None else str(row["snapshot_id"])
+
+
 def create_snapshot(
     connection: sqlite3.Connection,
     *,
     deployment_url: str,
     manifest: dict[str, Any],
+    parent_snapshot_id: str | None = None,
 ) -> str:
     snapshot_id = uuid.uuid4().hex
     connection.execute(
@@ -247,8 +481,9 @@ def create_snapshot(
           run_id,
           run_created_at_ms,
           export_schema_version,
-          source_manifest_json
-        ) VALUES (?, 'pending', ?, ?, ?, ?, ?, ?, ?)
+          source_manifest_json,
+          parent_snapshot_id
+        ) VALUES (?, 'pending', ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             snapshot_id,
@@ -259,6 +494,7 @@ def create_snapshot(
             int(manifest["run"]["created_at"]),
             int(manifest["export_schema_version"]),
             json.dumps(manifest, sort_keys=True),
+            parent_snapshot_id,
         ),
     )
     connection.commit()
@@ -280,20 +516,270 @@ def write_snapshot_dataset(
     table: str,
     rows: Iterable[dict[str, Any]],
 ) -> None:
-    row_list = list(rows)
-    if not row_list:
-        return
+    with connection:
+        insert_snapshot_rows(
+            connection,
+            snapshot_id=snapshot_id,
+            table=table,
+            rows=rows,
+        )
+
+
+def insert_snapshot_rows(
+    connection: sqlite3.Connection,
+    *,
+    snapshot_id: str,
+    table: str,
+    rows: Iterable[dict[str, Any]],
+) -> int:
+    dictionary = CacheDictionary(connection)
+    serialized = [_serialize_row(snapshot_id, table, row, dictionary) for row in rows]
+    return _insert_serialized_rows(connection, table, serialized)
 
-    serialized = [_serialize_row(snapshot_id, table, row) for row in row_list]
+
+def _insert_serialized_rows(
+    connection: sqlite3.Connection,
+    table: str,
+    serialized: list[dict[str, Any]],
+) -> int:
+    if not serialized:
+        return 0
     columns = list(serialized[0].keys())
     placeholders = ", ".join(["?"] * len(columns))
     column_sql = ", ".join(columns)
-    values = [tuple(item[column] for column in columns) for item in serialized]
-    with connection:
-        connection.executemany(
-            f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})",
-            values,
+    cursor = connection.executemany(
+        f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})",
+        [tuple(item[column] for column in columns) for item in serialized],
+    )
+    return int(cursor.rowcount)
+
+
+class CacheDictionary:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._strings: dict[str, int] = {}
+        self._evidence_refs: dict[tuple[str, ...], int] = {}
+
+    def string_code(self, value: Any) -> int | None:
+        if value is None:
+            return None
+        text = str(value)
+        code = self._strings.get(text)
+        if code is None:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO analysis_strings (value) VALUES (?)",
+                (text,),
+            )
+            code = int(
+                self._connection.execute(
+                    "SELECT string_id FROM analysis_strings WHERE value = ?",
+                    (text,),
+                ).fetchone()[0]
+            )
+            self._strings[text] = code
+        return code
+
+    def evidence_ref(self, fields: tuple[str, ...]) -> int:
+        ref = self._evidence_refs.get(fields)
+        if ref is None:
+            self._connection.execute(
+                """
+                INSERT OR IGNORE INTO analysis_evidence_refs (
+                  evidence_id, label, title, url, window_id
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                fields,
+            )
+            ref = int(
+                self._connection.execute(
+                    """
+                    SELECT evidence_ref
+                    FROM analysis_evidence_refs
+                    WHERE evidence_id = ? AND label = ? AND title = ? AND url = ? AND window_id = ?
+                    """,
+                    fields,
+                ).fetchone()[0]
+            )
+            self._evidence_refs[fields] = ref
+        return ref
+
+
+def load_string_dictionary(connection: sqlite3.Connection) -> dict[int, str]:
+    rows = connection.execute("SELECT string_id, value FROM analysis_strings").fetchall()
+    return {int(row["string_id"]): str(row["value"]) for row in rows}
+
+
+def load_evidence_refs(connection: sqlite3.Connection) -> dict[int, tuple[str, ...]]:
+    rows = connection.execute(
+        "SELECT evidence_ref, evidence_id, label, title, url, window_id FROM analysis_evidence_refs"
+    ).fetchall()
+    return {
+        int(row["evidence_ref"]): tuple(str(row[field]) for field in EVIDENCE_REF_FIELDS)
+        for row in rows
+    }
+
+
+def record_export_checkpoint(
+    connection: sqlite3.Connection,
+    *,
+    snapshot_id: str,
+    table: str,
+    continue_cursor: str | None,
+    row_count: int,
+    is_done: bool,
+    last_row_id: str | None = None,
+) -> None:
+    connection.execute(
+        """
+        INSERT INTO export_checkpoints (
+          snapshot_id, table_name, continue_cursor, row_count, is_done, last_row_id, updated_at_ms
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (snapshot_id, table_name) DO UPDATE SET
+          continue_cursor = excluded.continue_cursor,
+          row_count = excluded.row_count,
+          is_done = excluded.is_done,
+          last_row_id = COALESCE(excluded.last_row_id, export_checkpoints.last_row_id),
+          updated_at_ms = excluded.updated_at_ms
+        """,
+        (
+            snapshot_id,
+            table,
+            continue_cursor,
+            row_count,
+            int(is_done),
+            last_row_id,
+            int(time.time() * 1000),
+        ),
+    )
+
+
+def load_export_checkpoints(
+    connection: sqlite3.Connection,
+    snapshot_id: str,
+) -> dict[str, ExportCheckpoint]:
+    rows = connection.execute(
+        """
+        SELECT table_name, continue_cursor, row_count, is_done, last_row_id
+        FROM export_checkpoints
+        WHERE snapshot_id = ?
+        """,
+        (snapshot_id,),
+    ).fetchall()
+    return {
+        str(row["table_name"]): ExportCheckpoint(
+            table=str(row["table_name"]),
+            continue_cursor=None if row["continue_cursor"] is None else str(row["continue_cursor"]),
+            row_count=int(row["row_count"]),
+            is_done=bool(row["is_done"]),
+            last_row_id=None if row["last_row_id"] is None else str(row["last_row_id"]),
         )
+        for row in rows
+    }
+
+
+def snapshot_lineage(connection: sqlite3.Connection, snapshot_id: str) -> list[str]:
+    rows = connection.execute(
+        """
+        WITH RECURSIVE lineage(snapshot_id, parent_snapshot_id, depth) AS (
+          SELECT snapshot_id, parent_snapshot_id, 0
+          FROM export_snapshots
+          WHERE snapshot_id = ?
+          UNION ALL
+          SELECT parent.snapshot_id, parent.parent_snapshot_id, lineage.depth + 1
+          FROM export_snapshots AS parent
+          JOIN lineage ON parent.snapshot_id = lineage.parent_snapshot_id
+        )
+        SELECT snapshot_id FROM lineage ORDER BY depth
+        """,
+        (snapshot_id,),
+    ).fetchall()
+    return [str(row["snapshot_id"]) for row in rows]
+
+
+def inherited_row_filters(table: str, lineage: list[str]) -> list[tuple[str, list[str]]]:
+    row_id = INHERITED_ROW_IDS[table]
+    filters: list[tuple[str, list[str]]] = []
+    for depth, source_snapshot_id in enumerate(lineage):
+        newer = lineage[:depth]
+        if not newer:
+            filters.append(("snapshot_id = ?", [source_snapshot_id]))
+            continue
+        placeholders = ", ".join(["?"] * len(newer))
+        filters.append(
+            (
+                f"snapshot_id = ? AND {row_id} NOT IN "
+                f"(SELECT {row_id} FROM {table} WHERE snapshot_id IN ({placeholders}))",
+                [source_snapshot_id, *newer],
+            )
+        )
+    return filters[::-1]
+
+
+def settled_row_prefix(
+    connection: sqlite3.Connection,
+    *,
+    snapshot_id: str,
+    table: str,
+) -> tuple[int, str | None]:
+    pending_sql = " OR ".join(f"{column} IS NULL" for column in CRITIC_COLUMNS[table])
+    row_id = INHERITED_ROW_IDS[table]
+    row_count = 0
+    last_row_id: str | None = None
+    for where_sql, params in inherited_row_filters(table, snapshot_lineage(connection, snapshot_id)):
+        first_pending = connection.execute(
+            f"SELECT MIN(rowid) FROM {table} WHERE ({where_sql}) AND ({pending_sql})",
+            params,
+        ).fetchone()[0]
+        settled_sql = f"({where_sql})" if first_pending is None else f"({where_sql}) AND rowid < ?"
+        settled_params = params if first_pending is None else [*params, first_pending]
+        row_count += int(
+            connection.execute(f"SELECT COUNT(*) FROM {table} WHERE {settled_sql}", settled_params).fetchone()[0]
+        )
+        last = connection.execute(
+            f"SELECT {row_id} FROM {table} WHERE {settled_sql} ORDER BY rowid DESC LIMIT 1",
+            settled_params,
+        ).fetchone()
+        if last is not None:
+            last_row_id = str(last[0])
+        if first_pending is not None:
+            break
+    return row_count, last_row_id
+
+
+def delete_snapshot(connection: sqlite3.Connection, snapshot_id: str) -> None:
+    with connection:
+        for table in SNAPSHOT_TABLES:
+            connection.execute(f"DELETE FROM {table} WHERE snapshot_id = ?", (snapshot_id,))
+        connection.execute("DELETE FROM export_checkpoints WHERE snapshot_id = ?", (snapshot_id,))
+        connection.execute("DELETE FROM export_snapshots WHERE snapshot_id = ?", (snapshot_id,))
+
+
+def garbage_collect_pending_snapshots(
+    connection: sqlite3.Connection,
+    *,
+    deployment_url: str | None = None,
+    run_id: str | None = None,
+    older_than_ms: int | None = None,
+) -> list[str]:
+    clauses = ["status = 'pending'"]
+    params: list[Any] = []
+    if deployment_url is not None:
+        clauses.append("deployment_url = ?")
+        params.append(deployment_url)
+    if run_id is not None:
+        clauses.append("run_id = ?")
+        params.append(run_id)
+    if older_than_ms is not None:
+        clauses.append("created_at_ms < ?")
+        params.append(int(time.time() * 1000) - older_than_ms)
+    rows = connection.execute(
+        f"SELECT snapshot_id FROM export_snapshots WHERE {' AND '.join(clauses)}",
+        params,
+    ).fetchall()
+    snapshot_ids = [str(row["snapshot_id"]) for row in rows]
+    for snapshot_id in snapshot_ids:
+        delete_snapshot(connection, snapshot_id)
+    return snapshot_ids
 
 
 def list_latest_snapshot_ids(
@@ -371,34 +857,65 @@ def snapshot_manifest(
     return json.loads(str(row["source_manifest_json"]))
 
 
+def snapshot_manifests(
+    connection: sqlite3.Connection,
+    snapshot_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    placeholders = ", ".join(["?"] * len(snapshot_ids))
+    rows = connection.execute(
+        f"SELECT snapshot_id, source_manifest_json FROM export_snapshots WHERE snapshot_id IN ({placeholders})",
+        snapshot_ids,
+    ).fetchall()
+    manifests = {str(row["snapshot_id"]): json.loads(str(row["source_manifest_json"])) for row in rows}
+    missing = [snapshot_id for snapshot_id in snapshot_ids if snapshot_id not in manifests]
+    if missing:
+        raise ValueError(f"Unknown snapshot_id={missing[0]}")
+    return {snapshot_id: manifests[snapshot_id] for snapshot_id in snapshot_ids}
+
+
 def _serialize_row(
     snapshot_id: str,
     table: str,
     row: dict[str, Any],
+    dictionary: CacheDictionary,
 ) -> dict[str, Any]:
     base = {"snapshot_id": snapshot_id}
     if table == "analysis_responses":
+        evidence_fields = [
+            row["evidence_ids"],
+            row["evidence_labels"],
+            row["evidence_titles"],
+            row["evidence_urls"],
+            row["window_ids"],
+        ]
+        evidence_refs = [
+            dictionary.evidence_ref(
+                tuple(str(values[index]) if index < len(values) else "" for values in evidence_fields)
+            )
+            for index in range(len(row["evidence_ids"]))
+        ]
+        verdict_mask, verdict_subset_size = encode_verdict(row["decoded_scores"])
         return base | {
             "response_id": row["response_id"],
-            "experiment_id": row["experiment_id"],
-            "experiment_tag": row["experiment_tag"],
-            "run_id": row["run_id"],
+            "experiment_id_code": dictionary.string_code(row["experiment_id"]),
+            "experiment_tag_code": dictionary.string_code(row["experiment_tag"]),
+            "run_id_code": dictionary.string_code(row["run_id"]),
             "sample_id": row["sample_id"],
             "sample_ordinal": row["sample_ordinal"],
             "score_target_id": row["score_target_id"],
             "score_critic_id": row["score_critic_id"],
             "rubric_id": row["rubric_id"],
             "rubric_critic_id": row["rubric_critic_id"],
-            "model": row["model"],
-            "concept": row["concept"],
+            "model_code": dictionary.string_code(row["model"]),
+            "concept_code": dictionary.string_code(row["concept"]),
             "scale_size": row["scale_size"],
-            "scoring_method": row["scoring_method"],
+            "scoring_method_code": dictionary.string_code(row["scoring_method"]),
             "abstain_enabled": int(bool(row["abstain_enabled"])),
-            "evidence_view": row["evidence_view"],
+            "evidence_view_code": dictionary.string_code(row["evidence_view"]),
             "evidence_bundle_size": row["evidence_bundle_size"],
-            "bundle_plan_tag": row.get("bundle_plan_tag"),
-            "bundle_strategy": row.get("bundle_strategy"),
-            "bundle_strategy_version": row.get("bundle_strategy_version"),
+            "bundle_plan_tag_code": dictionary.string_code(row.get("bundle_plan_tag")),
+            "bundle_strategy_code": dictionary.string_code(row.get("bundle_strategy")),
+            "bundle_strategy_version_code": dictionary.string_code(row.get("bundle_strategy_version")),
             "clustering_seed": row.get("clustering_seed"),
             "bundle_signature": row.get("bundle_signature"),
             "cluster_id": row.get("cluster_id"),
@@ -410,12 +927,10 @@ def _serialize_row(
             "score_expert_agreement_prob": row["score_expert_agreement_prob"],
             "rubric_observability_score": row["rubric_observability_score"],
             "rubric_discriminability_score": row["rubric_discriminability_score"],
-            "evidence_ids_json": json.dumps(row["evidence_ids"]),
-            "evidence_labels_json": json.dumps(row["evidence_labels"]),
-            "evidence_titles_json": json.dumps(row["evidence_titles"]),
-            "evidence_urls_json": json.dumps(row["evidence_urls"]),
-            "window_ids_json": json.dumps(row["window_ids"]),
+            "evidence_refs_json": json.dumps(evidence_refs),
             "evidence_positions_json": json.dumps(row["evidence_positions"]),
+            "verdict_mask": verdict_mask,
+            "verdict_subset_size": verdict_subset_size,
         }
     if table == "analysis_response_items":
         return base | {
@@ -432,11 +947,9 @@ def _serialize_row(
             "bundle_size": row["bundle_size"],
             "abstained": int(bool(row["abstained"])),
             "subset_size": row["subset_size"],
-            "evidence_id": row["evidence_id"],
-            "evidence_label": row["evidence_label"],
-            "evidence_title": row["evidence_title"],
-            "evidence_url": row["evidence_url"],
-            "window_id": row["window_id"],
+            "evidence_ref": dictionary.evidence_ref(
+                tuple(str(row[column]) for column in EVIDENCE_ITEM_COLUMNS)
+            ),
             "position": row["position"],
         }
     if table == "analysis_rubrics":
@@ -4,15 +4,8 @@ import argparse
 import json
 
 from .analysis_contract import load_contract_artifacts, validate_contract_against_cache
-from .aggregation_sensitivity import run_aggregation_sensitivity, write_aggregation_sensitivity_outputs
-from .cache import connect_cache, default_cache_path, list_completed_experiment_tags
+from .cache import connect_cache, default_cache_path, list_completed_experiment_tags, list_latest_snapshot_ids
 from .figure_triage import build_repair_plan, load_figure_manifest
-from .export import ConvexAnalysisClient, export_experiments
-from .investigate_v3 import generate_v3_investigation
-from .mine_v3 import mine_v3_findings, write_mining_summary
-from .report_v3 import assemble_v3_report
-from .rubric_embeddings import DEFAULT_RUBRIC_EMBEDDING_MODEL
-from .report_pilot import generate_pilot_report
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -25,7 +18,40 @@ def build_parser() -> argparse.ArgumentParser:
     export_parser.add_argument("--experiment-tag", action="append", default=[])
     export_parser.add_argument("--all-completed", action="store_true")
     export_parser.add_argument("--refresh", action="store_true")
+    export_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue a pending snapshot from its last committed page instead of starting over",
+    )
+    export_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch only rows added since the latest completed snapshot and store them as a child generation",
+    )
     export_parser.add_argument("--page-size", type=int, default=200)
+    export_parser.add_argument(
+        "--target-page-seconds",
+        type=float,
+        help="Size pages adaptively from observed latency and payload bytes, aiming at this many seconds per page",
+    )
+    export_parser.add_argument("--max-retries", type=int, default=4)
+    export_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help="Export experiments and datasets concurrently with at most this many in-flight Convex queries",
+    )
+
+    columnar_parser = subparsers.add_parser(
+        "columnar-sync",
+        help="Materialize completed snapshots into the Parquet columnar store (requires pyarrow)",
+    )
+    columnar_parser.add_argument("--cache-db", default=str(default_cache_path()))
+    columnar_parser.add_argument("--columnar-store")
+    columnar_parser.add_argument("--experiment-tag", action="append", default=[])
+    columnar_parser.add_argument("--snapshot-id", action="append", default=[])
+    columnar_parser.add_argument("--all-completed", action="store_true")
+    columnar_parser.add_argument("--overwrite", action="store_true")
 
     report_parser = subparsers.add_parser("pilot-report", help="Generate pilot analysis artifacts from cached snapshots")
     report_parser.add_argument("--cache-db", default=str(default_cache_path()))
@@ -39,10 +65,19 @@ def build_parser() -> argparse.ArgumentParser:
     investigate_parser.add_argument("--snapshot-id", action="append", default=[])
     investigate_parser.add_argument("--all-completed", action="store_true")
     investigate_parser.add_argument("--output-dir")
-    investigate_parser.add_argument("--rubric-embedding-model", default=DEFAULT_RUBRIC_EMBEDDING_MODEL)
+    investigate_parser.add_argument("--rubric-embedding-model")
     investigate_parser.add_argument("--contract")
     investigate_parser.add_argument("--contrast-registry")
     investigate_parser.add_argument("--figure-manifest")
+    investigate_parser.add_argument("--no-derived-cache", action="store_true")
+    investigate_parser.add_argument("--incremental", action="store_true")
+    investigate_parser.add_argument("--workers", type=int, default=1)
+
+    embedding_server_parser = subparsers.add_parser(
+        "embedding-server",
+        help="Keep rubric embedding models loaded and serve encode requests on a local Unix socket",
+    )
+    embedding_server_parser.add_argument("--model", action="append", default=[])
 
     contract_parser = subparsers.add_parser("v3-contract-check", help="Validate the frozen V3 analysis contract against the cache")
     contract_parser.add_argument("--cache-db", default=str(default_cache_path()))
@@ -79,6 +114,10 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "export":
+        import asyncio
+
+        from .export import ConvexAnalysisClient, RetryPolicy, export_experiments, export_experiments_async
+
         experiment_tags = list(args.experiment_tag)
         if args.all_completed:
             client = ConvexAnalysisClient(args.convex_url)
@@ -92,17 +131,63 @@ def main(argv: list[str] | None = None) -> int:
                 client.close()
         if not experiment_tags:
             raise SystemExit("Provide --experiment-tag or --all-completed")
-        snapshots = export_experiments(
-            experiment_tags=experiment_tags,
-            deployment_url=args.convex_url,
+        if args.max_concurrency > 1:
+            snapshots = asyncio.run(
+                export_experiments_async(
+                    experiment_tags=experiment_tags,
+                    deployment_url=args.convex_url,
+                    cache_db_path=args.cache_db,
+                    refresh=args.refresh,
+                    resume=args.resume,
+                    incremental=args.incremental,
+                    page_size=args.page_size,
+                    target_page_seconds=args.target_page_seconds,
+                    retry_policy=RetryPolicy(max_retries=args.max_retries),
+                    max_concurrency=args.max_concurrency,
+                )
+            )
+        else:
+            snapshots = export_experiments(
+                experiment_tags=experiment_tags,
+                deployment_url=args.convex_url,
+                cache_db_path=args.cache_db,
+                refresh=args.refresh,
+                resume=args.resume,
+                incremental=args.incremental,
+                page_size=args.page_size,
+                target_page_seconds=args.target_page_seconds,
+                retry_policy=RetryPolicy(max_retries=args.max_retries),
+            )
+        print(json.dumps([snapshot.__dict__ for snapshot in snapshots], indent=2, sort_keys=True))
+        return 0
+
+    if args.command == "columnar-sync":
+        from .datasets import materialize_columnar_snapshots
+
+        snapshot_ids = list(args.snapshot_id)
+        experiment_tags = list(args.experiment_tag)
+        connection = connect_cache(args.cache_db)
+        try:
+            if args.all_completed:
+                experiment_tags = list_completed_experiment_tags(connection)
+            if experiment_tags:
+                snapshot_ids.extend(list_latest_snapshot_ids(connection, experiment_tags))
+        finally:
+            connection.close()
+        if not snapshot_ids:
+            raise SystemExit("Provide --snapshot-id, --experiment-tag, or --all-completed")
+        written = materialize_columnar_snapshots(
+            snapshot_ids=snapshot_ids,
             cache_db_path=args.cache_db,
-            refresh=args.refresh,
-            page_size=args.page_size,
+            columnar_store_path=args.columnar_store,
+            overwrite=args.overwrite,
         )
-        print(json.dumps([snapshot.__dict__ for snapshot in snapshots], indent=2, sort_keys=True))
+        print(json.dumps({"snapshot_ids": snapshot_ids, "written": written}, indent=2, sort_keys=True))
         return 0
 
     if args.command == "pilot-report":
+        from .report_pilot import generate_pilot_report
+
         if not args.snapshot_id and not args.experiment_tag:
             raise SystemExit("Provide --snapshot-id or --experiment-tag")
         output_dir = generate_pilot_report(
@@ -115,6 +200,10 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "v3-investigate":
+        from .investigate_v3 import generate_v3_investigation
+        from .rubric_embeddings import DEFAULT_RUBRIC_EMBEDDING_MODEL
+
+        rubric_embedding_model = args.rubric_embedding_model or DEFAULT_RUBRIC_EMBEDDING_MODEL
         if args.contract:
             output_dir = generate_v3_investigation(
                 cache_db_path=args.cache_db,
@@ -122,7 +211,10 @@ def main(argv: list[str] | None = None) -> int:
                 contract_path=args.contract,
                 contrast_registry_path=args.contrast_registry,
                 figures_manifest_path=args.figure_manifest,
-                rubric_embedding_model=args.rubric_embedding_model,
+                rubric_embedding_model=rubric_embedding_model,
+                use_derived_cache=not args.no_derived_cache,
+                incremental=args.incremental,
+                workers=args.workers,
             )
             print(str(output_dir))
             return 0
@@ -140,11 +232,24 @@ def main(argv: list[str] | None = None) -> int:
             experiment_tags=experiment_tags or None,
             cache_db_path=args.cache_db,
             output_dir=args.output_dir,
-            rubric_embedding_model=args.rubric_embedding_model,
+            rubric_embedding_model=rubric_embedding_model,
+            use_derived_cache=not args.no_derived_cache,
+            incremental=args.incremental,
+            workers=args.workers,
         )
         print(str(output_dir))
         return 0
 
+    if args.command == "embedding-server":
+        from .embedding_server import serve_embeddings
+        from .rubric_embeddings import DEFAULT_RUBRIC_EMBEDDING_MODEL
+
+        try:
+            serve_embeddings(model_names=list(args.model) or [DEFAULT_RUBRIC_EMBEDDING_MODEL])
+        except KeyboardInterrupt:
+            pass
+        return 0
+
     if args.command == "v3-contract-check":
         artifacts = load_contract_artifacts(
             contract_path=args.contract,
@@ -179,6 +284,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "v3-report":
+        from .report_v3 import assemble_v3_report
+
         output_path = assemble_v3_report(
             contract_path=args.contract,
             figure_manifest_path=args.figure_manifest,
@@ -189,6 +296,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "v3-mine":
+        from .mine_v3 import mine_v3_findings, write_mining_summary
+
         mining_output = mine_v3_findings(
             contract_path=args.contract,
             tables_dir=args.tables_dir,
@@ -202,6 +311,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "v3-aggregation-sensitivity":
+        from .aggregation_sensitivity import run_aggregation_sensitivity, write_aggregation_sensitivity_outputs
+
         outputs = run_aggregation_sensitivity(
             contract_path=args.contract,
             cache_db_path=args.cache_db,
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .cache import default_cache_path
+
+COLUMNAR_TABLES = (
+    "analysis_responses",
+    "analysis_rubrics",
+    "analysis_evidence",
+    "analysis_samples",
+    "analysis_response_items",
+)
+JSON_COLUMNS = {
+    "analysis_rubrics": ("label_mapping",),
+}
+PARTITION_FILE = "part-0.parquet"
+
+
+def default_columnar_store_path(cache_db_path: str | Path | None = None) -> Path:
+    cache_path = Path(cache_db_path) if cache_db_path is not None else default_cache_path()
+    return cache_path.parent / "columnar"
+
+
+def columnar_store_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def has_columnar_snapshots(store_path: str | Path, snapshot_ids: list[str]) -> bool:
+    if not snapshot_ids or not columnar_store_available():
+        return False
+    root = Path(store_path)
+    return all(_marker_path(root, snapshot_id).exists() for snapshot_id in snapshot_ids)
+
+
+def write_columnar_snapshot(
+    store_path: str | Path,
+    snapshot_id: str,
+    tables: dict[str, pd.DataFrame],
+) -> None:
+    pa, pq = _require_pyarrow()
+    root = Path(store_path)
+    counts: dict[str, int] = {}
+    for table in COLUMNAR_TABLES:
+        frame = tables[table]
+        partition = _partition_path(root, table, snapshot_id)
+        staging = partition.with_name(partition.name + ".tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        pq.write_table(_frame_to_arrow(pa, table, frame), staging / PARTITION_FILE)
+        shutil.rmtree(partition, ignore_errors=True)
+        staging.rename(partition)
+        counts[table] = int(len(frame))
+    marker = _marker_path(root, snapshot_id)
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    marker.write_text(json.dumps({"snapshot_id": snapshot_id, "row_counts": counts}, sort_keys=True) + "\n")
+
+
+def read_columnar_tables(
+    store_path: str | Path,
+    snapshot_ids: list[str],
+) -> dict[str, pd.DataFrame]:
+    return {
+        table: read_columnar_table(store_path, table, snapshot_ids)
+        for table in COLUMNAR_TABLES
+    }
+
+
+def read_columnar_table(
+    store_path: str | Path,
+    table: str,
+    snapshot_ids: list[str],
+    *,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    pa, pq = _require_pyarrow()
+    root = Path(store_path)
+    selected = None if columns is None else [column for column in columns if column != "snapshot_id"]
+    parts = []
+    for snapshot_id in snapshot_ids:
+        path = _partition_path(root, table, snapshot_id) / PARTITION_FILE
+        names = pq.read_schema(path).names
+        part = pq.read_table(
+            path,
+            columns=None if selected is None else [column for column in selected if column in names],
+        )
+        parts.append(
+            part.append_column("snapshot_id", pa.array([snapshot_id] * part.num_rows, type=pa.string()))
+        )
+    return _arrow_to_frame(pa, table, pa.concat_tables(parts, promote_options="default"))
+
+
+def columnar_table_columns(
+    store_path: str | Path,
+    table: str,
+    snapshot_ids: list[str],
+) -> set[str]:
+    _, pq = _require_pyarrow()
+    root = Path(store_path)
+    names = [
+        set(pq.read_schema(_partition_path(root, table, snapshot_id) / PARTITION_FILE).names)
+        for snapshot_id in snapshot_ids
+    ]
+    return set.intersection(*names) | {"snapshot_id"} if names else {"snapshot_id"}
+
+
+def _require_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("The columnar snapshot store requires pyarrow (`uv pip install pyarrow`).") from error
+    return pa, pq
+
+
+def _partition_path(root: Path, table: str, snapshot_id: str) -> Path:
+    return root / table / f"snapshot_id={snapshot_id}"
+
+
+def _marker_path(root: Path, snapshot_id: str) -> Path:
+    return root / "_snapshots" / f"{snapshot_id}.json"
+
+
+def _list_column_types(pa: Any) -> dict[str, dict[str, Any]]:
+    strings = pa.list_(pa.string())
+    integers = pa.list_(pa.int64())
+    return {
+        "analysis_responses": {
+            "randomizations": strings,
+            "decoded_scores": integers,
+            "evidence_ids": strings,
+            "evidence_labels": strings,
+            "evidence_titles": strings,
+            "evidence_urls": strings,
+            "window_ids": strings,
+            "evidence_positions": integers,
+        },
+        "analysis_rubrics": {
+            "stages": pa.list_(
+                pa.struct([
+                    ("stage_number", pa.int64()),
+                    ("label", pa.string()),
+                    ("criteria", strings),
+                ])
+            ),
+        },
+    }
+
+
+def _frame_to_arrow(pa: Any, table: str, frame: pd.DataFrame) -> Any:
+    list_types = _list_column_types(pa).get(table, {})
+    json_columns = JSON_COLUMNS.get(table, ())
+    arrays = []
+    names = []
+    for column in frame.columns:
+        if column == "snapshot_id":
+            continue
+        values = frame[column]
+        if column in list_types:
+            array = pa.array(values.tolist(), type=list_types[column])
+        elif column in json_columns:
+            array = pa.array([json.dumps(value) for value in values], type=pa.string())
+        else:
+            array = pa.Array.from_pandas(values)
+        arrays.append(array)
+        names.append(column)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _arrow_to_frame(pa: Any, table: str, arrow_table: Any) -> pd.DataFrame:
+    json_columns = JSON_COLUMNS.get(table, ())
+    columns: dict[str, Any] = {}
+    for name in arrow_table.column_names:
+        column = arrow_table.column(name)
+        if pa.types.is_list(column.type):
+            columns[name] = column.to_pandas(types_mapper=pd.ArrowDtype)
+        elif name in json_columns:
+            columns[name] = [json.loads(value) for value in column.to_pylist()]
+        else:
+            columns[name] = column.to_pandas()
+    order = ["snapshot_id"] + [name for name in arrow_table.column_names if name != "snapshot_id"]
+    return pd.DataFrame(columns, columns=order)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import gc
 import json
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd
 
 from .analysis_contract import (
@@ -14,19 +20,140 @@ from .analysis_contract import (
     load_contract_artifacts,
     validate_contract_against_cache,
 )
-from .cache import connect_cache, list_latest_snapshot_ids, snapshot_manifest
+from .cache import (
+    CODED_RESPONSE_COLUMNS,
+    EVIDENCE_ITEM_COLUMNS,
+    EVIDENCE_REF_FIELDS,
+    INHERITED_TABLES,
+    SNAPSHOT_TABLES,
+    connect_cache,
+    connect_cache_readonly,
+    default_cache_path,
+    encode_verdict,
+    inherited_row_filters,
+    list_latest_snapshot_ids,
+    load_evidence_refs,
+    load_string_dictionary,
+    snapshot_lineage,
+    snapshot_manifests,
+)
+from .columnar_store import (
+    columnar_table_columns,
+    default_columnar_store_path,
+    has_columnar_snapshots,
+    read_columnar_table,
+    write_columnar_snapshot,
+)
 from .contracts import resolve_repo_path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+BUNDLE_TABLES = {
+    "responses": "analysis_responses",
+    "rubrics": "analysis_rubrics",
+    "evidence": "analysis_evidence",
+    "samples": "analysis_samples",
+    "response_items": "analysis_response_items",
+}
+_EVIDENCE_LIST_COLUMNS = {
+    "evidence_ids": "evidence_id",
+    "evidence_labels": "label",
+    "evidence_titles": "title",
+    "evidence_urls": "url",
+    "window_ids": "window_id",
+}
+_VERDICT_COLUMNS = ("verdict_mask", "verdict_subset_size")
+_COLUMN_SOURCES = {
+    "analysis_responses": {
+        **{column: (f"{column}_code",) for column in CODED_RESPONSE_COLUMNS},
+        **{column: ("evidence_refs_json",) for column in _EVIDENCE_LIST_COLUMNS},
+        "bundle_label": ("evidence_refs_json",),
+        "bundle_size": ("evidence_refs_json",),
+        "randomizations": ("randomizations_json",),
+        "decoded_scores": ("decoded_scores_json",),
+        "evidence_positions": ("evidence_positions_json",),
+    },
+    "analysis_rubrics": {
+        "stages": ("stages_json",),
+        "label_mapping": ("label_mapping_json",),
+    },
+    "analysis_response_items": {column: ("evidence_ref",) for column in EVIDENCE_ITEM_COLUMNS},
+}
+
+TableLoader = Callable[[str, "list[str] | None"], pd.DataFrame]
+
 
-@dataclass
 class SnapshotBundle:
-    snapshot_ids: list[str]
-    manifests: dict[str, dict[str, Any]]
-    responses: pd.DataFrame
-    rubrics: pd.DataFrame
-    evidence: pd.DataFrame
-    samples: pd.DataFrame
-    response_items: pd.DataFrame
+    def __init__(
+        self,
+        *,
+        snapshot_ids: list[str],
+        manifests: dict[str, dict[str, Any]],
+        responses: pd.DataFrame | None = None,
+        rubrics: pd.DataFrame | None = None,
+        evidence: pd.DataFrame | None = None,
+        samples: pd.DataFrame | None = None,
+        response_items: pd.DataFrame | None = None,
+        load_timings: dict[str, float] | None = None,
+        loader: TableLoader | None = None,
+        columns: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.snapshot_ids = snapshot_ids
+        self.manifests = manifests
+        self.load_timings = dict(load_timings or {})
+        self.columns = dict(columns or {})
+        self._loader = loader
+        self._frames = {
+            name: frame
+            for name, frame in {
+                "responses": responses,
+                "rubrics": rubrics,
+                "evidence": evidence,
+                "samples": samples,
+                "response_items": response_items,
+            }.items()
+            if frame is not None
+        }
+
+    @property
+    def responses(self) -> pd.DataFrame:
+        return self._frame("responses")
+
+    @property
+    def rubrics(self) -> pd.DataFrame:
+        return self._frame("rubrics")
+
+    @property
+    def evidence(self) -> pd.DataFrame:
+        return self._frame("evidence")
+
+    @property
+    def samples(self) -> pd.DataFrame:
+        return self._frame("samples")
+
+    @property
+    def response_items(self) -> pd.DataFrame:
+        return self._frame("response_items")
+
+    @property
+    def loaded_tables(self) -> list[str]:
+        return [name for name in BUNDLE_TABLES if name in self._frames]
+
+    def _frame(self, name: str) -> pd.DataFrame:
+        frame = self._frames.get(name)
+        if frame is None:
+            if self._loader is None:
+                frame = pd.DataFrame()
+            else:
+                table = BUNDLE_TABLES[name]
+                frame, seconds = _timed(lambda: self._loader(table, self.columns.get(name)))
+                self.load_timings[table] = seconds
+            self._frames[name] = frame
+        return frame
 
     @property
     def experiment_tags(self) -> list[str]:
@@ -61,6 +188,9 @@ def load_snapshot_bundle(
     snapshot_ids: list[str] | None = None,
     experiment_tags: list[str] | None = None,
     cache_db_path: str | None = None,
+    columnar_store_path: str | None = None,
+    columns: dict[str, list[str]] | None = None,
+    lazy: bool = False,
 ) -> SnapshotBundle:
     connection = connect_cache(cache_db_path)
     try:
@@ -69,39 +199,60 @@ def load_snapshot_bundle(
             if not experiment_tags:
                 raise ValueError("Provide snapshot_ids or experiment_tags")
             resolved_snapshot_ids = list_latest_snapshot_ids(connection, experiment_tags)
-
-        manifests = {
-            snapshot_id: snapshot_manifest(connection, snapshot_id)
-            for snapshot_id in resolved_snapshot_ids
-        }
-        responses = _decode_response_frame(
-            _load_table(connection, "analysis_responses", resolved_snapshot_ids),
-        )
-        rubrics = _load_table(connection, "analysis_rubrics", resolved_snapshot_ids)
-        evidence = _load_table(connection, "analysis_evidence", resolved_snapshot_ids)
-        samples = _load_table(connection, "analysis_samples", resolved_snapshot_ids)
-        response_items = _load_table(connection, "analysis_response_items", resolved_snapshot_ids)
-        if response_items.empty and not responses.empty:
-            response_items = _explode_response_items_frame(responses)
-        return SnapshotBundle(
+        return _load_bundle(
+            connection,
             snapshot_ids=resolved_snapshot_ids,
-            manifests=manifests,
-            responses=responses,
-            rubrics=_decode_rubric_frame(rubrics),
-            evidence=evidence,
-            samples=samples,
-            response_items=_decode_response_items_frame(response_items),
+            cache_db_path=cache_db_path,
+            columnar_store_path=columnar_store_path,
+            columns=columns,
+            lazy=lazy,
         )
     finally:
         connection.close()
 
 
+def materialize_columnar_snapshots(
+    *,
+    snapshot_ids: list[str],
+    cache_db_path: str | None = None,
+    columnar_store_path: str | None = None,
+    overwrite: bool = False,
+) -> list[str]:
+    store_path = columnar_store_path or default_columnar_store_path(cache_db_path)
+    written: list[str] = []
+    connection = connect_cache(cache_db_path)
+    try:
+        for snapshot_id in snapshot_ids:
+            if not overwrite and has_columnar_snapshots(store_path, [snapshot_id]):
+                continue
+            status = connection.execute(
+                "SELECT status FROM export_snapshots WHERE snapshot_id = ?",
+                (snapshot_id,),
+            ).fetchone()
+            if status is None or status["status"] != "completed":
+                raise ValueError(f"Only completed snapshots can be materialized: snapshot_id={snapshot_id}")
+            tables, _ = _load_tables_concurrently(
+                {
+                    table: lambda table=table: _read_sqlite_table(cache_db_path, table, [snapshot_id], None)
+                    for table in SNAPSHOT_TABLES
+                }
+            )
+            write_columnar_snapshot(store_path, snapshot_id, tables)
+            written.append(snapshot_id)
+    finally:
+        connection.close()
+    return written
+
+
 def load_snapshot_bundle_for_contract(
     *,
     contract_path: str | None = None,
     contrast_registry_path: str | None = None,
     figures_manifest_path: str | None = None,
     cache_db_path: str | None = None,
+    columnar_store_path: str | None = None,
+    columns: dict[str, list[str]] | None = None,
+    lazy: bool = False,
     validate_cache: bool = True,
 ) -> ContractSnapshotBundle:
     artifacts = load_contract_artifacts(
@@ -115,13 +266,16 @@ def load_snapshot_bundle_for_contract(
     try:
         if validate_cache:
             validate_contract_against_cache(connection, contract, artifacts.contrast_registry)
+        bundle = _load_bundle(
+            connection,
+            snapshot_ids=contract.snapshot_ids,
+            cache_db_path=resolved_cache,
+            columnar_store_path=columnar_store_path,
+            columns=columns,
+            lazy=lazy,
+        )
     finally:
         connection.close()
-
-    bundle = load_snapshot_bundle(
-        snapshot_ids=contract.snapshot_ids,
-        cache_db_path=resolved_cache,
-    )
     _validate_bundle_against_contract(bundle, contract)
     return ContractSnapshotBundle(
         contract=contract,
@@ -130,64 +284,341 @@ def load_snapshot_bundle_for_contract(
     )
 
 
+def list_cells(values: pd.Series) -> pd.Series:
+    if not isinstance(values.dtype, pd.ArrowDtype):
+        return values
+    import pyarrow as pa
+
+    return pd.Series(pa.array(values).to_pylist(), index=values.index, name=values.name, dtype=object)
+
+
+def list_lengths(values: pd.Series, *, default: int = 0) -> pd.Series:
+    if isinstance(values.dtype, pd.ArrowDtype):
+        lengths = values.list.len().to_numpy(dtype="int64", na_value=default)
+    else:
+        lengths = [len(value) if isinstance(value, (list, tuple)) else default for value in values]
+    return pd.Series(lengths, index=values.index, name=values.name, dtype="int64")
+
+
+def _load_bundle(
+    connection: sqlite3.Connection,
+    *,
+    snapshot_ids: list[str],
+    cache_db_path: str | None,
+    columnar_store_path: str | None,
+    columns: dict[str, list[str]] | None,
+    lazy: bool,
+) -> SnapshotBundle:
+    unknown = sorted(set(columns or {}) - set(BUNDLE_TABLES))
+    if unknown:
+        raise ValueError(f"Unknown bundle tables in projection: {unknown}")
+    manifests, manifest_seconds = _timed(lambda: snapshot_manifests(connection, snapshot_ids))
+    store_path = columnar_store_path or default_columnar_store_path(cache_db_path)
+    if has_columnar_snapshots(store_path, snapshot_ids):
+        def loader(table: str, table_columns: list[str] | None) -> pd.DataFrame:
+            read_columns = table_columns
+            if table == "analysis_responses" and table_columns is not None:
+                stored = columnar_table_columns(store_path, table, snapshot_ids)
+                if any(column in table_columns and column not in stored for column in _VERDICT_COLUMNS):
+                    read_columns = [*table_columns, "decoded_scores"]
+            frame = read_columnar_table(store_path, table, snapshot_ids, columns=read_columns)
+            if table == "analysis_responses":
+                frame = _with_verdict_columns(frame)
+            return _project_frame(frame, table, table_columns)
+    else:
+        def loader(table: str, table_columns: list[str] | None) -> pd.DataFrame:
+            return _read_sqlite_table(cache_db_path, table, snapshot_ids, table_columns)
+
+    bundle = SnapshotBundle(
+        snapshot_ids=snapshot_ids,
+        manifests=manifests,
+        load_timings={"manifests": manifest_seconds},
+        loader=loader,
+        columns=columns,
+    )
+    if not lazy:
+        frames, timings = _load_tables_concurrently(
+            {
+                name: lambda table=table, name=name: loader(table, bundle.columns.get(name))
+                for name, table in BUNDLE_TABLES.items()
+            }
+        )
+        bundle._frames.update(frames)
+        bundle.load_timings.update({BUNDLE_TABLES[name]: seconds for name, seconds in timings.items()})
+    return bundle
+
+
+def _read_sqlite_table(
+    cache_db_path: str | Path | None,
+    table: str,
+    snapshot_ids: list[str],
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    db_path = Path(cache_db_path) if cache_db_path is not None else default_cache_path()
+    frame = _read_decoded_table(db_path, table, snapshot_ids, columns)
+    if table == "analysis_response_items" and frame.empty:
+        responses = _read_decoded_table(db_path, "analysis_responses", snapshot_ids, None)
+        if not responses.empty:
+            frame = _project_frame(_explode_response_items_frame(responses), table, columns)
+    return frame
+
+
+def _load_tables_concurrently(
+    loaders: dict[str, Callable[[], pd.DataFrame]],
+) -> tuple[dict[str, pd.DataFrame], dict[str, float]]:
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {table: executor.submit(_timed, loader) for table, loader in loaders.items()}
+        results = {table: future.result() for table, future in futures.items()}
+    return (
+        {table: frame for table, (frame, _) in results.items()},
+        {table: seconds for table, (_, seconds) in results.items()},
+    )
+
+
+def _timed(loader: Callable[[], pd.DataFrame]) -> tuple[pd.DataFrame, float]:
+    started = time.perf_counter()
+    frame = loader()
+    return frame, time.perf_counter() - started
+
+
+def _read_decoded_table(
+    db_path: Path,
+    table: str,
+    snapshot_ids: list[str],
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    connection = connect_cache_readonly(db_path)
+    try:
+        frame = _load_table(
+            connection,
+            table,
+            snapshot_ids,
+            columns=_source_columns(connection, table, columns),
+        )
+        if table == "analysis_responses":
+            frame = _decode_response_frame(
+                frame,
+                strings=load_string_dictionary(connection),
+                evidence_refs=load_evidence_refs(connection),
+                columns=columns,
+            )
+        elif table == "analysis_rubrics":
+            frame = _decode_rubric_frame(frame)
+        elif table == "analysis_response_items":
+            frame = _decode_response_items_frame(
+                frame,
+                evidence_refs=load_evidence_refs(connection),
+                columns=columns,
+            )
+        return _project_frame(frame, table, columns)
+    finally:
+        connection.close()
+
+
+def _source_columns(
+    connection: sqlite3.Connection,
+    table: str,
+    columns: list[str] | None,
+) -> list[str] | None:
+    if columns is None:
+        return None
+    stored = [str(row["name"]) for row in connection.execute(f"PRAGMA table_info({table})").fetchall()]
+    sources = {"snapshot_id"}
+    for column in columns:
+        sources.update(_COLUMN_SOURCES.get(table, {}).get(column, (column,)))
+    unknown = sorted(source for source in sources if source not in stored)
+    if unknown:
+        raise ValueError(f"Unknown columns for {table}: {unknown}")
+    return [column for column in stored if column in sources]
+
+
+def _project_frame(
+    frame: pd.DataFrame,
+    table: str,
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    if columns is None:
+        return frame
+    wanted = ["snapshot_id", *[column for column in columns if column != "snapshot_id"]]
+    if frame.empty:
+        return frame.reindex(columns=wanted)
+    missing = [column for column in wanted if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Unknown columns for {table}: {missing}")
+    return frame[wanted]
+
+
 def _load_table(
     connection: sqlite3.Connection,
     table: str,
     snapshot_ids: list[str],
+    *,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
+    column_sql = "*" if columns is None else ", ".join(columns)
+    if table in INHERITED_TABLES:
+        lineages = {
+            snapshot_id: snapshot_lineage(connection, snapshot_id)
+            for snapshot_id in snapshot_ids
+        }
+        if any(len(lineage) > 1 for lineage in lineages.values()):
+            return _load_inherited_table(connection, table, lineages, column_sql=column_sql)
     placeholders = ", ".join(["?"] * len(snapshot_ids))
-    query = f"SELECT * FROM {table} WHERE snapshot_id IN ({placeholders})"
+    query = f"SELECT {column_sql} FROM {table} WHERE snapshot_id IN ({placeholders})"
     return pd.read_sql_query(query, connection, params=snapshot_ids)
 
 
-def _decode_response_frame(frame: pd.DataFrame) -> pd.DataFrame:
+def _load_inherited_table(
+    connection: sqlite3.Connection,
+    table: str,
+    lineages: dict[str, list[str]],
+    *,
+    column_sql: str = "*",
+) -> pd.DataFrame:
+    frames: list[pd.DataFrame] = []
+    for snapshot_id, lineage in lineages.items():
+        for where_sql, params in inherited_row_filters(table, lineage):
+            query = f"SELECT {column_sql} FROM {table} WHERE {where_sql} ORDER BY rowid"
+            frame = pd.read_sql_query(query, connection, params=params)
+            frame["snapshot_id"] = snapshot_id
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _decode_response_frame(
+    frame: pd.DataFrame,
+    *,
+    strings: dict[int, str],
+    evidence_refs: dict[int, tuple[str, ...]],
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     if frame.empty:
         return frame
-    for column in [
-        "randomizations_json",
-        "decoded_scores_json",
-        "evidence_ids_json",
-        "evidence_labels_json",
-        "evidence_titles_json",
-        "evidence_urls_json",
-        "window_ids_json",
-        "evidence_positions_json",
-    ]:
-        frame[column] = frame[column].apply(json.loads)
-
-    frame["randomizations"] = frame.pop("randomizations_json")
-    frame["decoded_scores"] = frame.pop("decoded_scores_json")
-    frame["evidence_ids"] = frame.pop("evidence_ids_json")
-    frame["evidence_labels"] = frame.pop("evidence_labels_json")
-    frame["evidence_titles"] = frame.pop("evidence_titles_json")
-    frame["evidence_urls"] = frame.pop("evidence_urls_json")
-    frame["window_ids"] = frame.pop("window_ids_json")
-    frame["evidence_positions"] = frame.pop("evidence_positions_json")
-    frame["abstain_enabled"] = frame["abstain_enabled"].astype(bool)
-    frame["abstained"] = frame["abstained"].astype(bool)
-    frame["bundle_label"] = frame["evidence_labels"].apply(lambda vals: " | ".join(vals))
-    frame["bundle_size"] = frame["evidence_ids"].apply(len)
-    if "bundle_signature" not in frame.columns:
-        frame["bundle_signature"] = frame["evidence_ids"].apply(
-            lambda vals: "|".join(sorted(str(value) for value in vals)),
-        )
-    if "cluster_id" not in frame.columns:
+    string_lookup = np.empty(max(strings, default=0) + 1, dtype=object)
+    for code, value in strings.items():
+        string_lookup[code] = value
+    for column in CODED_RESPONSE_COLUMNS:
+        code_column = f"{column}_code"
+        if code_column in frame.columns:
+            frame.insert(
+                frame.columns.get_loc(code_column),
+                column,
+                _decode_string_codes(frame.pop(code_column), string_lookup),
+            )
+
+    wanted = set(columns) if columns is not None else None
+    evidence_fields = [
+        field
+        for column, field in _EVIDENCE_LIST_COLUMNS.items()
+        if wanted is None or column in wanted or (column == "evidence_labels" and "bundle_label" in wanted)
+    ]
+    decoded: dict[str, list[Any]] = {}
+    ref_lists: list[list[int]] | None = None
+    with _paused_gc():
+        if "evidence_refs_json" in frame.columns:
+            ref_lists = _decode_json_column(frame.pop("evidence_refs_json"))
+            for field in evidence_fields:
+                index = EVIDENCE_REF_FIELDS.index(field)
+                decoded[field] = [[evidence_refs[ref][index] for ref in refs] for refs in ref_lists]
+        for column in ["randomizations", "decoded_scores", "evidence_positions"]:
+            if f"{column}_json" in frame.columns:
+                decoded[column] = _decode_json_column(frame.pop(f"{column}_json"))
+
+    for column in ["randomizations", "decoded_scores"]:
+        if column in decoded:
+            frame[column] = decoded[column]
+    for column, field in _EVIDENCE_LIST_COLUMNS.items():
+        if field in decoded:
+            frame[column] = decoded[field]
+    if "evidence_positions" in decoded:
+        frame["evidence_positions"] = decoded["evidence_positions"]
+    for column in ["abstain_enabled", "abstained"]:
+        if column in frame.columns:
+            frame[column] = frame[column].astype(bool)
+    for column in _VERDICT_COLUMNS:
+        if column in frame.columns:
+            frame[column] = frame[column].astype("Int64")
+    if ref_lists is not None:
+        if "label" in decoded:
+            frame["bundle_label"] = [" | ".join(labels) for labels in decoded["label"]]
+        frame["bundle_size"] = np.fromiter(map(len, ref_lists), dtype=np.int64, count=len(ref_lists))
+        if "bundle_signature" not in frame.columns and "evidence_id" in decoded:
+            frame["bundle_signature"] = [
+                "|".join(sorted(str(value) for value in values))
+                for values in decoded["evidence_id"]
+            ]
+    if columns is None and "cluster_id" not in frame.columns:
         frame["cluster_id"] = None
     return frame
 
 
+def _with_verdict_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    if "decoded_scores" not in frame.columns or all(column in frame.columns for column in _VERDICT_COLUMNS):
+        return frame
+    encoded = [encode_verdict(scores) for scores in list_cells(frame["decoded_scores"])]
+    for index, column in enumerate(_VERDICT_COLUMNS):
+        frame[column] = pd.array([values[index] for values in encoded], dtype="Int64")
+    return frame
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _decode_json_column(values: pd.Series) -> list[Any]:
+    return _json_loads("[" + ",".join(values.tolist()) + "]")
+
+
+def _decode_string_codes(codes: pd.Series, lookup: np.ndarray) -> np.ndarray:
+    values = codes.to_numpy()
+    present = ~pd.isna(values)
+    decoded = np.full(len(values), None, dtype=object)
+    decoded[present] = lookup[values[present].astype(np.int64)]
+    return decoded
+
+
 def _decode_rubric_frame(frame: pd.DataFrame) -> pd.DataFrame:
     if frame.empty:
         return frame
-    frame["stages"] = frame.pop("stages_json").apply(json.loads)
-    frame["label_mapping"] = frame.pop("label_mapping_json").apply(json.loads)
+    with _paused_gc():
+        decoded = {
+            column: _decode_json_column(frame.pop(f"{column}_json"))
+            for column in ["stages", "label_mapping"]
+            if f"{column}_json" in frame.columns
+        }
+    for column, values in decoded.items():
+        frame[column] = values
     return frame
 
 
-def _decode_response_items_frame(frame: pd.DataFrame) -> pd.DataFrame:
+def _decode_response_items_frame(
+    frame: pd.DataFrame,
+    *,
+    evidence_refs: dict[int, tuple[str, ...]],
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     if frame.empty:
         return frame
-    frame["abstained"] = frame["abstained"].astype(bool)
+    if "evidence_ref" in frame.columns:
+        location = frame.columns.get_loc("evidence_ref")
+        refs = frame.pop("evidence_ref")
+        lookup = np.empty((max(evidence_refs, default=0) + 1, len(EVIDENCE_ITEM_COLUMNS)), dtype=object)
+        for ref, fields in evidence_refs.items():
+            lookup[ref] = fields
+        for index, column in enumerate(EVIDENCE_ITEM_COLUMNS):
+            if columns is not None and column not in columns:
+                continue
+            frame.insert(location, column, _decode_string_codes(refs, lookup[:, index]))
+            location += 1
+    if "abstained" in frame.columns:
+        frame["abstained"] = frame["abstained"].astype(bool)
     return frame
 
 
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+
+
+def stage_mask(stages: Iterable[int]) -> int:
+    mask = 0
+    for stage in stages:
+        mask |= 1 << (int(stage) - 1)
+    return mask
+
+
+def theta_mask(scale_size: int) -> int:
+    return (1 << scale_size) - 1
+
+
+def mass_vector(focal_masses: Mapping[int, float], scale_size: int) -> np.ndarray:
+    mass = np.zeros(1 << scale_size, dtype=float)
+    for mask, value in focal_masses.items():
+        if value < 0.0:
+            raise ValueError(f"mass value is negative: {value:f}")
+        mass[mask] += value
+    return mass
+
+
+def simple_support_masses(
+    focal_masks: Sequence[int] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+    scale_size: int,
+) -> np.ndarray:
+    masks, focal_weights = _simple_support_arrays(focal_masks, weights)
+    rows = np.arange(len(masks))
+    masses = np.zeros((len(masks), 1 << scale_size), dtype=float)
+    masses[rows, masks] = focal_weights
+    masses[rows, theta_mask(scale_size)] += 1.0 - focal_weights
+    return masses
+
+
+def simple_support_commonality(
+    focal_masks: Sequence[int] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+    scale_size: int,
+) -> np.ndarray:
+    masks, focal_weights = _simple_support_arrays(focal_masks, weights)
+    outside = (np.arange(1 << scale_size)[None, :] & ~masks[:, None]) != 0
+    return np.where(outside, 1.0 - focal_weights[:, None], 1.0)
+
+
+def combine_simple_support(
+    focal_masks: Sequence[int] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+    scale_size: int,
+) -> np.ndarray:
+    return mass_from_commonality(np.prod(simple_support_commonality(focal_masks, weights, scale_size), axis=0))
+
+
+def combine_simple_support_groups(
+    focal_masks: Sequence[int] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+    group_offsets: Sequence[int] | np.ndarray,
+    scale_size: int,
+) -> np.ndarray:
+    masks, focal_weights = _simple_support_arrays(focal_masks, weights)
+    offsets = np.asarray(group_offsets, dtype=np.intp)
+    group_count = len(offsets) - 1
+    width = 1 << scale_size
+    # Cells are laid out focal-set-major so the subset transforms run in place on contiguous rows.
+    cells = (masks & theta_mask(scale_size)) * group_count + np.repeat(np.arange(group_count), np.diff(offsets))
+    # A simple support on F keeps commonality 1 on subsets of F and 1 - w elsewhere, so a
+    # group's product is exp of its total log(1 - w) (the superset sum at the empty set) minus
+    # the superset sum of log(1 - w) by focal set. Supports with w = 1 have log -inf and are
+    # counted separately instead.
+    certain = focal_weights >= 1.0
+    log_within = np.bincount(
+        cells,
+        weights=np.log1p(-np.where(certain, 0.0, focal_weights)),
+        minlength=width * group_count,
+    ).reshape(width, group_count)
+    _subset_transform_frame_first(log_within, sign=1.0)
+    commonalities = np.exp(log_within[0] - log_within)
+    if certain.any():
+        certain_within = np.bincount(cells, weights=certain, minlength=width * group_count).reshape(width, group_count)
+        _subset_transform_frame_first(certain_within, sign=1.0)
+        commonalities[certain_within[0] > certain_within] = 0.0
+    _subset_transform_frame_first(commonalities, sign=-1.0)
+    return commonalities.T
+
+
+def commonality(masses: np.ndarray) -> np.ndarray:
+    return _subset_transform(masses, sign=1.0)
+
+
+def mass_from_commonality(commonalities: np.ndarray) -> np.ndarray:
+    return _subset_transform(commonalities, sign=-1.0)
+
+
+def combine_conjunctive(masses: np.ndarray, *, normalization: bool = True) -> np.ndarray:
+    combined = mass_from_commonality(np.prod(commonality(masses), axis=-2))
+    return normalize(combined) if normalization else combined
+
+
+def normalize(masses: np.ndarray) -> np.ndarray:
+    values = np.array(masses, dtype=float)
+    values[..., 0] = 0.0
+    totals = values.sum(axis=-1, keepdims=True)
+    return np.divide(values, totals, out=np.zeros_like(values), where=totals > 0.0)
+
+
+def pignistic(masses: np.ndarray) -> np.ndarray:
+    values = np.asarray(masses, dtype=float)
+    probabilities = values @ _pignistic_matrix(_frame_size(values.shape[-1]))
+    totals = probabilities.sum(axis=-1, keepdims=True)
+    return np.divide(probabilities, totals, out=np.zeros_like(probabilities), where=totals > 0.0)
+
+
+@lru_cache(maxsize=None)
+def _pignistic_matrix(scale_size: int) -> np.ndarray:
+    masks = np.arange(1 << scale_size)
+    members = (masks[:, None] >> np.arange(scale_size)) & 1
+    sizes = members.sum(axis=1, keepdims=True)
+    matrix = np.divide(members, sizes, out=np.zeros(members.shape, dtype=float), where=sizes > 0)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _simple_support_arrays(
+    focal_masks: Sequence[int] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    masks = np.asarray(focal_masks, dtype=np.intp)
+    focal_weights = np.asarray(weights, dtype=float)
+    if np.any(focal_weights < 0.0) or np.any(focal_weights > 1.0):
+        raise ValueError("simple support weights must lie in [0, 1]")
+    return masks, focal_weights
+
+
+def _subset_transform(values: np.ndarray, *, sign: float) -> np.ndarray:
+    frame_first = np.array(np.moveaxis(np.asarray(values, dtype=float), -1, 0), order="C")
+    _subset_transform_frame_first(frame_first, sign=sign)
+    return np.moveaxis(frame_first, 0, -1)
+
+
+def _subset_transform_frame_first(frame_first: np.ndarray, *, sign: float) -> None:
+    scale_size = _frame_size(frame_first.shape[0])
+    for bit in range(scale_size):
+        view = frame_first.reshape((1 << (scale_size - bit - 1), 2, 1 << bit) + frame_first.shape[1:])
+        if sign > 0:
+            view[:, 0] += view[:, 1]
+        else:
+            view[:, 0] -= view[:, 1]
+
+
+def _frame_size(width: int) -> int:
+    scale_size = int(width).bit_length() - 1
+    if width < 1 or 1 << scale_size != width:
+        raise ValueError(f"mass arrays must have length 2**scale_size, got {width}")
+    return scale_size
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from .cache import default_cache_path
+
+T = TypeVar("T")
+
+
+def default_derived_cache_path(cache_db_path: str | Path | None = None) -> Path:
+    cache_path = Path(cache_db_path) if cache_db_path is not None else default_cache_path()
+    return cache_path.parent / "derived_tables.sqlite"
+
+
+def derived_table_key(
+    *,
+    snapshot_ids: list[str],
+    builder: str,
+    version: int,
+    params: dict[str, Any] | None = None,
+) -> str:
+    payload = json.dumps(
+        {
+            "snapshot_ids": list(snapshot_ids),
+            "builder": builder,
+            "version": int(version),
+            "params": params or {},
+        },
+        sort_keys=True,
+        default=_json_default,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DerivedTableCache:
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_derived_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL;")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS derived_tables (
+              cache_key TEXT PRIMARY KEY,
+              builder TEXT NOT NULL,
+              builder_version INTEGER NOT NULL,
+              snapshot_ids_json TEXT NOT NULL,
+              params_json TEXT NOT NULL,
+              created_at_ms INTEGER NOT NULL,
+              payload BLOB NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+        self.hits: list[str] = []
+        self.misses: list[str] = []
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        row = self._connection.execute(
+            "SELECT payload FROM derived_tables WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        *,
+        snapshot_ids: list[str],
+        builder: str,
+        version: int,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO derived_tables (
+                  cache_key, builder, builder_version, snapshot_ids_json, params_json, created_at_ms, payload
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    builder,
+                    int(version),
+                    json.dumps(list(snapshot_ids)),
+                    json.dumps(params or {}, sort_keys=True, default=_json_default),
+                    int(time.time() * 1000),
+                    pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+
+    def get_or_build(
+        self,
+        *,
+        snapshot_ids: list[str],
+        builder: str,
+        version: int,
+        build: Callable[[], T],
+        params: dict[str, Any] | None = None,
+    ) -> tuple[T, str]:
+        key = derived_table_key(
+            snapshot_ids=snapshot_ids,
+            builder=builder,
+            version=version,
+            params=params,
+        )
+        found, value = self.get(key)
+        if found:
+            self.hits.append(builder)
+            return value, key
+        value = build()
+        self.put(
+            key,
+            value,
+            snapshot_ids=snapshot_ids,
+            builder=builder,
+            version=version,
+            params=params,
+        )
+        self.misses.append(builder)
+        return value, key
+
+
+def _json_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot hash derived-table parameter of type {type(value).__name__}")
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import struct
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+_FRAME_HEADER = struct.Struct("!Q")
+_VECTOR_DTYPE = np.dtype("<f4")
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 120.0
+
+
+def default_embedding_socket_path() -> Path:
+    return Path(__file__).resolve().parents[2] / "_cache" / "embedding_server.sock"
+
+
+def request_embeddings(
+    texts: list[str],
+    *,
+    model_name: str,
+    socket_path: str | Path | None = None,
+    timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+) -> np.ndarray | None:
+    path = Path(socket_path) if socket_path is not None else default_embedding_socket_path()
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(timeout)
+            connection.connect(str(path))
+            _send_frame(connection, json.dumps({"model_name": model_name, "texts": texts}).encode("utf-8"))
+            header = json.loads(_recv_frame(connection))
+            if "error" in header:
+                return None
+            payload = _recv_frame(connection)
+    except (OSError, ValueError):
+        return None
+    return np.frombuffer(payload, dtype=_VECTOR_DTYPE).reshape(header["shape"])
+
+
+class EmbeddingServer(socketserver.UnixStreamServer):
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        *,
+        encoder: Callable[[list[str], str], np.ndarray],
+    ) -> None:
+        self.socket_path = Path(socket_path) if socket_path is not None else default_embedding_socket_path()
+        self.encoder = encoder
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _EmbeddingRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve_embeddings(
+    socket_path: str | Path | None = None,
+    *,
+    model_names: list[str],
+) -> None:
+    from .rubric_embeddings import encode_texts_locally
+
+    def encode(texts: list[str], model_name: str) -> np.ndarray:
+        return encode_texts_locally(texts, model_name=model_name)
+
+    for model_name in model_names:
+        encode(["warmup"], model_name)
+    server = EmbeddingServer(socket_path, encoder=encode)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class _EmbeddingRequestHandler(socketserver.BaseRequestHandler):
+    server: EmbeddingServer
+
+    def handle(self) -> None:
+        request = json.loads(_recv_frame(self.request))
+        try:
+            vectors = np.asarray(
+                self.server.encoder([str(text) for text in request["texts"]], str(request["model_name"])),
+                dtype=_VECTOR_DTYPE,
+            )
+        except Exception as error:
+            _send_frame(self.request, json.dumps({"error": f"{type(error).__name__}: {error}"}).encode("utf-8"))
+            return
+        _send_frame(self.request, json.dumps({"shape": list(vectors.shape)}).encode("utf-8"))
+        _send_frame(self.request, vectors.tobytes())
+
+
+def _remove_stale_socket(path: Path) -> None:
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+            return
+    raise ValueError(f"An embedding server is already listening on {path}")
+
+
+def _send_frame(connection: socket.socket, payload: bytes) -> None:
+    connection.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_frame(connection: socket.socket) -> bytearray:
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(connection, _FRAME_HEADER.size))
+    return _recv_exact(connection, size)
+
+
+def _recv_exact(connection: socket.socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:], size - received)
+        if count == 0:
+            raise ConnectionError(f"Embedding connection closed after {received} of {size} bytes")
+        received += count
+    return buffer
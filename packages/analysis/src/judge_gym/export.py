@@ -1,46 +1,416 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import codecs
+import datetime
+import email.utils
+import importlib.util
+import json
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
 
 import httpx
 
 from .cache import (
+    INHERITED_TABLES,
+    PENDING_SNAPSHOT_TTL_MS,
+    ExportCheckpoint,
     connect_cache,
     create_snapshot,
     existing_snapshot_id,
+    garbage_collect_pending_snapshots,
+    insert_snapshot_rows,
+    load_export_checkpoints,
     mark_snapshot_completed,
-    write_snapshot_dataset,
+    pending_snapshot_id,
+    record_export_checkpoint,
+    settled_row_prefix,
+    snapshot_lineage,
+    snapshot_manifest,
 )
 
 
+DATASET_FUNCTIONS: dict[str, str] = {
+    "analysis_responses": "packages/analysis:listAnalysisResponses",
+    "analysis_rubrics": "packages/analysis:listAnalysisRubrics",
+    "analysis_evidence": "packages/analysis:listAnalysisEvidence",
+    "analysis_samples": "packages/analysis:listAnalysisSamples",
+}
+DATASET_ROW_IDS: dict[str, str] = {
+    "analysis_responses": "response_id",
+    "analysis_rubrics": "rubric_id",
+    "analysis_evidence": "evidence_id",
+    "analysis_samples": "sample_id",
+}
+INCREMENTAL_DATASETS = tuple(table for table in DATASET_FUNCTIONS if table in INHERITED_TABLES)
+
+
 @dataclass
 class ExportedSnapshot:
     snapshot_id: str
     experiment_tag: str
     run_id: str
     manifest: dict[str, Any]
+    resumed: bool = False
+    parent_snapshot_id: str | None = None
+    query_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class DatasetPage:
+    rows: list[dict[str, Any]]
+    continue_cursor: str | None
+    is_done: bool
+
+
+@dataclass
+class _OpenedSnapshot:
+    snapshot_id: str
+    cached: bool
+    resumed: bool
+    checkpoints: dict[str, ExportCheckpoint]
+    parent_snapshot_id: str | None = None
+
+
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 4
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 30.0
+
+    def delay_seconds(self, attempt: int, response: httpx.Response | None = None) -> float:
+        retry_after = _retry_after_seconds(response)
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return random.uniform(0.0, ceiling)
+
+
+@dataclass
+class AdaptivePageSizer:
+    page_size: int = 200
+    target_page_seconds: float = 2.0
+    max_page_bytes: int = 4_000_000
+    min_page_size: int = 10
+    max_page_size: int = 2_000
+    max_growth: float = 2.0
+
+    def __post_init__(self) -> None:
+        self.page_size = self._clamp(self.page_size)
+
+    def observe(self, *, row_count: int, elapsed_seconds: float, response_bytes: int, attempts: int = 1) -> int:
+        if attempts > 1:
+            self.page_size = self._clamp(self.page_size // 2)
+            return self.page_size
+        if row_count <= 0:
+            return self.page_size
+        proposals = [self.page_size * self.max_growth]
+        if elapsed_seconds > 0:
+            proposals.append(self.target_page_seconds * row_count / elapsed_seconds)
+        if response_bytes > 0:
+            proposals.append(self.max_page_bytes * row_count / response_bytes)
+        self.page_size = self._clamp(int(min(proposals)))
+        return self.page_size
+
+    def _clamp(self, page_size: int) -> int:
+        return max(self.min_page_size, min(self.max_page_size, page_size))
+
+
+@dataclass
+class QueryTiming:
+    function_name: str
+    run_id: str | None
+    page_size: int | None
+    status_code: int | None
+    attempts: int
+    elapsed_seconds: float
+    response_bytes: int
+    row_count: int | None
+    wire_bytes: int = 0
+    content_encoding: str | None = None
+    decode_seconds: float = 0.0
+
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|"|[{}\[\],:]')
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_PAGE_PATH = ["value", "page"]
+
+
+class _StreamingQueryDecoder:
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._skeleton: list[str] = []
+        self._stack: list[list[Any]] = []
+        self._rows: list[Any] = []
+        self._found_rows = False
+        self._in_rows = False
+        self.decoded_bytes = 0
+        self.decode_seconds = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        started = time.perf_counter()
+        self.decoded_bytes += len(chunk)
+        self._buffer += self._text.decode(chunk)
+        self._consume(final=False)
+        self.decode_seconds += time.perf_counter() - started
+
+    def finish(self) -> Any:
+        started = time.perf_counter()
+        self._buffer += self._text.decode(b"", final=True)
+        self._consume(final=True)
+        if self._in_rows or self._stack:
+            raise ValueError("Convex response ended before the JSON document was complete")
+        payload = json.loads("".join(self._skeleton) + self._buffer)
+        if self._found_rows:
+            payload["value"]["page"] = self._rows
+        self.decode_seconds += time.perf_counter() - started
+        return payload["value"]
+
+    def _consume(self, *, final: bool) -> None:
+        position = 0
+        while position < len(self._buffer):
+            if self._in_rows:
+                position = self._consume_rows(position, final=final)
+                if self._in_rows:
+                    break
+                continue
+            match = _JSON_TOKEN.search(self._buffer, position)
+            if match is None or match.group() == '"':
+                break
+            token = match.group()
+            self._skeleton.append(self._buffer[position:match.end()])
+            position = match.end()
+            self._observe_token(token)
+        self._buffer = self._buffer[position:]
+
+    def _observe_token(self, token: str) -> None:
+        top = self._stack[-1] if self._stack else None
+        if token == "{":
+            self._stack.append(["object", None, True])
+        elif token == "[":
+            path = [frame[1] for frame in self._stack if frame[0] == "object"]
+            self._stack.append(["array", None, False])
+            if path == _PAGE_PATH and not self._found_rows:
+                self._found_rows = True
+                self._in_rows = True
+        elif token in "}]":
+            self._stack.pop()
+        elif token == ":":
+            if top is not None:
+                top[2] = False
+        elif token == ",":
+            if top is not None and top[0] == "object":
+                top[2] = True
+        elif top is not None and top[0] == "object" and top[2]:
+            top[1] = json.loads(token)
+
+    def _consume_rows(self, position: int, *, final: bool) -> int:
+        while True:
+            position = _JSON_WHITESPACE.match(self._buffer, position).end()
+            if position >= len(self._buffer):
+                return position
+            char = self._buffer[position]
+            if char == "]":
+                self._skeleton.append("]")
+                self._stack.pop()
+                self._in_rows = False
+                return position + 1
+            if char == ",":
+                position += 1
+                continue
+            try:
+                row, end = self._json.raw_decode(self._buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                return position
+            if end >= len(self._buffer) and not final and not isinstance(row, (dict, list)):
+                return position
+            self._rows.append(row)
+            position = end
+
+
+def _accept_encoding() -> str:
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.append("br")
+    if importlib.util.find_spec("zstandard"):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+def summarize_query_timings(
+    timings: Iterable[QueryTiming],
+    *,
+    run_id: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    summary: dict[str, dict[str, Any]] = {}
+    for timing in timings:
+        if run_id is not None and timing.run_id != run_id:
+            continue
+        entry = summary.setdefault(
+            timing.function_name,
+            {
+                "requests": 0,
+                "retries": 0,
+                "rows": 0,
+                "response_bytes": 0,
+                "wire_bytes": 0,
+                "decode_seconds": 0.0,
+                "seconds": 0.0,
+                "max_request_seconds": 0.0,
+                "last_page_size": None,
+            },
+        )
+        entry["requests"] += 1
+        entry["retries"] += timing.attempts - 1
+        entry["rows"] += timing.row_count or 0
+        entry["response_bytes"] += timing.response_bytes
+        entry["wire_bytes"] += timing.wire_bytes
+        entry["decode_seconds"] += timing.decode_seconds
+        entry["seconds"] += timing.elapsed_seconds
+        entry["max_request_seconds"] = max(entry["max_request_seconds"], timing.elapsed_seconds)
+        entry["last_page_size"] = timing.page_size
+    for entry in summary.values():
+        seconds = entry["seconds"]
+        entry["rows_per_second"] = entry["rows"] / seconds if seconds > 0 else None
+        entry["seconds"] = round(seconds, 6)
+        entry["decode_seconds"] = round(entry["decode_seconds"], 6)
+        entry["max_request_seconds"] = round(entry["max_request_seconds"], 6)
+    return summary
+
+
+def _retry_after_seconds(response: httpx.Response | None) -> float | None:
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in TRANSIENT_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _query_timing(
+    function_name: str,
+    args: dict[str, Any],
+    *,
+    response: httpx.Response,
+    decoder: _StreamingQueryDecoder,
+    value: Any,
+    attempts: int,
+    elapsed_seconds: float,
+) -> QueryTiming:
+    pagination = args.get("pagination") or {}
+    return QueryTiming(
+        function_name=function_name,
+        run_id=args.get("run_id"),
+        page_size=pagination.get("limit"),
+        status_code=response.status_code,
+        attempts=attempts,
+        elapsed_seconds=elapsed_seconds,
+        response_bytes=decoder.decoded_bytes,
+        row_count=len(value["page"]) if isinstance(value, dict) and "page" in value else None,
+        wire_bytes=response.num_bytes_downloaded,
+        content_encoding=response.headers.get("Content-Encoding"),
+        decode_seconds=decoder.decode_seconds,
+    )
+
+
+def _dataset_page(payload: dict[str, Any]) -> DatasetPage:
+    return DatasetPage(
+        rows=list(payload["page"]),
+        continue_cursor=payload["continue_cursor"],
+        is_done=bool(payload["is_done"]),
+    )
 
 
 class ConvexAnalysisClient:
-    def __init__(self, deployment_url: str, *, transport: httpx.BaseTransport | None = None):
+    def __init__(
+        self,
+        deployment_url: str,
+        *,
+        transport: httpx.BaseTransport | None = None,
+        timeout: float | httpx.Timeout = 60.0,
+        retry_policy: RetryPolicy | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self.deployment_url = deployment_url.rstrip("/")
         self._client = httpx.Client(
             base_url=self.deployment_url,
-            timeout=60.0,
+            timeout=timeout,
             transport=transport,
+            headers={"Accept-Encoding": _accept_encoding()},
         )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.query_timings: list[QueryTiming] = []
+        self._sleep = sleep
 
     def close(self) -> None:
         self._client.close()
 
     def query(self, function_name: str, args: dict[str, Any]) -> Any:
-        response = self._client.post(
-            "/api/query",
-            json={"path": function_name, "args": args},
-        )
-        response.raise_for_status()
-        return response.json()["value"]
+        return self._timed_query(function_name, args)[0]
+
+    def _timed_query(self, function_name: str, args: dict[str, Any]) -> tuple[Any, QueryTiming]:
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            response: httpx.Response | None = None
+            decoder = _StreamingQueryDecoder()
+            try:
+                with self._client.stream(
+                    "POST",
+                    "/api/query",
+                    json={"path": function_name, "args": args},
+                ) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes():
+                        decoder.feed(chunk)
+                value = decoder.finish()
+            except (httpx.HTTPStatusError, httpx.TransportError) as error:
+                if attempt >= self.retry_policy.max_retries or not _is_transient(error):
+                    raise
+                self._sleep(self.retry_policy.delay_seconds(attempt, response))
+                attempt += 1
+                continue
+            timing = _query_timing(
+                function_name,
+                args,
+                response=response,
+                decoder=decoder,
+                value=value,
+                attempts=attempt + 1,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+            self.query_timings.append(timing)
+            return value, timing
+
+    def timing_summary(self, *, run_id: str | None = None) -> dict[str, dict[str, Any]]:
+        return summarize_query_timings(self.query_timings, run_id=run_id)
 
     def list_experiments(self) -> list[dict[str, Any]]:
         return list(self.query("packages/analysis:listAnalysisExperiments", {}))
@@ -58,6 +428,34 @@ class ConvexAnalysisClient:
             args["run_id"] = run_id
         return dict(self.query("packages/analysis:getAnalysisManifest", args))
 
+    def iter_dataset_pages(
+        self,
+        function_name: str,
+        *,
+        run_id: str,
+        page_size: int,
+        cursor: str | None = None,
+        page_sizer: AdaptivePageSizer | None = None,
+    ) -> Iterator[DatasetPage]:
+        while True:
+            limit = page_size if page_sizer is None else page_sizer.page_size
+            payload, timing = self._timed_query(
+                function_name,
+                {"run_id": run_id, "pagination": {"limit": limit, "cursor": cursor}},
+            )
+            if page_sizer is not None:
+                page_sizer.observe(
+                    row_count=timing.row_count or 0,
+                    elapsed_seconds=timing.elapsed_seconds,
+                    response_bytes=timing.response_bytes,
+                    attempts=timing.attempts,
+                )
+            page = _dataset_page(payload)
+            yield page
+            if page.is_done:
+                return
+            cursor = page.continue_cursor
+
     def collect_dataset(
         self,
         function_name: str,
@@ -66,21 +464,329 @@ class ConvexAnalysisClient:
         page_size: int,
     ) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
-        cursor: str | None = None
+        for page in self.iter_dataset_pages(function_name, run_id=run_id, page_size=page_size):
+            rows.extend(page.rows)
+        return rows
+
+
+class AsyncConvexAnalysisClient:
+    def __init__(
+        self,
+        deployment_url: str,
+        *,
+        max_concurrency: int = 8,
+        transport: httpx.AsyncBaseTransport | None = None,
+        timeout: float | httpx.Timeout = 60.0,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.deployment_url = deployment_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            base_url=self.deployment_url,
+            timeout=timeout,
+            transport=transport,
+            headers={"Accept-Encoding": _accept_encoding()},
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.query_timings: list[QueryTiming] = []
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def query(self, function_name: str, args: dict[str, Any]) -> Any:
+        return (await self._timed_query(function_name, args))[0]
+
+    async def _timed_query(self, function_name: str, args: dict[str, Any]) -> tuple[Any, QueryTiming]:
+        attempt = 0
         while True:
-            payload = self.query(
+            response: httpx.Response | None = None
+            decoder = _StreamingQueryDecoder()
+            try:
+                async with self._semaphore:
+                    started = time.perf_counter()
+                    async with self._client.stream(
+                        "POST",
+                        "/api/query",
+                        json={"path": function_name, "args": args},
+                    ) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            decoder.feed(chunk)
+                    value = decoder.finish()
+                    elapsed_seconds = time.perf_counter() - started
+            except (httpx.HTTPStatusError, httpx.TransportError) as error:
+                if attempt >= self.retry_policy.max_retries or not _is_transient(error):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay_seconds(attempt, response))
+                attempt += 1
+                continue
+            timing = _query_timing(
                 function_name,
-                {"run_id": run_id, "pagination": {"limit": page_size, "cursor": cursor}},
+                args,
+                response=response,
+                decoder=decoder,
+                value=value,
+                attempts=attempt + 1,
+                elapsed_seconds=elapsed_seconds,
             )
-            rows.extend(payload["page"])
-            if payload["is_done"]:
-                break
-            cursor = payload["continue_cursor"]
+            self.query_timings.append(timing)
+            return value, timing
+
+    def timing_summary(self, *, run_id: str | None = None) -> dict[str, dict[str, Any]]:
+        return summarize_query_timings(self.query_timings, run_id=run_id)
+
+    async def get_manifest(self, *, experiment_tag: str) -> dict[str, Any]:
+        return dict(
+            await self.query(
+                "packages/analysis:getAnalysisManifest",
+                {"experiment_tag": experiment_tag},
+            )
+        )
+
+    async def iter_dataset_pages(
+        self,
+        function_name: str,
+        *,
+        run_id: str,
+        page_size: int,
+        cursor: str | None = None,
+        page_sizer: AdaptivePageSizer | None = None,
+    ) -> AsyncIterator[DatasetPage]:
+        while True:
+            limit = page_size if page_sizer is None else page_sizer.page_size
+            payload, timing = await self._timed_query(
+                function_name,
+                {"run_id": run_id, "pagination": {"limit": limit, "cursor": cursor}},
+            )
+            if page_sizer is not None:
+                page_sizer.observe(
+                    row_count=timing.row_count or 0,
+                    elapsed_seconds=timing.elapsed_seconds,
+                    response_bytes=timing.response_bytes,
+                    attempts=timing.attempts,
+                )
+            page = _dataset_page(payload)
+            yield page
+            if page.is_done:
+                return
+            cursor = page.continue_cursor
+
+    async def collect_dataset(
+        self,
+        function_name: str,
+        *,
+        run_id: str,
+        page_size: int,
+    ) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        async for page in self.iter_dataset_pages(function_name, run_id=run_id, page_size=page_size):
+            rows.extend(page.rows)
         return rows
 
 
-def build_response_items(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    item_rows: list[dict[str, Any]] = []
+_CacheOperation = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any], "asyncio.Future[Any]"]
+
+
+class _CacheWriter:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self._queue: asyncio.Queue[_CacheOperation | None] = asyncio.Queue()
+
+    async def run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            operation, args, kwargs, future = item
+            try:
+                result = operation(self._connection, *args, **kwargs)
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def submit(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, args, kwargs, future))
+        return await future
+
+    async def stop(self) -> None:
+        await self._queue.put(None)
+
+
+def write_snapshot_page(
+    connection: sqlite3.Connection,
+    *,
+    snapshot_id: str,
+    table: str,
+    page: DatasetPage,
+    row_count: int,
+) -> None:
+    with connection:
+        insert_snapshot_rows(
+            connection,
+            snapshot_id=snapshot_id,
+            table=table,
+            rows=page.rows,
+        )
+        if table == "analysis_responses":
+            insert_snapshot_rows(
+                connection,
+                snapshot_id=snapshot_id,
+                table="analysis_response_items",
+                rows=iter_response_items(page.rows),
+            )
+        record_export_checkpoint(
+            connection,
+            snapshot_id=snapshot_id,
+            table=table,
+            continue_cursor=page.continue_cursor,
+            row_count=row_count,
+            is_done=page.is_done,
+            last_row_id=str(page.rows[-1][DATASET_ROW_IDS[table]]) if page.rows else None,
+        )
+
+
+def _page_sizer(page_size: int, target_page_seconds: float | None) -> AdaptivePageSizer | None:
+    if target_page_seconds is None:
+        return None
+    return AdaptivePageSizer(page_size=page_size, target_page_seconds=target_page_seconds)
+
+
+def _open_snapshot(
+    connection: sqlite3.Connection,
+    *,
+    deployment_url: str,
+    manifest: dict[str, Any],
+    refresh: bool,
+    resume: bool,
+    incremental: bool = False,
+) -> _OpenedSnapshot:
+    run_id = str(manifest["run"]["run_id"])
+    schema_version = int(manifest["export_schema_version"])
+    if not refresh and not incremental:
+        cached = existing_snapshot_id(
+            connection,
+            deployment_url=deployment_url,
+            run_id=run_id,
+            export_schema_version=schema_version,
+        )
+        if cached is not None:
+            return _OpenedSnapshot(snapshot_id=cached, cached=True, resumed=False, checkpoints={})
+
+    if resume:
+        pending = pending_snapshot_id(
+            connection,
+            deployment_url=deployment_url,
+            run_id=run_id,
+            export_schema_version=schema_version,
+        )
+        if pending is not None:
+            return _OpenedSnapshot(
+                snapshot_id=pending,
+                cached=False,
+                resumed=True,
+                checkpoints=load_export_checkpoints(connection, pending),
+                parent_snapshot_id=next(iter(snapshot_lineage(connection, pending)[1:]), None),
+            )
+
+    if incremental and not refresh:
+        parent_snapshot_id = existing_snapshot_id(
+            connection,
+            deployment_url=deployment_url,
+            run_id=run_id,
+            export_schema_version=schema_version,
+        )
+        if parent_snapshot_id is not None:
+            opened = _open_incremental_snapshot(
+                connection,
+                deployment_url=deployment_url,
+                manifest=manifest,
+                parent_snapshot_id=parent_snapshot_id,
+            )
+            if opened is not None:
+                return opened
+
+    garbage_collect_pending_snapshots(
+        connection,
+        deployment_url=deployment_url,
+        run_id=run_id,
+    )
+    snapshot_id = create_snapshot(
+        connection,
+        deployment_url=deployment_url,
+        manifest=manifest,
+    )
+    return _OpenedSnapshot(snapshot_id=snapshot_id, cached=False, resumed=False, checkpoints={})
+
+
+def _open_incremental_snapshot(
+    connection: sqlite3.Connection,
+    *,
+    deployment_url: str,
+    manifest: dict[str, Any],
+    parent_snapshot_id: str,
+) -> _OpenedSnapshot | None:
+    parent_checkpoints = load_export_checkpoints(connection, parent_snapshot_id)
+    if not all(
+        table in parent_checkpoints and parent_checkpoints[table].is_done
+        for table in INCREMENTAL_DATASETS
+    ):
+        return None
+
+    # Critic fields are filled in on rows Convex already returned, so only the rows
+    # before the first one still missing a critic field are safe to inherit.
+    settled = {
+        table: settled_row_prefix(connection, snapshot_id=parent_snapshot_id, table=table)
+        for table in INCREMENTAL_DATASETS
+    }
+    if snapshot_manifest(connection, parent_snapshot_id).get("counts") == manifest.get("counts") and all(
+        settled[table][0] == parent_checkpoints[table].row_count for table in INCREMENTAL_DATASETS
+    ):
+        return _OpenedSnapshot(snapshot_id=parent_snapshot_id, cached=True, resumed=False, checkpoints={})
+
+    garbage_collect_pending_snapshots(
+        connection,
+        deployment_url=deployment_url,
+        run_id=str(manifest["run"]["run_id"]),
+    )
+    snapshot_id = create_snapshot(
+        connection,
+        deployment_url=deployment_url,
+        manifest=manifest,
+        parent_snapshot_id=parent_snapshot_id,
+    )
+    with connection:
+        for table in INCREMENTAL_DATASETS:
+            row_count, last_row_id = settled[table]
+            # Convex pages these datasets by offset over rows sorted on _creationTime,
+            # so the settled row count is the cursor of the first row to re-fetch.
+            # Re-fetched rows shadow the parent's copies when the bundle is loaded.
+            record_export_checkpoint(
+                connection,
+                snapshot_id=snapshot_id,
+                table=table,
+                continue_cursor=str(row_count),
+                row_count=row_count,
+                is_done=False,
+                last_row_id=last_row_id,
+            )
+    return _OpenedSnapshot(
+        snapshot_id=snapshot_id,
+        cached=False,
+        resumed=False,
+        checkpoints=load_export_checkpoints(connection, snapshot_id),
+        parent_snapshot_id=parent_snapshot_id,
+    )
+
+
+def build_response_items(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    return list(iter_response_items(rows))
+
+
+def iter_response_items(rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
     for row in rows:
         evidence_ids = list(row.get("evidence_ids", []))
         evidence_labels = list(row.get("evidence_labels", []))
@@ -90,7 +796,7 @@ def build_response_items(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
         positions = list(row.get("evidence_positions", []))
         bundle_size = len(evidence_ids)
         for index, evidence_id in enumerate(evidence_ids):
-            item_rows.append({
+            yield {
                 "response_id": row["response_id"],
                 "experiment_tag": row["experiment_tag"],
                 "run_id": row["run_id"],
@@ -110,8 +816,7 @@ def build_response_items(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
                 "evidence_url": evidence_urls[index] if index < len(evidence_urls) else "",
                 "window_id": window_ids[index] if index < len(window_ids) else "",
                 "position": positions[index] if index < len(positions) else index,
-            })
-    return item_rows
+            }
 
 
 def export_experiments(
@@ -120,76 +825,63 @@ def export_experiments(
     deployment_url: str,
     cache_db_path: str | None = None,
     refresh: bool = False,
+    resume: bool = False,
+    incremental: bool = False,
     page_size: int = 200,
+    target_page_seconds: float | None = None,
+    retry_policy: RetryPolicy | None = None,
     transport: httpx.BaseTransport | None = None,
 ) -> list[ExportedSnapshot]:
     connection = connect_cache(cache_db_path)
-    client = ConvexAnalysisClient(deployment_url, transport=transport)
+    client = ConvexAnalysisClient(deployment_url, transport=transport, retry_policy=retry_policy)
     snapshots: list[ExportedSnapshot] = []
 
     try:
+        garbage_collect_pending_snapshots(connection, older_than_ms=PENDING_SNAPSHOT_TTL_MS)
         for experiment_tag in experiment_tags:
             manifest = client.get_manifest(experiment_tag=experiment_tag)
             run_id = str(manifest["run"]["run_id"])
-            schema_version = int(manifest["export_schema_version"])
-            if not refresh:
-                cached = existing_snapshot_id(
-                    connection,
-                    deployment_url=deployment_url,
-                    run_id=run_id,
-                    export_schema_version=schema_version,
-                )
-                if cached is not None:
-                    snapshots.append(
-                        ExportedSnapshot(
-                            snapshot_id=cached,
-                            experiment_tag=experiment_tag,
-                            run_id=run_id,
-                            manifest=manifest,
-                        )
-                    )
-                    continue
-
-            snapshot_id = create_snapshot(
+            opened = _open_snapshot(
                 connection,
                 deployment_url=deployment_url,
                 manifest=manifest,
+                refresh=refresh,
+                resume=resume,
+                incremental=incremental,
             )
-            dataset_map = {
-                "analysis_responses": "packages/analysis:listAnalysisResponses",
-                "analysis_rubrics": "packages/analysis:listAnalysisRubrics",
-                "analysis_evidence": "packages/analysis:listAnalysisEvidence",
-                "analysis_samples": "packages/analysis:listAnalysisSamples",
-            }
-
-            datasets: dict[str, list[dict[str, Any]]] = {}
-            for table, function_name in dataset_map.items():
-                rows = client.collect_dataset(
-                    function_name,
-                    run_id=run_id,
-                    page_size=page_size,
-                )
-                datasets[table] = rows
-                write_snapshot_dataset(
-                    connection,
-                    snapshot_id=snapshot_id,
-                    table=table,
-                    rows=rows,
-                )
-            write_snapshot_dataset(
-                connection,
-                snapshot_id=snapshot_id,
-                table="analysis_response_items",
-                rows=build_response_items(datasets["analysis_responses"]),
-            )
+            if not opened.cached:
+                for table, function_name in DATASET_FUNCTIONS.items():
+                    checkpoint = opened.checkpoints.get(table)
+                    if checkpoint is not None and checkpoint.is_done:
+                        continue
+                    row_count = 0 if checkpoint is None else checkpoint.row_count
+                    pages = client.iter_dataset_pages(
+                        function_name,
+                        run_id=run_id,
+                        page_size=page_size,
+                        cursor=None if checkpoint is None else checkpoint.continue_cursor,
+                        page_sizer=_page_sizer(page_size, target_page_seconds),
+                    )
+                    for page in pages:
+                        row_count += len(page.rows)
+                        write_snapshot_page(
+                            connection,
+                            snapshot_id=opened.snapshot_id,
+                            table=table,
+                            page=page,
+                            row_count=row_count,
+                        )
+                mark_snapshot_completed(connection, opened.snapshot_id)
 
-            mark_snapshot_completed(connection, snapshot_id)
             snapshots.append(
                 ExportedSnapshot(
-                    snapshot_id=snapshot_id,
+                    snapshot_id=opened.snapshot_id,
                     experiment_tag=experiment_tag,
                     run_id=run_id,
                     manifest=manifest,
+                    resumed=opened.resumed,
+                    parent_snapshot_id=opened.parent_snapshot_id,
+                    query_stats=client.timing_summary(run_id=run_id),
                 )
             )
     finally:
@@ -197,3 +889,89 @@ def export_experiments(
         connection.close()
 
     return snapshots
+
+
+async def export_experiments_async(
+    *,
+    experiment_tags: list[str],
+    deployment_url: str,
+    cache_db_path: str | None = None,
+    refresh: bool = False,
+    resume: bool = False,
+    incremental: bool = False,
+    page_size: int = 200,
+    target_page_seconds: float | None = None,
+    retry_policy: RetryPolicy | None = None,
+    max_concurrency: int = 8,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> list[ExportedSnapshot]:
+    connection = connect_cache(cache_db_path)
+    client = AsyncConvexAnalysisClient(
+        deployment_url,
+        max_concurrency=max_concurrency,
+        transport=transport,
+        retry_policy=retry_policy,
+    )
+    writer = _CacheWriter(connection)
+    writer_task = asyncio.create_task(writer.run())
+
+    async def export_one(experiment_tag: str) -> ExportedSnapshot:
+        manifest = await client.get_manifest(experiment_tag=experiment_tag)
+        run_id = str(manifest["run"]["run_id"])
+        opened: _OpenedSnapshot = await writer.submit(
+            _open_snapshot,
+            deployment_url=deployment_url,
+            manifest=manifest,
+            refresh=refresh,
+            resume=resume,
+            incremental=incremental,
+        )
+
+        async def export_dataset(table: str, function_name: str) -> None:
+            checkpoint = opened.checkpoints.get(table)
+            if checkpoint is not None and checkpoint.is_done:
+                return
+            row_count = 0 if checkpoint is None else checkpoint.row_count
+            pages = client.iter_dataset_pages(
+                function_name,
+                run_id=run_id,
+                page_size=page_size,
+                cursor=None if checkpoint is None else checkpoint.continue_cursor,
+                page_sizer=_page_sizer(page_size, target_page_seconds),
+            )
+            async for page in pages:
+                row_count += len(page.rows)
+                await writer.submit(
+                    write_snapshot_page,
+                    snapshot_id=opened.snapshot_id,
+                    table=table,
+                    page=page,
+                    row_count=row_count,
+                )
+
+        if not opened.cached:
+            async with asyncio.TaskGroup() as group:
+                for table, function_name in DATASET_FUNCTIONS.items():
+                    group.create_task(export_dataset(table, function_name))
+            await writer.submit(mark_snapshot_completed, opened.snapshot_id)
+        return ExportedSnapshot(
+            snapshot_id=opened.snapshot_id,
+            experiment_tag=experiment_tag,
+            run_id=run_id,
+            manifest=manifest,
+            resumed=opened.resumed,
+            parent_snapshot_id=opened.parent_snapshot_id,
+            query_stats=client.timing_summary(run_id=run_id),
+        )
+
+    try:
+        await writer.submit(garbage_collect_pending_snapshots, older_than_ms=PENDING_SNAPSHOT_TTL_MS)
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(export_one(tag)) for tag in experiment_tags]
+    finally:
+        await writer.stop()
+        await writer_task
+        await client.aclose()
+        connection.close()
+
+    return [task.result() for task in tasks]
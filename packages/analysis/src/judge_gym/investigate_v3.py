@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+import multiprocessing
 import re
 import textwrap
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 import matplotlib
 matplotlib.use("Agg")
@@ -19,7 +23,16 @@ from scipy.spatial.distance import squareform
 import statsmodels.formula.api as smf
 
 from .cache import connect_cache, record_artifact
-from .datasets import SnapshotBundle, load_snapshot_bundle, load_snapshot_bundle_for_contract
+from .datasets import (
+    BUNDLE_TABLES,
+    SnapshotBundle,
+    list_cells,
+    list_lengths,
+    load_snapshot_bundle,
+    load_snapshot_bundle_for_contract,
+)
+from .dempster_shafer import pignistic, simple_support_masses
+from .derived_cache import DerivedTableCache, default_derived_cache_path, derived_table_key
 from .figure_layout import (
     bucket_verdict_label,
     paginate_labels,
@@ -28,10 +41,12 @@ from .figure_layout import (
 )
 from .figure_triage import build_repair_plan, load_figure_manifest
 from .mine_v3 import mine_v3_findings, write_mining_summary
+from .aggregation_methods import VerdictMatrix, build_verdict_matrix, verdict_matrix_from_masks
 from .report_pilot import (
     _build_belief_frame,
     _build_experiment_metrics,
-    _response_to_mass,
+    _or_one,
+    _response_simple_supports,
     family_groups_for_tags,
     family_slug_from_tag,
 )
@@ -41,8 +56,10 @@ from .aggregation_sensitivity import (
 )
 from .rubric_embeddings import (
     DEFAULT_RUBRIC_EMBEDDING_MODEL,
+    EmbeddingTable,
     build_rubric_embedding_tables,
-    vector_from_json,
+    centroid_cosine_similarity,
+    paired_cosine_similarity,
 )
 
 PRIMARY_ENDPOINTS = [
@@ -68,6 +85,47 @@ RUBRIC_FOCUS_MODELS = [
 ]
 
 
+DERIVED_TABLE_VERSIONS = {
+    "experiment_metrics": 1,
+    "experiment_geometry": 1,
+    "sample_metrics": 1,
+    "evidence_metrics": 1,
+    "matching_tables": 1,
+    "rubric_embedding_tables": 2,
+    "rubric_experiment_similarity": 1,
+    "rubric_focus_similarity": 1,
+    "rubric_stage_contrast_similarity": 1,
+    "rubric_contrast_similarity": 1,
+    "rubric_experiment_clusters": 1,
+    "rubric_focus_clusters": 1,
+    "scale_matching_tables": 1,
+    "scale_certainty_analysis": 1,
+    "family_pair_deltas": 1,
+    "family_effects": 1,
+    "family_effects_qvalues": 1,
+    "sample_instability": 1,
+    "experiment_distances": 1,
+    "bundle_verdict_profiles": 1,
+    "bundle_belief_tbm": 1,
+    "bundle_belief_closed_world": 1,
+    "verdict_geometry_certainty": 1,
+    "bundle_policy_deltas": 1,
+    "robust_summary_panel": 1,
+    "candidate_findings": 1,
+    "sample_beliefs_tbm": 1,
+    "sample_beliefs_closed_world": 1,
+    "contrasts": 1,
+    "scale_contrasts": 1,
+    "figure_repair_plan": 1,
+    "contrast_registry": 1,
+    "mining": 1,
+    "aggregation_sensitivity": 1,
+    "figures": 1,
+    "report": 1,
+}
+INVESTIGATION_STATE_FILE = "investigation_state.json"
+
+
 @dataclass(frozen=True)
 class FamilyContrast:
     contrast_id: str
@@ -84,6 +142,171 @@ def default_investigation_root() -> Path:
     return Path(__file__).resolve().parents[2] / "_outputs" / "v3" / "investigation"
 
 
+@dataclass(frozen=True)
+class InvestigationNode:
+    name: str
+    inputs: tuple[str, ...]
+    build: Callable[["_InvestigationGraph"], Any]
+    tables: tuple[str, ...] = ()
+    artifact: bool = False
+    cached: bool = True
+
+
+class _InvestigationGraph:
+    def __init__(
+        self,
+        nodes: list[InvestigationNode],
+        *,
+        sources: dict[str, str | None],
+        snapshot_ids: list[str],
+        cache: DerivedTableCache | None,
+    ) -> None:
+        self.nodes = {node.name: node for node in nodes}
+        self._sources = sources
+        self._snapshot_ids = snapshot_ids
+        self._cache = cache
+        self._keys: dict[str, str | None] = {}
+        self._values: dict[str, Any] = {}
+        self.build_seconds: dict[str, float] = {}
+        self._consumers: dict[str, set[str]] = {}
+        for node in nodes:
+            missing = [name for name in node.inputs if name not in sources and name not in self._keys]
+            if missing:
+                raise ValueError(f"Investigation node {node.name} depends on unknown inputs: {missing}")
+            self._keys[node.name] = self._node_key(node)
+
+    def key(self, name: str) -> str | None:
+        return self._sources[name] if name in self._sources else self._keys[name]
+
+    def value(self, name: str) -> Any:
+        if name not in self._values:
+            found, value = self._cached(name)
+            if not found:
+                self._record_consumer(name)
+                value, seconds = _timed_build(self, name)
+                self._store(name, value, seconds)
+            self._values[name] = value
+        return self._values[name]
+
+    def prefetch(self, names: Iterable[str], *, workers: int = 1) -> None:
+        pending: list[str] = []
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited or name in self._sources:
+                return
+            visited.add(name)
+            if name in self._values:
+                return
+            found, value = self._cached(name)
+            if found:
+                self._values[name] = value
+                return
+            for input_name in self.nodes[name].inputs:
+                visit(input_name)
+            pending.append(name)
+
+        for name in names:
+            visit(name)
+        if workers <= 1 or len(pending) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            for name in pending:
+                self.value(name)
+            return
+
+        global _WORKER_GRAPH
+        _WORKER_GRAPH = self
+        order = {name: index for index, name in enumerate(self.nodes)}
+        pending.sort(key=order.__getitem__)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(pending)),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                running: dict[Future, str] = {}
+                while pending or running:
+                    for name in list(pending):
+                        upstream = [input_name for input_name in self.nodes[name].inputs if input_name in self.nodes]
+                        if all(input_name in self._values for input_name in upstream):
+                            inputs = {input_name: self._values[input_name] for input_name in upstream}
+                            self._record_consumer(name)
+                            running[executor.submit(_build_in_worker, name, inputs)] = name
+                            pending.remove(name)
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda future: order[running[future]]):
+                        name = running.pop(future)
+                        value, seconds = future.result()
+                        self._store(name, value, seconds)
+                        self._values[name] = value
+        finally:
+            _WORKER_GRAPH = None
+
+    def reused(self) -> dict[str, list[str]]:
+        return {
+            name: sorted(consumers)
+            for name, consumers in sorted(self._consumers.items())
+            if len(consumers) > 1
+        }
+
+    def _record_consumer(self, name: str) -> None:
+        for input_name in self.nodes[name].inputs:
+            if input_name in self.nodes:
+                self._consumers.setdefault(input_name, set()).add(name)
+
+    def _cached(self, name: str) -> tuple[bool, Any]:
+        key = self._keys[name]
+        if self._cache is None or key is None or not self.nodes[name].cached:
+            return False, None
+        found, value = self._cache.get(key)
+        if found:
+            self._cache.hits.append(name)
+        return found, value
+
+    def _store(self, name: str, value: Any, seconds: float) -> None:
+        self.build_seconds[name] = seconds
+        key = self._keys[name]
+        if self._cache is None or key is None or not self.nodes[name].cached:
+            return
+        self._cache.put(
+            key,
+            value,
+            snapshot_ids=self._snapshot_ids,
+            builder=name,
+            version=DERIVED_TABLE_VERSIONS[name],
+            params=self._key_params(self.nodes[name]),
+        )
+        self._cache.misses.append(name)
+
+    def _key_params(self, node: InvestigationNode) -> dict[str, Any]:
+        return {"inputs": {name: self.key(name) for name in node.inputs}}
+
+    def _node_key(self, node: InvestigationNode) -> str | None:
+        params = self._key_params(node)
+        if None in params["inputs"].values():
+            return None
+        return derived_table_key(
+            snapshot_ids=self._snapshot_ids,
+            builder=node.name,
+            version=DERIVED_TABLE_VERSIONS[node.name],
+            params=params,
+        )
+
+
+_WORKER_GRAPH: _InvestigationGraph | None = None
+
+
+def _timed_build(graph: _InvestigationGraph, name: str) -> tuple[Any, float]:
+    started = time.perf_counter()
+    value = graph.nodes[name].build(graph)
+    return value, time.perf_counter() - started
+
+
+def _build_in_worker(name: str, inputs: dict[str, Any]) -> tuple[Any, float]:
+    graph = _WORKER_GRAPH
+    graph._cache = None
+    graph._values = dict(inputs)
+    return _timed_build(graph, name)
+
+
 def generate_v3_investigation(
     *,
     snapshot_ids: list[str] | None = None,
@@ -95,6 +318,11 @@ def generate_v3_investigation(
     figures_manifest_path: str | None = None,
     rubric_embedding_model: str = DEFAULT_RUBRIC_EMBEDDING_MODEL,
     rubric_embedding_encoder=None,
+    rubric_embedding_cache_path: str | Path | None = None,
+    derived_cache_path: str | Path | None = None,
+    use_derived_cache: bool = True,
+    incremental: bool = False,
+    workers: int = 1,
 ) -> Path:
     contract_artifacts = None
     if contract_path is not None:
@@ -103,6 +331,7 @@ def generate_v3_investigation(
             contrast_registry_path=contrast_registry_path,
             figures_manifest_path=figures_manifest_path,
             cache_db_path=cache_db_path,
+            lazy=incremental,
         )
         bundle = contract_bundle.bundle
         contract_artifacts = contract_bundle.artifacts
@@ -111,6 +340,7 @@ def generate_v3_investigation(
             snapshot_ids=snapshot_ids,
             experiment_tags=experiment_tags,
             cache_db_path=cache_db_path,
+            lazy=incremental,
         )
     root = Path(output_dir) if output_dir is not None else default_investigation_root()
     figures_dir = root / "figures"
@@ -118,226 +348,120 @@ def generate_v3_investigation(
     figures_dir.mkdir(parents=True, exist_ok=True)
     tables_dir.mkdir(parents=True, exist_ok=True)
 
+    derived_cache = (
+        DerivedTableCache(derived_cache_path or default_derived_cache_path(cache_db_path))
+        if use_derived_cache
+        else None
+    )
+    state_path = root / INVESTIGATION_STATE_FILE
+    previous_state = (
+        json.loads(state_path.read_text()).get("nodes", {})
+        if incremental and state_path.exists()
+        else {}
+    )
     connection = connect_cache(cache_db_path)
     try:
-        figure_repair_plan = _load_figure_repair_plan(figures_manifest_path)
-        contrasts = (
-            _build_family_contrasts_from_registry(contract_artifacts)
-            if contract_artifacts is not None
-            else _build_family_contrasts(bundle)
-        )
-        experiment_metrics = _build_experiment_metrics(bundle)
-        experiment_geometry = _build_experiment_geometry(bundle)
-        sample_metrics = _build_sample_metrics(bundle)
-        evidence_metrics = _build_evidence_metrics(bundle)
-        matching_details, matching_validation = _build_matching_tables(bundle, contrasts)
-        rubric_embedding_tables = build_rubric_embedding_tables(
-            bundle,
-            model_name=rubric_embedding_model,
-            encoder=rubric_embedding_encoder,
-        )
-        rubric_embeddings = rubric_embedding_tables["full"]
-        rubric_stage_embeddings = rubric_embedding_tables["stage"]
-        rubric_criterion_embeddings = rubric_embedding_tables["criterion"]
-        rubric_experiment_similarity = _build_rubric_experiment_similarity(rubric_embeddings)
-        rubric_focus_similarity = _build_rubric_focus_similarity(
-            rubric_experiment_similarity=rubric_experiment_similarity,
-            bundle=bundle,
-        )
-        rubric_stage_contrast_similarity = _build_rubric_stage_contrast_similarity(
-            rubric_stage_embeddings=rubric_stage_embeddings,
-            contrasts=contrasts,
-            matching_details=matching_details,
-        )
-        rubric_contrast_similarity = _build_rubric_contrast_similarity(
-            rubric_embeddings=rubric_embeddings,
-            contrasts=contrasts,
-            matching_details=matching_details,
-        )
-        rubric_experiment_clusters = _build_rubric_experiment_clusters(rubric_experiment_similarity)
-        rubric_focus_clusters = _build_rubric_experiment_clusters(rubric_focus_similarity)
-        scale_contrasts = (
-            _build_scale_size_contrasts_from_registry(contract_artifacts)
-            if contract_artifacts is not None
-            else _build_scale_size_contrasts(bundle)
-        )
-        scale_matching_details, scale_matching_validation = _build_matching_tables(bundle, scale_contrasts)
-        scale_certainty_effects, scale_certainty_regression = _build_scale_certainty_analysis(
-            bundle=bundle,
-            sample_metrics=sample_metrics,
-            matching_details=scale_matching_details,
-            contrasts=scale_contrasts,
-        )
-        family_pair_deltas = _build_family_pair_deltas(
-            sample_metrics,
-            matching_details,
-            contrasts,
-        )
-        family_effects = _build_family_effects(family_pair_deltas)
-        family_effects_qvalues = _build_family_effects_qvalues(family_effects)
-        sample_instability = _build_sample_instability(sample_metrics)
-        experiment_distances = _build_experiment_distances(experiment_metrics)
-        bundle_verdict_profiles = _build_bundle_verdict_profiles(bundle)
-        bundle_belief_tbm = _build_bundle_belief_profiles(bundle, closed_world=False)
-        bundle_belief_closed = _build_bundle_belief_profiles(bundle, closed_world=True)
-        verdict_geometry_certainty = _build_verdict_geometry_certainty(bundle)
-        bundle_policy_deltas = _build_bundle_policy_deltas(family_effects)
-        robust_summary_panel = _build_robust_summary_panel(bundle)
-        contrast_registry_frame = _build_contrast_registry_frame(contrasts)
-        candidate_findings = _build_candidate_findings(
-            experiment_metrics=experiment_metrics,
-            experiment_geometry=experiment_geometry,
-            family_effects=family_effects,
-            rubric_contrast_similarity=rubric_contrast_similarity,
-            scale_certainty_effects=scale_certainty_effects,
-            sample_instability=sample_instability,
-        )
-
-        outputs = {
-            tables_dir / "experiment_metrics.csv": experiment_metrics,
-            tables_dir / "experiment_geometry.csv": experiment_geometry,
-            tables_dir / "rubric_embeddings.csv": rubric_embeddings,
-            tables_dir / "rubric_stage_embeddings.csv": rubric_stage_embeddings,
-            tables_dir / "rubric_criterion_embeddings.csv": rubric_criterion_embeddings,
-            tables_dir / "rubric_experiment_similarity.csv": rubric_experiment_similarity,
-            tables_dir / "rubric_experiment_clusters.csv": rubric_experiment_clusters,
-            tables_dir / "rubric_focus_similarity.csv": rubric_focus_similarity,
-            tables_dir / "rubric_focus_clusters.csv": rubric_focus_clusters,
-            tables_dir / "rubric_contrast_similarity.csv": rubric_contrast_similarity,
-            tables_dir / "rubric_stage_contrast_similarity.csv": rubric_stage_contrast_similarity,
-            tables_dir / "sample_metrics.csv": sample_metrics,
-            tables_dir / "evidence_metrics.csv": evidence_metrics,
-            tables_dir / "matching_details.csv": matching_details,
-            tables_dir / "matching_validation.csv": matching_validation,
-            tables_dir / "scale_matching_details.csv": scale_matching_details,
-            tables_dir / "scale_matching_validation.csv": scale_matching_validation,
-            tables_dir / "scale_certainty_effects.csv": scale_certainty_effects,
-            tables_dir / "scale_certainty_regression.csv": scale_certainty_regression,
-            tables_dir / "contrast_registry.csv": contrast_registry_frame,
-            tables_dir / "family_pair_deltas.csv": family_pair_deltas,
-            tables_dir / "family_effects.csv": family_effects,
-            tables_dir / "family_effects_qvalues.csv": family_effects_qvalues,
-            tables_dir / "sample_instability.csv": sample_instability,
-            tables_dir / "experiment_distances.csv": experiment_distances,
-            tables_dir / "bundle_verdict_profiles.csv": bundle_verdict_profiles,
-            tables_dir / "bundle_belief_tbm.csv": bundle_belief_tbm,
-            tables_dir / "bundle_belief_closed_world.csv": bundle_belief_closed,
-            tables_dir / "verdict_geometry_certainty.csv": verdict_geometry_certainty,
-            tables_dir / "bundle_policy_deltas.csv": bundle_policy_deltas,
-            tables_dir / "robust_summary_panel.csv": robust_summary_panel,
-            tables_dir / "candidate_findings.csv": candidate_findings,
-        }
-        for path, frame in outputs.items():
-            frame.to_csv(path, index=False)
-            _record_for_all(
-                connection,
-                bundle.snapshot_ids,
-                "table",
-                path,
-                report_name="v3_investigation",
-            )
-
-        if contract_path is not None:
-            mining_output = mine_v3_findings(
+        graph = _InvestigationGraph(
+            _investigation_nodes(
+                bundle=bundle,
+                contract_artifacts=contract_artifacts,
                 contract_path=contract_path,
-                tables_dir=tables_dir,
                 contrast_registry_path=contrast_registry_path,
-            )
-            mining_paths = write_mining_summary(
-                mining_output,
-                output_dir=tables_dir,
-                markdown_name="mine_v3_summary.md",
-                findings_name="mine_v3_ranked_findings.csv",
-                summary_name="mine_v3_summary.json",
-            )
-            for path in mining_paths.values():
-                _record_for_all(
-                    connection,
-                    bundle.snapshot_ids,
-                    "table" if path.suffix == ".csv" else "report",
-                    path,
-                    report_name="v3_investigation",
-                )
-
-            aggregation_outputs = run_aggregation_sensitivity(
-                contract_path=contract_path,
                 cache_db_path=cache_db_path,
+                figures_manifest_path=figures_manifest_path,
+                rubric_embedding_model=rubric_embedding_model,
+                rubric_embedding_encoder=rubric_embedding_encoder,
+                rubric_embedding_cache_path=rubric_embedding_cache_path,
                 tables_dir=tables_dir,
-            )
-            aggregation_paths = write_aggregation_sensitivity_outputs(
-                aggregation_outputs,
-                output_dir=tables_dir,
-            )
-            for path in aggregation_paths.values():
+                figures_dir=figures_dir,
+                root=root,
+            ),
+            sources=_investigation_sources(
+                bundle=bundle,
+                contract_path=contract_path,
+                contrast_registry_path=contrast_registry_path,
+                figures_manifest_path=figures_manifest_path,
+                rubric_embedding_model=rubric_embedding_model if rubric_embedding_encoder is None else None,
+            ),
+            snapshot_ids=bundle.snapshot_ids,
+            cache=derived_cache,
+        )
+        node_state: dict[str, dict[str, Any]] = {}
+        rebuilt: list[str] = []
+        skipped: list[str] = []
+        for node in graph.nodes.values():
+            if not node.tables and not node.artifact:
+                continue
+            key = graph.key(node.name)
+            previous = previous_state.get(node.name)
+            if (
+                key is not None
+                and previous is not None
+                and previous.get("key") == key
+                and all((root / path).exists() for path in previous.get("outputs", []))
+            ):
+                node_state[node.name] = previous
+                skipped.append(node.name)
+            else:
+                rebuilt.append(node.name)
+        graph.prefetch(
+            [
+                name
+                for node_name in rebuilt
+                for name in (graph.nodes[node_name].inputs if graph.nodes[node_name].artifact else (node_name,))
+                if name in graph.nodes
+            ]
+            + ["contrasts", "matching_tables"],
+            workers=workers,
+        )
+        for node_name in rebuilt:
+            node = graph.nodes[node_name]
+            key = graph.key(node.name)
+            if node.artifact:
+                artifacts = node.build(graph)
+            else:
+                value = graph.value(node.name)
+                frames = value if len(node.tables) > 1 else (value,)
+                artifacts = []
+                for table, frame in zip(node.tables, frames):
+                    path = tables_dir / table
+                    if isinstance(frame, EmbeddingTable):
+                        frame = frame.to_frame()
+                    frame.to_csv(path, index=False)
+                    artifacts.append(("table", path))
+            for artifact_kind, path in artifacts:
                 _record_for_all(
                     connection,
                     bundle.snapshot_ids,
-                    "table",
+                    artifact_kind,
                     path,
                     report_name="v3_investigation",
                 )
+            node_state[node.name] = {
+                "key": key,
+                "outputs": [path.relative_to(root).as_posix() for _, path in artifacts],
+            }
 
-        figure_paths = _write_figures(
-            bundle=bundle,
-            experiment_geometry=experiment_geometry,
-            experiment_metrics=experiment_metrics,
-            family_effects=family_effects,
-            rubric_experiment_similarity=rubric_experiment_similarity,
-            rubric_focus_similarity=rubric_focus_similarity,
-            rubric_stage_contrast_similarity=rubric_stage_contrast_similarity,
-            sample_instability=sample_instability,
-            sample_metrics=sample_metrics,
-            scale_certainty_effects=scale_certainty_effects,
-            bundle_verdict_profiles=bundle_verdict_profiles,
-            bundle_belief_tbm=bundle_belief_tbm,
-            bundle_belief_closed=bundle_belief_closed,
-            figures_dir=figures_dir,
-            figure_repair_plan=figure_repair_plan,
-        )
-        for path in figure_paths:
-            _record_for_all(
-                connection,
-                bundle.snapshot_ids,
-                "figure",
-                path,
-                report_name="v3_investigation",
-            )
-
-        report_path = root / "report.md"
-        report_path.write_text(
-            _build_markdown_report(
-                bundle=bundle,
-                candidate_findings=candidate_findings,
-                experiment_distances=experiment_distances,
-                experiment_geometry=experiment_geometry,
-                experiment_metrics=experiment_metrics,
-                matching_validation=matching_validation,
-                family_effects=family_effects,
-                rubric_contrast_similarity=rubric_contrast_similarity,
-                rubric_focus_similarity=rubric_focus_similarity,
-                rubric_stage_contrast_similarity=rubric_stage_contrast_similarity,
-                scale_matching_validation=scale_matching_validation,
-                scale_certainty_effects=scale_certainty_effects,
-                scale_certainty_regression=scale_certainty_regression,
-                sample_instability=sample_instability,
-            )
-        )
-        _record_for_all(
-            connection,
-            bundle.snapshot_ids,
-            "report",
-            report_path,
-            report_name="v3_investigation",
-        )
-
+        contrasts = graph.value("contrasts")
+        _, matching_validation = graph.value("matching_tables")
         summary = {
             "snapshot_ids": bundle.snapshot_ids,
             "experiment_tags": bundle.experiment_tags,
             "contrast_count": len(contrasts),
             "matched_contrast_count": int(matching_validation["fully_matched"].sum()) if not matching_validation.empty else 0,
-            "figure_count": len(figure_paths),
-            "table_count": len(outputs),
+            "figure_count": len(node_state["figures"]["outputs"]),
+            "table_count": sum(len(node.tables) for node in graph.nodes.values()),
+            "nodes": {"rebuilt": rebuilt, "skipped": skipped},
+            "workers": workers,
+            "build_seconds": {name: round(seconds, 4) for name, seconds in sorted(graph.build_seconds.items())},
+            "reused_intermediates": graph.reused(),
         }
+        if derived_cache is not None:
+            summary["derived_cache"] = {
+                "path": str(derived_cache.path),
+                "hits": sorted(derived_cache.hits),
+                "misses": sorted(derived_cache.misses),
+            }
         summary_path = root / "summary.json"
         summary_path.write_text(json.dumps(summary, indent=2, sort_keys=True))
         _record_for_all(
@@ -348,12 +472,469 @@ def generate_v3_investigation(
             report_name="v3_investigation",
             metadata=summary,
         )
+        state_path.write_text(json.dumps({"nodes": node_state}, indent=2, sort_keys=True))
     finally:
         connection.close()
+        if derived_cache is not None:
+            derived_cache.close()
 
     return root
 
 
+def _investigation_sources(
+    *,
+    bundle: SnapshotBundle,
+    contract_path: str | None,
+    contrast_registry_path: str | None,
+    figures_manifest_path: str | None,
+    rubric_embedding_model: str | None,
+) -> dict[str, str | None]:
+    sources: dict[str, str | None] = {
+        f"bundle.{name}": _fingerprint({"table": name, "snapshot_ids": bundle.snapshot_ids})
+        for name in ["experiments", *BUNDLE_TABLES]
+    }
+    sources["contract"] = _fingerprint(
+        {
+            "contract": _file_digest(contract_path),
+            "contrast_registry": _file_digest(contrast_registry_path),
+        }
+    )
+    sources["figures_manifest"] = _fingerprint(
+        {"figures_manifest": _file_digest(_resolve_figures_manifest_path(figures_manifest_path))}
+    )
+    sources["rubric_embedding_model"] = (
+        _fingerprint({"model_name": rubric_embedding_model}) if rubric_embedding_model is not None else None
+    )
+    return sources
+
+
+def _fingerprint(payload: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _file_digest(path: str | Path | None) -> str | None:
+    if path is None or not Path(path).exists():
+        return None
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _investigation_nodes(
+    *,
+    bundle: SnapshotBundle,
+    contract_artifacts,
+    contract_path: str | None,
+    contrast_registry_path: str | None,
+    cache_db_path: str | None,
+    figures_manifest_path: str | None,
+    rubric_embedding_model: str,
+    rubric_embedding_encoder,
+    rubric_embedding_cache_path: str | Path | None,
+    tables_dir: Path,
+    figures_dir: Path,
+    root: Path,
+) -> list[InvestigationNode]:
+    def rubric_embedding_tables(graph: _InvestigationGraph) -> tuple[EmbeddingTable, EmbeddingTable, EmbeddingTable]:
+        tables = build_rubric_embedding_tables(
+            bundle,
+            model_name=rubric_embedding_model,
+            encoder=rubric_embedding_encoder,
+            cache_path=rubric_embedding_cache_path,
+        )
+        return tables["full"], tables["stage"], tables["criterion"]
+
+    def mining(graph: _InvestigationGraph) -> list[tuple[str, Path]]:
+        mining_output = mine_v3_findings(
+            contract_path=contract_path,
+            tables_dir=tables_dir,
+            contrast_registry_path=contrast_registry_path,
+        )
+        mining_paths = write_mining_summary(
+            mining_output,
+            output_dir=tables_dir,
+            markdown_name="mine_v3_summary.md",
+            findings_name="mine_v3_ranked_findings.csv",
+            summary_name="mine_v3_summary.json",
+        )
+        return [
+            ("table" if path.suffix == ".csv" else "report", path)
+            for path in mining_paths.values()
+        ]
+
+    def aggregation_sensitivity(graph: _InvestigationGraph) -> list[tuple[str, Path]]:
+        aggregation_outputs = run_aggregation_sensitivity(
+            contract_path=contract_path,
+            cache_db_path=cache_db_path,
+            tables_dir=tables_dir,
+        )
+        aggregation_paths = write_aggregation_sensitivity_outputs(
+            aggregation_outputs,
+            output_dir=tables_dir,
+        )
+        return [("table", path) for path in aggregation_paths.values()]
+
+    def figures(graph: _InvestigationGraph) -> list[tuple[str, Path]]:
+        rubric_experiment_similarity = graph.value("rubric_experiment_similarity")
+        scale_certainty_effects, _ = graph.value("scale_certainty_analysis")
+        paths = _write_figures(
+            bundle=bundle,
+            experiment_geometry=graph.value("experiment_geometry"),
+            experiment_metrics=graph.value("experiment_metrics"),
+            family_effects=graph.value("family_effects"),
+            rubric_experiment_similarity=rubric_experiment_similarity,
+            rubric_focus_similarity=graph.value("rubric_focus_similarity"),
+            rubric_stage_contrast_similarity=graph.value("rubric_stage_contrast_similarity"),
+            sample_instability=graph.value("sample_instability"),
+            sample_metrics=graph.value("sample_metrics"),
+            scale_certainty_effects=scale_certainty_effects,
+            bundle_verdict_profiles=graph.value("bundle_verdict_profiles"),
+            bundle_belief_tbm=graph.value("bundle_belief_tbm"),
+            bundle_belief_closed=graph.value("bundle_belief_closed_world"),
+            figures_dir=figures_dir,
+            figure_repair_plan=graph.value("figure_repair_plan"),
+        )
+        return [("figure", path) for path in paths]
+
+    def report(graph: _InvestigationGraph) -> list[tuple[str, Path]]:
+        _, matching_validation = graph.value("matching_tables")
+        _, scale_matching_validation = graph.value("scale_matching_tables")
+        scale_certainty_effects, scale_certainty_regression = graph.value("scale_certainty_analysis")
+        report_path = root / "report.md"
+        report_path.write_text(
+            _build_markdown_report(
+                bundle=bundle,
+                candidate_findings=graph.value("candidate_findings"),
+                experiment_distances=graph.value("experiment_distances"),
+                experiment_geometry=graph.value("experiment_geometry"),
+                experiment_metrics=graph.value("experiment_metrics"),
+                matching_validation=matching_validation,
+                family_effects=graph.value("family_effects"),
+                rubric_contrast_similarity=graph.value("rubric_contrast_similarity"),
+                rubric_focus_similarity=graph.value("rubric_focus_similarity"),
+                rubric_stage_contrast_similarity=graph.value("rubric_stage_contrast_similarity"),
+                scale_matching_validation=scale_matching_validation,
+                scale_certainty_effects=scale_certainty_effects,
+                scale_certainty_regression=scale_certainty_regression,
+                sample_instability=graph.value("sample_instability"),
+            )
+        )
+        return [("report", report_path)]
+
+    def table(name: str, inputs: tuple[str, ...], build: Callable[[_InvestigationGraph], Any], *tables: str) -> InvestigationNode:
+        return InvestigationNode(name, inputs, build, tables=tables or (f"{name}.csv",))
+
+    nodes = [
+        InvestigationNode(
+            "contrasts",
+            ("contract", "bundle.experiments"),
+            lambda graph: (
+                _build_family_contrasts_from_registry(contract_artifacts)
+                if contract_artifacts is not None
+                else _build_family_contrasts(bundle)
+            ),
+        ),
+        InvestigationNode(
+            "scale_contrasts",
+            ("contract", "bundle.experiments"),
+            lambda graph: (
+                _build_scale_size_contrasts_from_registry(contract_artifacts)
+                if contract_artifacts is not None
+                else _build_scale_size_contrasts(bundle)
+            ),
+        ),
+        InvestigationNode(
+            "figure_repair_plan",
+            ("figures_manifest",),
+            lambda graph: _load_figure_repair_plan(figures_manifest_path),
+            cached=False,
+        ),
+        InvestigationNode(
+            "sample_beliefs_tbm",
+            ("bundle.experiments", "bundle.responses"),
+            lambda graph: _build_belief_frame(bundle, closed_world=False),
+        ),
+        InvestigationNode(
+            "sample_beliefs_closed_world",
+            ("bundle.experiments", "bundle.responses"),
+            lambda graph: _build_belief_frame(bundle, closed_world=True),
+        ),
+        table(
+            "experiment_metrics",
+            (
+                "bundle.experiments",
+                "bundle.responses",
+                "bundle.rubrics",
+                "bundle.evidence",
+                "bundle.samples",
+                "sample_beliefs_tbm",
+                "sample_beliefs_closed_world",
+            ),
+            lambda graph: _build_experiment_metrics(
+                bundle,
+                tbm_beliefs=graph.value("sample_beliefs_tbm"),
+                closed_beliefs=graph.value("sample_beliefs_closed_world"),
+            ),
+        ),
+        table(
+            "experiment_geometry",
+            ("bundle.responses",),
+            lambda graph: _build_experiment_geometry(bundle),
+        ),
+        table(
+            "rubric_embedding_tables",
+            ("bundle.rubrics", "rubric_embedding_model"),
+            rubric_embedding_tables,
+            "rubric_embeddings.csv",
+            "rubric_stage_embeddings.csv",
+            "rubric_criterion_embeddings.csv",
+        ),
+        table(
+            "sample_metrics",
+            ("bundle.experiments", "bundle.responses", "sample_beliefs_tbm", "sample_beliefs_closed_world"),
+            lambda graph: _build_sample_metrics(
+                bundle,
+                tbm_beliefs=graph.value("sample_beliefs_tbm"),
+                closed_beliefs=graph.value("sample_beliefs_closed_world"),
+            ),
+        ),
+        table(
+            "matching_tables",
+            ("contrasts", "sample_metrics"),
+            lambda graph: _build_matching_tables(
+                bundle,
+                graph.value("contrasts"),
+                sample_metrics=graph.value("sample_metrics"),
+            ),
+            "matching_details.csv",
+            "matching_validation.csv",
+        ),
+        table(
+            "rubric_experiment_similarity",
+            ("rubric_embedding_tables",),
+            lambda graph: _build_rubric_experiment_similarity(graph.value("rubric_embedding_tables")[0]),
+        ),
+        table(
+            "rubric_experiment_clusters",
+            ("rubric_experiment_similarity",),
+            lambda graph: _build_rubric_experiment_clusters(graph.value("rubric_experiment_similarity")),
+        ),
+        table(
+            "rubric_focus_similarity",
+            ("rubric_experiment_similarity", "bundle.experiments"),
+            lambda graph: _build_rubric_focus_similarity(
+                rubric_experiment_similarity=graph.value("rubric_experiment_similarity"),
+                bundle=bundle,
+            ),
+        ),
+        table(
+            "rubric_focus_clusters",
+            ("rubric_focus_similarity",),
+            lambda graph: _build_rubric_experiment_clusters(graph.value("rubric_focus_similarity")),
+        ),
+        table(
+            "rubric_contrast_similarity",
+            ("rubric_embedding_tables", "matching_tables", "contrasts"),
+            lambda graph: _build_rubric_contrast_similarity(
+                rubric_embeddings=graph.value("rubric_embedding_tables")[0],
+                contrasts=graph.value("contrasts"),
+                matching_details=graph.value("matching_tables")[0],
+            ),
+        ),
+        table(
+            "rubric_stage_contrast_similarity",
+            ("rubric_embedding_tables", "matching_tables", "contrasts"),
+            lambda graph: _build_rubric_stage_contrast_similarity(
+                rubric_stage_embeddings=graph.value("rubric_embedding_tables")[1],
+                contrasts=graph.value("contrasts"),
+                matching_details=graph.value("matching_tables")[0],
+            ),
+        ),
+        table(
+            "evidence_metrics",
+            ("bundle.responses",),
+            lambda graph: _build_evidence_metrics(bundle),
+        ),
+        table(
+            "scale_matching_tables",
+            ("scale_contrasts", "sample_metrics"),
+            lambda graph: _build_matching_tables(
+                bundle,
+                graph.value("scale_contrasts"),
+                sample_metrics=graph.value("sample_metrics"),
+            ),
+            "scale_matching_details.csv",
+            "scale_matching_validation.csv",
+        ),
+        table(
+            "scale_certainty_analysis",
+            ("bundle.experiments", "bundle.responses", "sample_metrics", "scale_matching_tables", "scale_contrasts"),
+            lambda graph: _build_scale_certainty_analysis(
+                bundle=bundle,
+                sample_metrics=graph.value("sample_metrics"),
+                matching_details=graph.value("scale_matching_tables")[0],
+                contrasts=graph.value("scale_contrasts"),
+            ),
+            "scale_certainty_effects.csv",
+            "scale_certainty_regression.csv",
+        ),
+        table(
+            "contrast_registry",
+            ("contrasts",),
+            lambda graph: _build_contrast_registry_frame(graph.value("contrasts")),
+        ),
+        table(
+            "family_pair_deltas",
+            ("sample_metrics", "matching_tables", "contrasts"),
+            lambda graph: _build_family_pair_deltas(
+                graph.value("sample_metrics"),
+                graph.value("matching_tables")[0],
+                graph.value("contrasts"),
+            ),
+        ),
+        table(
+            "family_effects",
+            ("family_pair_deltas",),
+            lambda graph: _build_family_effects(graph.value("family_pair_deltas")),
+        ),
+        table(
+            "family_effects_qvalues",
+            ("family_effects",),
+            lambda graph: _build_family_effects_qvalues(graph.value("family_effects")),
+        ),
+        table(
+            "sample_instability",
+            ("sample_metrics",),
+            lambda graph: _build_sample_instability(graph.value("sample_metrics")),
+        ),
+        table(
+            "experiment_distances",
+            ("experiment_metrics",),
+            lambda graph: _build_experiment_distances(graph.value("experiment_metrics")),
+        ),
+        table(
+            "bundle_verdict_profiles",
+            ("bundle.experiments", "bundle.responses", "bundle.response_items"),
+            lambda graph: _build_bundle_verdict_profiles(bundle),
+        ),
+        table(
+            "bundle_belief_tbm",
+            ("bundle.experiments", "bundle.responses", "bundle.response_items"),
+            lambda graph: _build_bundle_belief_profiles(bundle, closed_world=False),
+        ),
+        table(
+            "bundle_belief_closed_world",
+            ("bundle.experiments", "bundle.responses", "bundle.response_items"),
+            lambda graph: _build_bundle_belief_profiles(bundle, closed_world=True),
+        ),
+        table(
+            "verdict_geometry_certainty",
+            ("bundle.responses",),
+            lambda graph: _build_verdict_geometry_certainty(bundle),
+        ),
+        table(
+            "bundle_policy_deltas",
+            ("family_effects",),
+            lambda graph: _build_bundle_policy_deltas(graph.value("family_effects")),
+        ),
+        table(
+            "robust_summary_panel",
+            ("bundle.experiments", "bundle.responses"),
+            lambda graph: _build_robust_summary_panel(bundle),
+        ),
+        table(
+            "candidate_findings",
+            (
+                "experiment_metrics",
+                "experiment_geometry",
+                "family_effects",
+                "rubric_contrast_similarity",
+                "scale_certainty_analysis",
+                "sample_instability",
+            ),
+            lambda graph: _build_candidate_findings(
+                experiment_metrics=graph.value("experiment_metrics"),
+                experiment_geometry=graph.value("experiment_geometry"),
+                family_effects=graph.value("family_effects"),
+                rubric_contrast_similarity=graph.value("rubric_contrast_similarity"),
+                scale_certainty_effects=graph.value("scale_certainty_analysis")[0],
+                sample_instability=graph.value("sample_instability"),
+            ),
+        ),
+    ]
+    if contract_path is not None:
+        nodes.extend(
+            [
+                InvestigationNode(
+                    "mining",
+                    (
+                        "contract",
+                        "family_effects_qvalues",
+                        "candidate_findings",
+                        "sample_instability",
+                        "family_pair_deltas",
+                    ),
+                    mining,
+                    artifact=True,
+                    cached=False,
+                ),
+                InvestigationNode(
+                    "aggregation_sensitivity",
+                    ("contract", "bundle.responses", "contrast_registry"),
+                    aggregation_sensitivity,
+                    artifact=True,
+                    cached=False,
+                ),
+            ]
+        )
+    nodes.extend(
+        [
+            InvestigationNode(
+                "figures",
+                (
+                    "bundle.experiments",
+                    "figure_repair_plan",
+                    "experiment_geometry",
+                    "experiment_metrics",
+                    "family_effects",
+                    "rubric_experiment_similarity",
+                    "rubric_focus_similarity",
+                    "rubric_stage_contrast_similarity",
+                    "sample_instability",
+                    "sample_metrics",
+                    "scale_certainty_analysis",
+                    "bundle_verdict_profiles",
+                    "bundle_belief_tbm",
+                    "bundle_belief_closed_world",
+                ),
+                figures,
+                artifact=True,
+                cached=False,
+            ),
+            InvestigationNode(
+                "report",
+                (
+                    "bundle.experiments",
+                    "candidate_findings",
+                    "experiment_distances",
+                    "experiment_geometry",
+                    "experiment_metrics",
+                    "matching_tables",
+                    "family_effects",
+                    "rubric_contrast_similarity",
+                    "rubric_focus_similarity",
+                    "rubric_stage_contrast_similarity",
+                    "scale_matching_tables",
+                    "scale_certainty_analysis",
+                    "sample_instability",
+                ),
+                report,
+                artifact=True,
+                cached=False,
+            ),
+        ]
+    )
+    return nodes
+
+
 def _build_family_contrasts(bundle: SnapshotBundle) -> list[FamilyContrast]:
     contrasts: list[FamilyContrast] = []
     groups = family_groups_for_tags(bundle.experiment_tags)
@@ -560,11 +1141,21 @@ def _build_scale_size_contrasts(bundle: SnapshotBundle) -> list[FamilyContrast]:
     return sorted(contrasts, key=lambda contrast: contrast.contrast_id)
 
 
-def _build_sample_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
-    responses = bundle.responses.copy()
+def _build_sample_metrics(
+    bundle: SnapshotBundle,
+    *,
+    tbm_beliefs: pd.DataFrame | None = None,
+    closed_beliefs: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    responses = bundle.responses.reset_index(drop=True)
     responses["family_slug"] = responses["experiment_tag"].apply(family_slug_from_tag)
-    responses["expected_stage"] = responses["decoded_scores"].apply(_expected_stage)
-    responses["is_singleton"] = responses["decoded_scores"].apply(lambda scores: len(scores) == 1)
+    responses["expected_stage"] = list_cells(responses["decoded_scores"]).apply(_expected_stage)
+    responses["is_singleton"] = list_lengths(responses["decoded_scores"]).eq(1)
+    responses["window_ids"] = list_cells(responses["window_ids"])
+    verdicts = _response_verdicts(
+        responses,
+        responses["experiment_tag"].map(lambda tag: int(bundle.experiments[tag]["scale_size"])).to_numpy(),
+    )
 
     sample_rows: list[dict[str, object]] = []
     for (tag, sample_ordinal), group in responses.groupby(["experiment_tag", "sample_ordinal"], dropna=False):
@@ -574,7 +1165,7 @@ def _build_sample_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
         bundle_signature = _signature(group["bundle_signature"].astype(str).tolist())
         window_signature = _signature(_flatten(group["window_ids"]))
         scale_size = int(experiment["scale_size"])
-        stage_distribution = _mean_stage_distribution(non_abstain["decoded_scores"], scale_size)
+        stage_distribution = _mean_stage_distribution(verdicts, group.index.to_numpy(), scale_size)
         sample_rows.append(
             {
                 "experiment_tag": tag,
@@ -601,8 +1192,8 @@ def _build_sample_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
         )
 
     sample_metrics = pd.DataFrame(sample_rows)
-    tbm = _build_belief_frame(bundle, closed_world=False)
-    closed = _build_belief_frame(bundle, closed_world=True)
+    tbm = tbm_beliefs if tbm_beliefs is not None else _build_belief_frame(bundle, closed_world=False)
+    closed = closed_beliefs if closed_beliefs is not None else _build_belief_frame(bundle, closed_world=True)
     if not tbm.empty:
         tbm = tbm.rename(
             columns={
@@ -641,49 +1232,39 @@ def _build_sample_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
 
 
 def _build_experiment_geometry(bundle: SnapshotBundle) -> pd.DataFrame:
-    responses = bundle.responses.copy()
-    global_stage_labels = list(range(1, int(pd.to_numeric(responses["scale_size"], errors="coerce").max()) + 1))
+    responses = bundle.responses.reset_index(drop=True)
+    scale_sizes = pd.to_numeric(responses["scale_size"], errors="coerce").astype(int).to_numpy()
+    verdicts = _response_verdicts(responses, scale_sizes)
+    global_stage_labels = list(range(1, verdicts.probabilities.shape[1] + 1))
     rows: list[dict[str, object]] = []
 
     for tag, group in responses.groupby("experiment_tag", dropna=False):
-        experiment_stage_labels = list(range(1, int(pd.to_numeric(group["scale_size"], errors="coerce").max()) + 1))
-        stage_masses = {f"mass_stage_{stage}": 0.0 for stage in global_stage_labels}
-        abstain_mass = 0.0
         response_count = int(len(group))
         if response_count == 0:
             continue
+        positions = group.index.to_numpy()
+        experiment_scale = int(scale_sizes[positions].max())
+        stage_masses = verdicts.probabilities[positions].sum(axis=0) / response_count
+        abstain_mass = float(verdicts.abstained[positions].sum()) / response_count
 
-        for row in group.itertuples():
-            decoded_scores = list(row.decoded_scores)
-            if bool(row.abstained) or not decoded_scores:
-                abstain_mass += 1.0
-                continue
-            weight = 1.0 / len(decoded_scores)
-            for stage in decoded_scores:
-                stage_masses[f"mass_stage_{int(stage)}"] += weight
-
-        abstain_mass /= response_count
-        for key in list(stage_masses):
-            stage_masses[key] /= response_count
-
-        stage_distribution = np.array([stage_masses[f"mass_stage_{stage}"] for stage in experiment_stage_labels], dtype=float)
+        stage_distribution = stage_masses[:experiment_scale]
         positive = stage_distribution[stage_distribution > 0]
         if len(positive) == 0:
             stage_entropy = 0.0
         else:
-            stage_entropy = float(-(positive * np.log2(positive)).sum() / np.log2(len(experiment_stage_labels)))
+            stage_entropy = float(-(positive * np.log2(positive)).sum() / np.log2(experiment_scale))
 
-        if len(experiment_stage_labels) <= 2:
+        if experiment_scale <= 2:
             mid_scale_mass = 0.0
         else:
-            mid_scale_mass = float(sum(stage_masses[f"mass_stage_{stage}"] for stage in experiment_stage_labels[1:-1]))
+            mid_scale_mass = float(stage_distribution[1:-1].sum())
 
         rows.append(
             {
                 "experiment_tag": tag,
                 "family_slug": family_slug_from_tag(tag),
                 "abstain_mass": float(abstain_mass),
-                **stage_masses,
+                **{f"mass_stage_{stage}": float(stage_masses[stage - 1]) for stage in global_stage_labels},
                 "mid_scale_mass": mid_scale_mass,
                 "stage_entropy": stage_entropy,
             }
@@ -695,8 +1276,9 @@ def _build_experiment_geometry(bundle: SnapshotBundle) -> pd.DataFrame:
 def _build_evidence_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
     responses = bundle.responses.copy()
     responses["family_slug"] = responses["experiment_tag"].apply(family_slug_from_tag)
-    responses["expected_stage"] = responses["decoded_scores"].apply(_expected_stage)
-    responses["is_singleton"] = responses["decoded_scores"].apply(lambda scores: len(scores) == 1)
+    responses["expected_stage"] = list_cells(responses["decoded_scores"]).apply(_expected_stage)
+    responses["is_singleton"] = list_lengths(responses["decoded_scores"]).eq(1)
+    responses["window_ids"] = list_cells(responses["window_ids"])
 
     rows: list[dict[str, object]] = []
     for (tag, sample_ordinal, bundle_signature), group in responses.groupby(
@@ -811,6 +1393,7 @@ def _build_bundle_verdict_profiles(bundle: SnapshotBundle) -> pd.DataFrame:
         ]
     )
     responses["family_slug"] = responses["experiment_tag"].apply(family_slug_from_tag)
+    responses["decoded_scores"] = list_cells(responses["decoded_scores"])
     responses["verdict_label"] = responses.apply(_verdict_label, axis=1)
     responses = responses.merge(
         metadata,
@@ -831,7 +1414,7 @@ def _build_bundle_verdict_profiles(bundle: SnapshotBundle) -> pd.DataFrame:
         )
     if "bundle_size" not in responses.columns:
         if "evidence_ids" in responses.columns:
-            responses["bundle_size"] = responses["evidence_ids"].apply(lambda values: len(values) if isinstance(values, list) else 1)
+            responses["bundle_size"] = list_lengths(responses["evidence_ids"], default=1)
         else:
             responses["bundle_size"] = 1
     else:
@@ -921,7 +1504,7 @@ def _build_bundle_belief_profiles(bundle: SnapshotBundle, *, closed_world: bool)
         )
     if "bundle_size" not in responses.columns:
         if "evidence_ids" in responses.columns:
-            responses["bundle_size"] = responses["evidence_ids"].apply(lambda values: len(values) if isinstance(values, list) else 1)
+            responses["bundle_size"] = list_lengths(responses["evidence_ids"], default=1)
         else:
             responses["bundle_size"] = 1
     else:
@@ -939,44 +1522,37 @@ def _build_bundle_belief_profiles(bundle: SnapshotBundle, *, closed_world: bool)
             responses.groupby(["experiment_tag", "bundle_signature"], dropna=False).ngroup() + 1
         )
 
-    rows: list[dict[str, object]] = []
-    for (experiment_tag, bundle_signature), group in responses.groupby(
-        ["experiment_tag", "bundle_signature"],
-        dropna=False,
-    ):
-        scale_size = int(pd.to_numeric(group["scale_size"], errors="coerce").max())
-        if scale_size <= 0:
-            continue
-        theta = frozenset(range(1, scale_size + 1))
-        stage_masses: dict[int, list[tuple[float, float]]] = {stage: [] for stage in range(1, scale_size + 1)}
-        included = 0
-        for row in group.itertuples():
-            mass = _response_to_mass(pd.Series(row._asdict()), theta, closed_world=closed_world)
-            if mass is None:
-                continue
-            pign = mass.pignistic()
-            weight = (
-                float(getattr(row, "rubric_observability_score", 1.0) or 1.0)
-                * float(getattr(row, "rubric_discriminability_score", 1.0) or 1.0)
-            )
-            if not math.isfinite(weight) or weight <= 0:
-                weight = 1.0
-            included += 1
-            for stage in range(1, scale_size + 1):
-                stage_masses[stage].append((float(pign.get(frozenset([stage]), 0.0)), weight))
+    grouped = responses.groupby(["experiment_tag", "bundle_signature"], dropna=False)
+    group_ids = grouped.ngroup().to_numpy()
+    scale_sizes = pd.to_numeric(responses["scale_size"], errors="coerce").groupby(group_ids).max().astype(int)
+    row_scales = scale_sizes.to_numpy()[group_ids]
+    weight_sums = np.zeros(grouped.ngroups, dtype=float)
+    counts = np.zeros(grouped.ngroups, dtype=np.int64)
+    betp_sums: dict[int, np.ndarray] = {}
+    for scale_size in sorted(set(scale_sizes[scale_sizes > 0])):
+        in_scale = row_scales == scale_size
+        subset = responses[in_scale]
+        keep, focal_masks, support = _response_simple_supports(subset, scale_size, closed_world=closed_world)
+        ids = group_ids[in_scale][keep]
+        betp = pignistic(simple_support_masses(focal_masks[keep], support[keep], scale_size))
+        weights = (
+            _or_one(subset, "rubric_observability_score") * _or_one(subset, "rubric_discriminability_score")
+        )[keep]
+        weights = np.where(np.isfinite(weights) & (weights > 0), weights, 1.0)
+        counts += np.bincount(ids, minlength=grouped.ngroups)
+        weight_sums += np.bincount(ids, weights=weights, minlength=grouped.ngroups)
+        betp_sums[scale_size] = np.column_stack(
+            [np.bincount(ids, weights=betp[:, stage] * weights, minlength=grouped.ngroups) for stage in range(scale_size)]
+        )
 
-        if included == 0:
+    rows: list[dict[str, object]] = []
+    for group_id, ((experiment_tag, bundle_signature), group) in enumerate(grouped):
+        scale_size = int(scale_sizes.iloc[group_id])
+        if scale_size <= 0 or counts[group_id] == 0:
             continue
         exemplar = group.iloc[0]
+        mean_betp = betp_sums[scale_size][group_id] / weight_sums[group_id]
         for stage in range(1, scale_size + 1):
-            values = np.array([value for value, _ in stage_masses[stage]], dtype=float)
-            weights = np.array([weight for _, weight in stage_masses[stage]], dtype=float)
-            if len(values) == 0:
-                mean_betp = float("nan")
-            elif np.nansum(weights) <= 0:
-                mean_betp = float(np.nanmean(values))
-            else:
-                mean_betp = float(np.average(values, weights=weights))
             rows.append(
                 {
                     "method": "closed_world" if closed_world else "tbm",
@@ -991,8 +1567,8 @@ def _build_bundle_belief_profiles(bundle: SnapshotBundle, *, closed_world: bool)
                     "bundle_size": int(exemplar["bundle_size"]),
                     "cluster_id": exemplar["cluster_id"],
                     "stage": stage,
-                    "mean_betP": mean_betp,
-                    "n_responses": included,
+                    "mean_betP": float(mean_betp[stage - 1]),
+                    "n_responses": int(counts[group_id]),
                 }
             )
     return pd.DataFrame(rows).sort_values(
@@ -1042,140 +1618,112 @@ def _comparison_groups(experiment_metrics: pd.DataFrame) -> list[tuple[tuple[int
     return sorted(groups, key=lambda item: item[0])
 
 
-def _build_rubric_experiment_similarity(rubric_embeddings: pd.DataFrame) -> pd.DataFrame:
+def _build_rubric_experiment_similarity(rubric_embeddings: EmbeddingTable) -> pd.DataFrame:
     if rubric_embeddings.empty:
         return pd.DataFrame()
-    vectors_by_experiment: dict[str, np.ndarray] = {}
-    for experiment_tag, group in rubric_embeddings.groupby("experiment_tag", dropna=False):
-        vectors = np.vstack(group["vector_json"].apply(vector_from_json).tolist())
-        centroid = vectors.mean(axis=0)
-        norm = float(np.linalg.norm(centroid))
-        if norm > 0:
-            centroid = centroid / norm
-        vectors_by_experiment[str(experiment_tag)] = centroid
-
-    rows: list[dict[str, object]] = []
-    tags = sorted(vectors_by_experiment)
-    for left in tags:
-        for right in tags:
-            rows.append(
-                {
-                    "experiment_a": left,
-                    "experiment_b": right,
-                    "cosine_similarity": float(np.dot(vectors_by_experiment[left], vectors_by_experiment[right])),
-                }
-            )
-    return pd.DataFrame(rows).sort_values(["experiment_a", "experiment_b"]).reset_index(drop=True)
+    groups = rubric_embeddings.rows.groupby(rubric_embeddings.rows["experiment_tag"].astype(str)).indices
+    tags = np.array(sorted(groups), dtype=object)
+    similarity = centroid_cosine_similarity(rubric_embeddings.vectors, [groups[tag] for tag in tags])
+    return pd.DataFrame(
+        {
+            "experiment_a": np.repeat(tags, len(tags)),
+            "experiment_b": np.tile(tags, len(tags)),
+            "cosine_similarity": similarity.ravel(),
+        }
+    )
 
 
 def _build_rubric_contrast_similarity(
     *,
-    rubric_embeddings: pd.DataFrame,
+    rubric_embeddings: EmbeddingTable,
     contrasts: list[FamilyContrast],
     matching_details: pd.DataFrame,
 ) -> pd.DataFrame:
     if rubric_embeddings.empty or matching_details.empty:
         return pd.DataFrame()
-    index = rubric_embeddings.set_index(["experiment_tag", "sample_ordinal"])
-    rows: list[dict[str, object]] = []
-    for contrast in contrasts:
-        detail = matching_details[
-            (matching_details["contrast_id"] == contrast.contrast_id)
-            & (matching_details["comparable_sample"])
-        ]
-        cosine_values: list[float] = []
-        for _, match_row in detail.iterrows():
-            ordinal = int(match_row["sample_ordinal"])
-            try:
-                left = index.loc[(contrast.baseline_tag, ordinal)]
-                right = index.loc[(contrast.variant_tag, ordinal)]
-            except KeyError:
-                continue
-            left_vec = vector_from_json(str(left["vector_json"]))
-            right_vec = vector_from_json(str(right["vector_json"]))
-            cosine = float(np.dot(left_vec, right_vec))
-            cosine_values.append(cosine)
-            rows.append(
-                {
-                    "contrast_id": contrast.contrast_id,
-                    "family_slug": contrast.family_slug,
-                    "sample_ordinal": ordinal,
-                    "baseline_tag": contrast.baseline_tag,
-                    "variant_tag": contrast.variant_tag,
-                    "cosine_similarity": cosine,
-                }
-            )
-
-        if cosine_values:
-            rows.append(
-                {
-                    "contrast_id": contrast.contrast_id,
-                    "family_slug": contrast.family_slug,
-                    "sample_ordinal": -1,
-                    "baseline_tag": contrast.baseline_tag,
-                    "variant_tag": contrast.variant_tag,
-                    "cosine_similarity": float(np.mean(cosine_values)),
-                }
-            )
-
-    result = pd.DataFrame(rows)
-    if result.empty:
-        return result
-    return result.sort_values(["contrast_id", "sample_ordinal"]).reset_index(drop=True)
+    pairs = _contrast_embedding_pairs(
+        rubric_embeddings,
+        _comparable_contrast_samples(contrasts, matching_details),
+        key_columns=["sample_ordinal"],
+    )
+    if pairs.empty:
+        return pd.DataFrame()
+    means = pairs.groupby(
+        ["contrast_id", "family_slug", "baseline_tag", "variant_tag"],
+        sort=False,
+    )["cosine_similarity"].mean().reset_index()
+    means["sample_ordinal"] = -1
+    columns = ["contrast_id", "family_slug", "sample_ordinal", "baseline_tag", "variant_tag", "cosine_similarity"]
+    return pd.concat([pairs[columns], means[columns]], ignore_index=True).sort_values(
+        ["contrast_id", "sample_ordinal"],
+    ).reset_index(drop=True)
 
 
 def _build_rubric_stage_contrast_similarity(
     *,
-    rubric_stage_embeddings: pd.DataFrame,
+    rubric_stage_embeddings: EmbeddingTable,
     contrasts: list[FamilyContrast],
     matching_details: pd.DataFrame,
 ) -> pd.DataFrame:
     if rubric_stage_embeddings.empty or matching_details.empty:
         return pd.DataFrame()
-    index = rubric_stage_embeddings.set_index(["experiment_tag", "sample_ordinal", "stage_number"])
-    rows: list[dict[str, object]] = []
-    for contrast in contrasts:
-        detail = matching_details[
-            (matching_details["contrast_id"] == contrast.contrast_id)
-            & (matching_details["comparable_sample"])
-        ]
-        values_by_stage: dict[int, list[float]] = {}
-        for _, match_row in detail.iterrows():
-            ordinal = int(match_row["sample_ordinal"])
-            for stage_number in sorted(rubric_stage_embeddings["stage_number"].dropna().unique().tolist()):
-                key_left = (contrast.baseline_tag, ordinal, int(stage_number))
-                key_right = (contrast.variant_tag, ordinal, int(stage_number))
-                if key_left not in index.index or key_right not in index.index:
-                    continue
-                left = index.loc[key_left]
-                right = index.loc[key_right]
-                left_vec = vector_from_json(str(left["vector_json"]))
-                right_vec = vector_from_json(str(right["vector_json"]))
-                cosine = float(np.dot(left_vec, right_vec))
-                values_by_stage.setdefault(int(stage_number), []).append(cosine)
-                rows.append(
-                    {
-                        "contrast_id": contrast.contrast_id,
-                        "family_slug": contrast.family_slug,
-                        "sample_ordinal": ordinal,
-                        "stage_number": int(stage_number),
-                        "cosine_similarity": cosine,
-                    }
-                )
-        for stage_number, values in sorted(values_by_stage.items()):
-            rows.append(
-                {
-                    "contrast_id": contrast.contrast_id,
-                    "family_slug": contrast.family_slug,
-                    "sample_ordinal": -1,
-                    "stage_number": stage_number,
-                    "cosine_similarity": float(np.mean(values)),
-                }
-            )
-    result = pd.DataFrame(rows)
-    if result.empty:
-        return result
-    return result.sort_values(["contrast_id", "stage_number", "sample_ordinal"]).reset_index(drop=True)
+    stage_numbers = pd.DataFrame(
+        {"stage_number": np.sort(rubric_stage_embeddings.rows["stage_number"].dropna().unique()).astype(int)}
+    )
+    pairs = _contrast_embedding_pairs(
+        rubric_stage_embeddings,
+        _comparable_contrast_samples(contrasts, matching_details).merge(stage_numbers, how="cross"),
+        key_columns=["sample_ordinal", "stage_number"],
+    )
+    if pairs.empty:
+        return pd.DataFrame()
+    means = pairs.groupby(
+        ["contrast_id", "family_slug", "stage_number"],
+        sort=False,
+    )["cosine_similarity"].mean().reset_index()
+    means["sample_ordinal"] = -1
+    columns = ["contrast_id", "family_slug", "sample_ordinal", "stage_number", "cosine_similarity"]
+    return pd.concat([pairs[columns], means[columns]], ignore_index=True).sort_values(
+        ["contrast_id", "stage_number", "sample_ordinal"],
+    ).reset_index(drop=True)
+
+
+def _comparable_contrast_samples(
+    contrasts: list[FamilyContrast],
+    matching_details: pd.DataFrame,
+) -> pd.DataFrame:
+    contrast_frame = pd.DataFrame(
+        [
+            (contrast.contrast_id, contrast.family_slug, contrast.baseline_tag, contrast.variant_tag)
+            for contrast in contrasts
+        ],
+        columns=["contrast_id", "family_slug", "baseline_tag", "variant_tag"],
+    )
+    comparable = matching_details.loc[
+        matching_details["comparable_sample"].astype(bool),
+        ["contrast_id", "sample_ordinal"],
+    ].astype({"sample_ordinal": int})
+    return contrast_frame.merge(comparable, on="contrast_id")
+
+
+def _contrast_embedding_pairs(
+    embeddings: EmbeddingTable,
+    samples: pd.DataFrame,
+    *,
+    key_columns: list[str],
+) -> pd.DataFrame:
+    if samples.empty:
+        return samples.assign(cosine_similarity=pd.Series(dtype=float))
+    left = embeddings.positions(
+        samples[["baseline_tag", *key_columns]].rename(columns={"baseline_tag": "experiment_tag"})
+    )
+    right = embeddings.positions(
+        samples[["variant_tag", *key_columns]].rename(columns={"variant_tag": "experiment_tag"})
+    )
+    found = (left >= 0) & (right >= 0)
+    pairs = samples.loc[found].reset_index(drop=True)
+    pairs["cosine_similarity"] = paired_cosine_similarity(embeddings.vectors, left[found], right[found])
+    return pairs
 
 
 def _build_rubric_experiment_clusters(rubric_experiment_similarity: pd.DataFrame) -> pd.DataFrame:
@@ -1442,8 +1990,11 @@ def _build_scale_certainty_analysis(
 def _build_matching_tables(
     bundle: SnapshotBundle,
     contrasts: list[FamilyContrast],
+    *,
+    sample_metrics: pd.DataFrame | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    sample_metrics = _build_sample_metrics(bundle)
+    if sample_metrics is None:
+        sample_metrics = _build_sample_metrics(bundle)
     detail_rows: list[dict[str, object]] = []
     summary_rows: list[dict[str, object]] = []
 
@@ -1632,6 +2183,7 @@ def _build_verdict_geometry_certainty(bundle: SnapshotBundle) -> pd.DataFrame:
     if responses.empty:
         return pd.DataFrame()
     responses["family_slug"] = responses["experiment_tag"].apply(family_slug_from_tag)
+    responses["decoded_scores"] = list_cells(responses["decoded_scores"])
     responses["verdict_label"] = responses.apply(_verdict_label, axis=1)
     responses["geometry_bucket"] = responses.apply(
         lambda row: _verdict_geometry_bucket(
@@ -1688,7 +2240,7 @@ def _build_robust_summary_panel(bundle: SnapshotBundle) -> pd.DataFrame:
     if responses.empty:
         return pd.DataFrame()
     responses["family_slug"] = responses["experiment_tag"].apply(family_slug_from_tag)
-    responses["expected_stage"] = responses["decoded_scores"].apply(_expected_stage)
+    responses["expected_stage"] = list_cells(responses["decoded_scores"]).apply(_expected_stage)
     non_abstain = responses[~responses["abstained"]].copy()
 
     rows: list[dict[str, object]] = []
@@ -1921,12 +2473,17 @@ def _build_candidate_findings(
     return pd.DataFrame(rows).sort_values("score", ascending=False).reset_index(drop=True)
 
 
-def _load_figure_repair_plan(figures_manifest_path: str | None) -> dict[str, tuple[str, ...]]:
+def _resolve_figures_manifest_path(figures_manifest_path: str | None) -> Path | None:
     candidate = figures_manifest_path or "_blueprints/v3-analysis-process/figures_manifest.json"
     manifest_path = Path(candidate)
     if not manifest_path.exists():
         manifest_path = Path(__file__).resolve().parents[4] / candidate
-    if not manifest_path.exists():
+    return manifest_path if manifest_path.exists() else None
+
+
+def _load_figure_repair_plan(figures_manifest_path: str | None) -> dict[str, tuple[str, ...]]:
+    manifest_path = _resolve_figures_manifest_path(figures_manifest_path)
+    if manifest_path is None:
         return {}
     try:
         manifest = load_figure_manifest(manifest_path)
@@ -3211,21 +3768,22 @@ def _expected_stage(decoded_scores: list[int]) -> float:
     return float(np.mean(decoded_scores))
 
 
-def _mean_stage_distribution(verdicts: Iterable[list[int]], scale_size: int) -> np.ndarray:
-    distribution = np.zeros(scale_size, dtype=float)
-    count = 0
-    for verdict in verdicts:
-        stages = [int(value) for value in verdict if value]
-        if not stages:
-            continue
-        weight = 1.0 / len(stages)
-        for stage in stages:
-            if 1 <= stage <= scale_size:
-                distribution[stage - 1] += weight
-        count += 1
-    if count == 0:
-        return distribution
-    return distribution / count
+def _response_verdicts(responses: pd.DataFrame, scale_sizes: np.ndarray) -> VerdictMatrix:
+    abstained = responses["abstained"].to_numpy(dtype=bool)
+    if "verdict_mask" in responses.columns and responses["verdict_mask"].notna().all():
+        return verdict_matrix_from_masks(
+            responses["verdict_mask"].to_numpy(dtype=np.int64),
+            scale_sizes,
+            abstained=abstained,
+        )
+    return build_verdict_matrix(list_cells(responses["decoded_scores"]), scale_sizes, abstained=abstained)
+
+
+def _mean_stage_distribution(verdicts: VerdictMatrix, positions: np.ndarray, scale_size: int) -> np.ndarray:
+    answered = positions[~verdicts.abstained[positions]]
+    if len(answered) == 0:
+        return np.zeros(scale_size, dtype=float)
+    return verdicts.probabilities[answered, :scale_size].mean(axis=0)
 
 
 def _mid_scale_mass(distribution: np.ndarray) -> float:
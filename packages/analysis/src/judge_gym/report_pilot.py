@@ -15,10 +15,10 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 import statsmodels.formula.api as smf
-from pyds import MassFunction
 
 from .cache import connect_cache, record_artifact
-from .datasets import SnapshotBundle, load_snapshot_bundle
+from .datasets import SnapshotBundle, list_cells, list_lengths, load_snapshot_bundle
+from .dempster_shafer import combine_simple_support_groups, pignistic, simple_support_masses, stage_mask, theta_mask
 
 FAMILY_LABELS = {
     "a1": "abstain_toggle",
@@ -401,12 +401,22 @@ def _write_overview_report(bundle: SnapshotBundle, root: Path, connection) -> No
     )
 
 
-def _build_experiment_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
+def _build_experiment_metrics(
+    bundle: SnapshotBundle,
+    *,
+    tbm_beliefs: pd.DataFrame | None = None,
+    closed_beliefs: pd.DataFrame | None = None,
+) -> pd.DataFrame:
     responses = bundle.responses.copy()
+    responses["decoded_scores"] = list_cells(responses["decoded_scores"])
     rubrics = bundle.rubrics.copy()
 
-    tbm_conflict = _belief_conflict_by_tag(bundle, closed_world=False)
-    closed_conflict = _belief_conflict_by_tag(bundle, closed_world=True)
+    tbm_conflict = _belief_conflict_by_tag(
+        tbm_beliefs if tbm_beliefs is not None else _build_belief_frame(bundle, closed_world=False)
+    )
+    closed_conflict = _belief_conflict_by_tag(
+        closed_beliefs if closed_beliefs is not None else _build_belief_frame(bundle, closed_world=True)
+    )
 
     rows: list[dict[str, object]] = []
     for tag in bundle.experiment_tags:
@@ -435,7 +445,7 @@ def _build_experiment_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
                 "sample_rows": int(len(bundle.samples[bundle.samples["experiment_tag"] == tag])),
                 "unique_bundle_count": int(response_rows["bundle_label"].nunique()),
                 "abstain_rate": _safe_mean(response_rows["abstained"]),
-                "singleton_rate": _safe_mean(non_abstain["decoded_scores"].apply(len).eq(1)),
+                "singleton_rate": _safe_mean(list_lengths(non_abstain["decoded_scores"]).eq(1)),
                 "mean_subset_size": _safe_mean(non_abstain["subset_size"]),
                 "mean_score_expert_agreement_prob": _safe_mean(response_rows["score_expert_agreement_prob"]),
                 "mean_rubric_observability_score": _safe_mean(rubric_rows["observability_score"]),
@@ -448,85 +458,57 @@ def _build_experiment_metrics(bundle: SnapshotBundle) -> pd.DataFrame:
     return pd.DataFrame(rows).sort_values(["family_slug", "experiment_tag"]).reset_index(drop=True)
 
 
-def _belief_conflict_by_tag(bundle: SnapshotBundle, *, closed_world: bool) -> pd.Series:
-    belief_df = _build_belief_frame(bundle, closed_world=closed_world)
+def _belief_conflict_by_tag(belief_df: pd.DataFrame) -> pd.Series:
     if belief_df.empty:
         return pd.Series(dtype=float)
     return belief_df.groupby("tag")["conflict"].mean()
 
 
 def _build_belief_frame(bundle: SnapshotBundle, *, closed_world: bool) -> pd.DataFrame:
-    theta = frozenset(range(1, bundle.scale_size + 1))
-    stages = sorted(theta)
-    rows: list[dict[str, object]] = []
-
-    for (tag, sample_ordinal), group in bundle.responses.groupby(
-        ["experiment_tag", "sample_ordinal"],
-        dropna=False,
-    ):
-        masses: list[MassFunction] = []
-        for _, row in group.iterrows():
-            mass = _response_to_mass(row, theta, closed_world=closed_world)
-            if mass is not None:
-                masses.append(mass)
-        if not masses:
-            continue
-
-        if closed_world:
-            combined_unnorm = masses[0]
-            conflict = 0.0
-            for mass in masses[1:]:
-                combined_unnorm = combined_unnorm.combine_conjunctive(
-                    mass,
-                    normalization=False,
-                )
-                conflict = float(combined_unnorm[frozenset()])
-
-            if conflict >= 0.9999:
-                combined = combined_unnorm
-            else:
-                combined = masses[0]
-                for mass in masses[1:]:
-                    combined = combined.combine_conjunctive(
-                        mass,
-                        normalization=True,
-                    )
-        else:
-            combined = masses[0]
-            conflict = float(combined[frozenset()])
-            for mass in masses[1:]:
-                combined = combined.combine_conjunctive(
-                    mass,
-                    normalization=False,
-                )
-                conflict = float(combined[frozenset()])
-
-        if conflict >= 0.9999:
-            pign = {}
-        else:
-            pign = combined.pignistic()
-
-        rubric_id = str(group["rubric_id"].dropna().iloc[0]) if group["rubric_id"].notna().any() else ""
-        rows.append(
-            {
-                "method": "closed" if closed_world else "tbm",
-                "tag": tag,
-                "model": display_label_for_tag(bundle, tag),
-                "sample_ordinal": int(sample_ordinal),
-                "sample_label": f"S{int(sample_ordinal):02d}",
-                "rubric_id": rubric_id,
-                "n_responses": int(len(group)),
-                "bundle_count": int(group["bundle_label"].nunique()),
-                "abstain_count": int(group["abstained"].sum()),
-                "conflict": float(conflict),
-                **{
-                    f"betP_{stage}": float(pign.get(frozenset([stage]), 0.0))
-                    for stage in stages
-                },
-            }
-        )
-
-    return pd.DataFrame(rows).sort_values(["tag", "sample_ordinal"]).reset_index(drop=True)
+    scale_size = bundle.scale_size
+    stages = list(range(1, scale_size + 1))
+    responses = bundle.responses
+    if responses.empty:
+        return pd.DataFrame()
+
+    grouped = responses.groupby(["experiment_tag", "sample_ordinal"], dropna=False)
+    group_ids = grouped.ngroup().to_numpy()
+    keep, focal_masks, weights = _response_simple_supports(responses, scale_size, closed_world=closed_world)
+    order = np.argsort(group_ids[keep], kind="stable")
+    support_counts = np.bincount(group_ids[keep], minlength=grouped.ngroups)
+    combined = combine_simple_support_groups(
+        focal_masks[keep][order],
+        weights[keep][order],
+        np.concatenate([[0], np.cumsum(support_counts)]),
+        scale_size,
+    )
+    conflict = combined[:, 0]
+    pign = pignistic(combined)
+    pign[conflict >= 0.9999] = 0.0
+
+    summary = grouped.agg(
+        n_responses=("abstained", "size"),
+        bundle_count=("bundle_label", "nunique"),
+        abstain_count=("abstained", "sum"),
+        rubric_id=("rubric_id", "first"),
+    ).reset_index()
+    sample_ordinals = summary["sample_ordinal"].astype(int)
+    frame = pd.DataFrame(
+        {
+            "method": "closed" if closed_world else "tbm",
+            "tag": summary["experiment_tag"],
+            "model": summary["experiment_tag"].map(lambda tag: display_label_for_tag(bundle, tag)),
+            "sample_ordinal": sample_ordinals,
+            "sample_label": sample_ordinals.map(lambda ordinal: f"S{ordinal:02d}"),
+            "rubric_id": summary["rubric_id"].map(lambda rubric_id: "" if pd.isna(rubric_id) else str(rubric_id)),
+            "n_responses": summary["n_responses"].astype(int),
+            "bundle_count": summary["bundle_count"].astype(int),
+            "abstain_count": summary["abstain_count"].astype(int),
+            "conflict": conflict,
+            **{f"betP_{stage}": pign[:, stage - 1] for stage in stages},
+        }
+    )
+    return frame[support_counts > 0].sort_values(["tag", "sample_ordinal"]).reset_index(drop=True)
 
 
 def _plot_metric_heatmap(
@@ -572,6 +554,7 @@ def _write_evidence_table(bundle: SnapshotBundle, tables_dir: Path, connection,
 def _plot_stage_counts(bundle: SnapshotBundle, figures_dir: Path, connection, report_name: str) -> None:
     scores = bundle.responses.copy()
     scores["evidence"] = scores["bundle_label"]
+    scores["decoded_scores"] = list_cells(scores["decoded_scores"])
 
     def explode_stages(row: pd.Series) -> list[int | str]:
         if row["abstained"]:
@@ -632,6 +615,7 @@ def _run_length_bias(
     report_name: str,
 ) -> None:
     responses = bundle.responses.copy()
+    responses["decoded_scores"] = list_cells(responses["decoded_scores"])
     rubrics = bundle.rubrics.copy()
 
     def word_count(text: str) -> int:
@@ -725,7 +709,7 @@ def _write_rates(
             abstain_rate = float(group["abstained"].mean()) if n else np.nan
             non_abs = group[~group["abstained"]]
             singleton_rate = (
-                float(non_abs["decoded_scores"].apply(len).eq(1).mean())
+                float(list_lengths(non_abs["decoded_scores"]).eq(1).mean())
                 if len(non_abs) else np.nan
             )
             records.append(
@@ -800,32 +784,86 @@ def _write_closed_world_reports(
 
 def _response_to_mass(
     row: pd.Series,
-    theta: frozenset[int],
+    scale_size: int,
+    *,
+    closed_world: bool,
+) -> np.ndarray | None:
+    support = _response_simple_support(row, scale_size, closed_world=closed_world)
+    if support is None:
+        return None
+    return simple_support_masses([support[0]], [support[1]], scale_size)[0]
+
+
+def _response_simple_supports(
+    responses: pd.DataFrame,
+    scale_size: int,
+    *,
+    closed_world: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    theta = theta_mask(scale_size)
+    abstained = responses["abstained"].fillna(False).astype(bool).to_numpy()
+    verdicts = _response_verdict_masks(responses, abstained)
+    is_theta = ~abstained & (verdicts == theta)
+    agreement = _or_one(responses, "score_expert_agreement_prob")
+    if closed_world:
+        return ~abstained, verdicts, np.where(is_theta, 1.0, _clamp_unit(agreement))
+
+    verdict_mass = _clamp_unit(
+        agreement
+        * _or_one(responses, "rubric_observability_score")
+        * _or_one(responses, "rubric_discriminability_score")
+    )
+    focal_masks = np.where(abstained | is_theta, 0, verdicts)
+    weights = np.where(abstained, agreement, np.where(is_theta, 1.0 - agreement, verdict_mass))
+    return np.ones(len(responses), dtype=bool), focal_masks, weights
+
+
+def _response_verdict_masks(responses: pd.DataFrame, abstained: np.ndarray) -> np.ndarray:
+    if "verdict_mask" in responses.columns:
+        stored = pd.to_numeric(responses["verdict_mask"], errors="coerce")
+    else:
+        stored = pd.Series(np.nan, index=responses.index)
+    masks = stored.fillna(0).to_numpy(dtype=np.int64)
+    missing = stored.isna().to_numpy() & ~abstained
+    if missing.any():
+        decoded = list_cells(responses["decoded_scores"])[missing]
+        masks[missing] = [stage_mask(scores) for scores in decoded]
+    return masks
+
+
+def _or_one(responses: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in responses.columns:
+        return np.ones(len(responses), dtype=float)
+    values = pd.to_numeric(responses[column], errors="coerce").to_numpy(dtype=float)
+    return np.where(values == 0.0, 1.0, values)
+
+
+def _clamp_unit(values: np.ndarray) -> np.ndarray:
+    upper = np.where(values < 1.0, values, 1.0)
+    return np.where(upper > 0.0, upper, 0.0)
+
+
+def _response_simple_support(
+    row: pd.Series,
+    scale_size: int,
     *,
     closed_world: bool,
-) -> MassFunction | None:
+) -> tuple[int, float] | None:
+    theta = theta_mask(scale_size)
     agreement = float(row.get("score_expert_agreement_prob") or 1.0)
     if row["abstained"]:
         if closed_world:
             return None
-        mass = MassFunction()
-        mass[frozenset()] = agreement
-        mass[theta] = 1.0 - agreement
-        return mass
+        return 0, agreement
 
-    verdict = frozenset(int(stage) for stage in row["decoded_scores"])
+    verdict = stage_mask(row["decoded_scores"])
     if verdict == theta:
-        mass = MassFunction()
         if closed_world:
-            mass[theta] = 1.0
-        else:
-            mass[theta] = agreement
-            mass[frozenset()] = 1.0 - agreement
-        return mass
+            return theta, 1.0
+        return 0, 1.0 - agreement
 
     if closed_world:
-        verdict_mass = max(0.0, min(1.0, agreement))
-        return MassFunction({verdict: verdict_mass, theta: 1.0 - verdict_mass})
+        return verdict, max(0.0, min(1.0, agreement))
 
     verdict_mass = max(
         0.0,
@@ -836,7 +874,7 @@ def _response_to_mass(
             * float(row.get("rubric_discriminability_score") or 1.0),
         ),
     )
-    return MassFunction({verdict: verdict_mass, theta: 1.0 - verdict_mass})
+    return verdict, verdict_mass
 
 
 def _plot_conflict_summary(df: pd.DataFrame, title: str, path: Path) -> bool:
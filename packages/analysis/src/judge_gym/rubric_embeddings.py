@@ -4,6 +4,7 @@ import hashlib
 import json
 import sqlite3
 import time
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Callable
@@ -12,8 +13,50 @@ import numpy as np
 import pandas as pd
 
 from .datasets import SnapshotBundle
+from .embedding_server import request_embeddings
 
 DEFAULT_RUBRIC_EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+EMBEDDING_VECTOR_DTYPE = np.float32
+EMBEDDING_CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+  model_name TEXT NOT NULL,
+  text_hash TEXT NOT NULL,
+  text TEXT NOT NULL,
+  vector BLOB NOT NULL,
+  created_at_ms INTEGER NOT NULL,
+  PRIMARY KEY (model_name, text_hash)
+)
+"""
+MIGRATION_BATCH_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class EmbeddingTable:
+    model_name: str
+    rows: pd.DataFrame
+    vectors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def empty(self) -> bool:
+        return self.rows.empty
+
+    def row_index(self, columns: list[str]) -> pd.MultiIndex:
+        return pd.MultiIndex.from_frame(self.rows[columns])
+
+    def positions(self, keys: pd.DataFrame) -> np.ndarray:
+        columns = list(keys.columns)
+        return self.row_index(columns).get_indexer(pd.MultiIndex.from_frame(keys[columns]))
+
+    def to_frame(self) -> pd.DataFrame:
+        frame = self.rows.copy()
+        if frame.empty:
+            return frame
+        frame["embedding_model"] = self.model_name
+        frame["vector_json"] = [json.dumps(vector.tolist()) for vector in self.vectors]
+        return frame
 
 
 def default_embedding_cache_path() -> Path:
@@ -30,18 +73,14 @@ def connect_embedding_cache(path: str | Path | None = None) -> sqlite3.Connectio
     connection = sqlite3.connect(db_path)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA journal_mode=WAL;")
-    connection.execute(
-        """
-        CREATE TABLE IF NOT EXISTS rubric_embedding_cache (
-          model_name TEXT NOT NULL,
-          text_hash TEXT NOT NULL,
-          text TEXT NOT NULL,
-          vector_json TEXT NOT NULL,
-          created_at_ms INTEGER NOT NULL,
-          PRIMARY KEY (model_name, text_hash)
-        )
-        """
-    )
+    columns = {
+        str(row["name"])
+        for row in connection.execute("PRAGMA table_info(rubric_embedding_cache)").fetchall()
+    }
+    if not columns:
+        connection.execute(EMBEDDING_CACHE_SQL.format(table="rubric_embedding_cache"))
+    elif "vector_json" in columns:
+        _migrate_vector_json(connection)
     connection.commit()
     return connection
 
@@ -52,66 +91,46 @@ def build_rubric_embedding_tables(
     model_name: str = DEFAULT_RUBRIC_EMBEDDING_MODEL,
     encoder: Callable[[list[str]], np.ndarray] | None = None,
     cache_path: str | Path | None = None,
-) -> dict[str, pd.DataFrame]:
-    full = _build_full_rubric_records(bundle)
-    stage = _build_stage_rubric_records(bundle)
-    criterion = _build_criterion_rubric_records(bundle)
-    if full.empty:
-        return {
-            "full": full,
-            "stage": stage,
-            "criterion": criterion,
-        }
-
-    full = attach_embedding_vectors(
-        full,
-        text_column="rubric_text",
-        model_name=model_name,
-        encoder=encoder,
-        cache_path=cache_path,
-    )
-    stage = attach_embedding_vectors(
-        stage,
-        text_column="stage_text",
-        model_name=model_name,
-        encoder=encoder,
-        cache_path=cache_path,
-    )
-    criterion = attach_embedding_vectors(
-        criterion,
-        text_column="criterion_text",
-        model_name=model_name,
-        encoder=encoder,
-        cache_path=cache_path,
-    )
+) -> dict[str, EmbeddingTable]:
+    records = {
+        "full": (_build_full_rubric_records(bundle), "rubric_text"),
+        "stage": (_build_stage_rubric_records(bundle), "stage_text"),
+        "criterion": (_build_criterion_rubric_records(bundle), "criterion_text"),
+    }
     return {
-        "full": full,
-        "stage": stage,
-        "criterion": criterion,
+        name: embed_frame(
+            frame,
+            text_column=text_column,
+            model_name=model_name,
+            encoder=encoder,
+            cache_path=cache_path,
+        )
+        for name, (frame, text_column) in records.items()
     }
 
 
-def attach_embedding_vectors(
+def embed_frame(
     frame: pd.DataFrame,
     *,
     text_column: str,
     model_name: str,
     encoder: Callable[[list[str]], np.ndarray] | None = None,
     cache_path: str | Path | None = None,
-) -> pd.DataFrame:
-    if frame.empty:
-        return frame.copy()
-    texts = frame[text_column].astype(str).tolist()
+) -> EmbeddingTable:
+    rows = frame.reset_index(drop=True)
+    if rows.empty:
+        return EmbeddingTable(
+            model_name=model_name,
+            rows=rows,
+            vectors=np.zeros((len(rows), 0), dtype=EMBEDDING_VECTOR_DTYPE),
+        )
     vectors = embed_texts(
-        texts,
+        rows[text_column].astype(str).tolist(),
         model_name=model_name,
         encoder=encoder,
         cache_path=cache_path,
     )
-    enriched = frame.copy()
-    enriched["embedding_model"] = model_name
-    enriched["vector_json"] = [json.dumps(vector.tolist()) for vector in vectors]
-    return enriched
+    return EmbeddingTable(model_name=model_name, rows=rows, vectors=vectors)
 
 
 def embed_texts(
@@ -122,13 +141,13 @@ def embed_texts(
     cache_path: str | Path | None = None,
 ) -> np.ndarray:
     if not texts:
-        return np.zeros((0, 0), dtype=float)
+        return np.zeros((0, 0), dtype=EMBEDDING_VECTOR_DTYPE)
     encode = encoder or _sentence_transformer_encoder(model_name)
     text_hashes = [_text_hash(text) for text in texts]
     cached_vectors = _load_cached_vectors(model_name=model_name, text_hashes=text_hashes, cache_path=cache_path)
     missing = [text for text, text_hash in zip(texts, text_hashes, strict=False) if text_hash not in cached_vectors]
     if missing:
-        vectors = encode(missing)
+        vectors = np.asarray(encode(missing), dtype=EMBEDDING_VECTOR_DTYPE)
         _store_cached_vectors(
             model_name=model_name,
             texts=missing,
@@ -142,10 +161,29 @@ def embed_texts(
     return np.vstack([cached_vectors[text_hash] for text_hash in text_hashes])
 
 
+def paired_cosine_similarity(vectors: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    return np.einsum("ij,ij->i", vectors[left], vectors[right], dtype=float)
+
+
+def centroid_cosine_similarity(vectors: np.ndarray, groups: list[np.ndarray]) -> np.ndarray:
+    centroids = np.vstack([vectors[positions].mean(axis=0, dtype=float) for positions in groups])
+    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+    centroids = np.divide(centroids, norms, out=centroids, where=norms > 0)
+    return centroids @ centroids.T
+
+
 def vector_from_json(value: str) -> np.ndarray:
     return np.array(json.loads(value), dtype=float)
 
 
+def vector_to_blob(vector: np.ndarray) -> bytes:
+    return np.ascontiguousarray(vector, dtype=EMBEDDING_VECTOR_DTYPE).tobytes()
+
+
+def vector_from_blob(value: bytes) -> np.ndarray:
+    return np.frombuffer(value, dtype=EMBEDDING_VECTOR_DTYPE)
+
+
 def _build_full_rubric_records(bundle: SnapshotBundle) -> pd.DataFrame:
     rows: list[dict[str, object]] = []
     for row in bundle.rubrics.itertuples():
@@ -238,7 +276,7 @@ def _load_cached_vectors(
     try:
         rows = connection.execute(
             f"""
-            SELECT text_hash, vector_json
+            SELECT text_hash, vector
             FROM rubric_embedding_cache
             WHERE model_name = ?
               AND text_hash IN ({placeholders})
@@ -248,7 +286,7 @@ def _load_cached_vectors(
     finally:
         connection.close()
     return {
-        str(row["text_hash"]): vector_from_json(str(row["vector_json"]))
+        str(row["text_hash"]): vector_from_blob(row["vector"])
         for row in rows
     }
 
@@ -266,7 +304,7 @@ def _store_cached_vectors(
             connection.executemany(
                 """
                 INSERT OR REPLACE INTO rubric_embedding_cache (
-                  model_name, text_hash, text, vector_json, created_at_ms
+                  model_name, text_hash, text, vector, created_at_ms
                 ) VALUES (?, ?, ?, ?, ?)
                 """,
                 [
@@ -274,7 +312,7 @@ def _store_cached_vectors(
                         model_name,
                         _text_hash(text),
                         text,
-                        json.dumps(vector.tolist()),
+                        vector_to_blob(vector),
                         int(time.time() * 1000),
                     )
                     for text, vector in zip(texts, vectors, strict=False)
@@ -284,6 +322,45 @@ def _store_cached_vectors(
         connection.close()
 
 
+def _migrate_vector_json(connection: sqlite3.Connection) -> None:
+    connection.commit()
+    connection.execute("BEGIN")
+    try:
+        connection.execute("DROP TABLE IF EXISTS rubric_embedding_cache_v2")
+        connection.execute(EMBEDDING_CACHE_SQL.format(table="rubric_embedding_cache_v2"))
+        legacy = connection.execute(
+            """
+            SELECT model_name, text_hash, text, vector_json, created_at_ms
+            FROM rubric_embedding_cache
+            ORDER BY rowid
+            """
+        )
+        while batch := legacy.fetchmany(MIGRATION_BATCH_SIZE):
+            connection.executemany(
+                """
+                INSERT INTO rubric_embedding_cache_v2 (
+                  model_name, text_hash, text, vector, created_at_ms
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        row["model_name"],
+                        row["text_hash"],
+                        row["text"],
+                        vector_to_blob(vector_from_json(str(row["vector_json"]))),
+                        row["created_at_ms"],
+                    )
+                    for row in batch
+                ],
+            )
+        connection.execute("DROP TABLE rubric_embedding_cache")
+        connection.execute("ALTER TABLE rubric_embedding_cache_v2 RENAME TO rubric_embedding_cache")
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+
+
 @lru_cache(maxsize=2)
 def _load_model(model_name: str):
     from sentence_transformers import SentenceTransformer
@@ -293,16 +370,23 @@ def _load_model(model_name: str):
     return SentenceTransformer(model_name, cache_folder=str(cache_folder), device="cpu")
 
 
+def encode_texts_locally(texts: list[str], *, model_name: str) -> np.ndarray:
+    model = _load_model(model_name)
+    return np.asarray(
+        model.encode(
+            texts,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ),
+        dtype=EMBEDDING_VECTOR_DTYPE,
+    )
+
+
 def _sentence_transformer_encoder(model_name: str) -> Callable[[list[str]], np.ndarray]:
     def encode(texts: list[str]) -> np.ndarray:
-        model = _load_model(model_name)
-        return np.asarray(
-            model.encode(
-                texts,
-                normalize_embeddings=True,
-                show_progress_bar=False,
-            ),
-            dtype=float,
-        )
+        vectors = request_embeddings(texts, model_name=model_name)
+        if vectors is None:
+            vectors = encode_texts_locally(texts, model_name=model_name)
+        return vectors
 
     return encode
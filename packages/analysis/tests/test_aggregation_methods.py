@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import importlib.util
 import math
+import random
 import unittest
 
 import numpy as np
 
 from judge_gym.aggregation_methods import (
     VerdictObservation,
+    aggregate_belief_groups,
     aggregate_local_closed_world,
     aggregate_local_tbm,
+    build_verdict_matrix,
     canonicalize_stage_set,
     geometry_support_summary,
     log_opinion_pool,
+    pack_verdict_masks,
     response_to_mass,
     verdict_to_stage_probabilities,
     weighted_linear_opinion_pool,
 )
+from judge_gym.dempster_shafer import (
+    combine_conjunctive,
+    combine_simple_support,
+    combine_simple_support_groups,
+    commonality,
+    mass_vector,
+    pignistic,
+    simple_support_commonality,
+    simple_support_masses,
+    stage_mask,
+)
 
 
 class AggregationMethodsTest(unittest.TestCase):
@@ -36,6 +52,24 @@ class AggregationMethodsTest(unittest.TestCase):
         self.assertTrue(np.allclose(adjacent, [0.0, 0.5, 0.5, 0.0, 0.0]))
         self.assertTrue(np.allclose(broad, [1.0 / 3.0, 0.0, 1.0 / 3.0, 0.0, 1.0 / 3.0]))
 
+    def test_build_verdict_matrix_pads_mixed_scales(self) -> None:
+        verdicts = build_verdict_matrix(
+            [[2], [3, 1, 3], [], [1, 2], None],
+            [3, 5, 4, 2, 3],
+            abstained=[False, False, False, True, False],
+            abstain_policy="uniform",
+        )
+        self.assertEqual(verdicts.probabilities.shape, (5, 5))
+        np.testing.assert_allclose(verdicts.probabilities[0], [0.0, 1.0, 0.0, 0.0, 0.0])
+        np.testing.assert_allclose(verdicts.probabilities[1], [0.5, 0.0, 0.5, 0.0, 0.0])
+        np.testing.assert_allclose(verdicts.probabilities[2], [0.25, 0.25, 0.25, 0.25, 0.0])
+        np.testing.assert_allclose(verdicts.probabilities[3], [0.5, 0.5, 0.0, 0.0, 0.0])
+        self.assertEqual(verdicts.abstained.tolist(), [False, False, True, True, True])
+        self.assertEqual(verdicts.subset_sizes.tolist(), [1, 2, 0, 2, 0])
+        self.assertEqual(verdicts.verdict_masks.tolist(), [2, 5, 0, 3, 0])
+        with self.assertRaises(ValueError):
+            build_verdict_matrix([[4]], [3])
+
     def test_weighted_linear_opinion_pool_respects_weights(self) -> None:
         vectors = [
             verdict_to_stage_probabilities([1], 4),
@@ -71,6 +105,21 @@ class AggregationMethodsTest(unittest.TestCase):
         self.assertTrue(0.0 <= summary["mid_scale_mass"] <= 1.0)
         self.assertTrue(0.0 <= summary["stage_entropy"] <= 1.0)
 
+    def test_stage_sets_accept_any_iterable(self) -> None:
+        np.testing.assert_allclose(
+            verdict_to_stage_probabilities({3, 1}, 4),
+            verdict_to_stage_probabilities([1, 3], 4),
+        )
+        np.testing.assert_allclose(
+            verdict_to_stage_probabilities((stage for stage in [2]), 4),
+            [0.0, 1.0, 0.0, 0.0],
+        )
+        summary = geometry_support_summary([VerdictObservation(frozenset({2, 3}), abstained=False)], 4)
+        self.assertAlmostEqual(summary["abstain_rate"], 0.0, places=6)
+        self.assertAlmostEqual(summary["mean_subset_size"], 2.0, places=6)
+        with self.assertRaises(TypeError):
+            verdict_to_stage_probabilities(3, 4)
+
     def test_response_to_mass_closed_world_skips_abstain(self) -> None:
         mass = response_to_mass(
             decoded_scores=[],
@@ -137,6 +186,219 @@ class AggregationMethodsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             verdict_to_stage_probabilities([1], 3, abstain_policy="bad")
 
+    def test_simple_support_commonality_matches_transformed_masses(self) -> None:
+        rng = np.random.default_rng(3)
+        scale_size = 5
+        focal_masks = rng.integers(0, 1 << scale_size, size=12)
+        weights = rng.uniform(0.0, 1.0, size=12)
+        masses = simple_support_masses(focal_masks, weights, scale_size)
+        np.testing.assert_allclose(
+            simple_support_commonality(focal_masks, weights, scale_size),
+            commonality(masses),
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            combine_simple_support(focal_masks, weights, scale_size),
+            combine_conjunctive(masses, normalization=False),
+            atol=1e-12,
+        )
+        with self.assertRaises(ValueError):
+            simple_support_commonality([1], [1.2], scale_size)
+
+    def test_combine_simple_support_groups_matches_each_group(self) -> None:
+        rng = np.random.default_rng(11)
+        scale_size = 4
+        focal_masks = rng.integers(0, 1 << scale_size, size=30)
+        weights = rng.uniform(0.0, 1.0, size=30)
+        weights[[2, 9, 10]] = 1.0
+        weights[5] = 0.0
+        offsets = np.array([0, 4, 4, 11, 12, 30])
+        combined = combine_simple_support_groups(focal_masks, weights, offsets, scale_size)
+        self.assertEqual(combined.shape, (5, 1 << scale_size))
+        for group, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+            np.testing.assert_allclose(
+                combined[group],
+                combine_simple_support(focal_masks[start:stop], weights[start:stop], scale_size),
+                atol=1e-12,
+            )
+        np.testing.assert_array_equal(combined[1], mass_vector({0b1111: 1.0}, scale_size))
+
+    def test_aggregate_belief_groups_matches_per_sample_methods(self) -> None:
+        rng = random.Random(5)
+        scale_size = 5
+        groups = [_random_responses(rng, scale_size) for _ in range(40)]
+        groups.append([{"decoded_scores": [], "abstained": True, "score_expert_agreement_prob": 0.7}])
+        groups.insert(3, [])
+        responses = [response for group in groups for response in group]
+        result = aggregate_belief_groups(
+            pack_verdict_masks((response["decoded_scores"] for response in responses), scale_size),
+            group_offsets=np.cumsum([0] + [len(group) for group in groups]),
+            scale_size=scale_size,
+            weights=[response["score_expert_agreement_prob"] for response in responses],
+            abstained=[response["abstained"] for response in responses],
+            observability=[response.get("rubric_observability_score", 1.0) for response in responses],
+            discriminability=[response.get("rubric_discriminability_score", 1.0) for response in responses],
+        )
+
+        for index, group in enumerate(groups):
+            self.assertEqual(result.n_observations[index], len(group))
+            if not group:
+                self.assertTrue(np.isnan(result.tbm[index]).all())
+                continue
+            summary = geometry_support_summary(
+                [VerdictObservation(tuple(response["decoded_scores"]), bool(response["abstained"])) for response in group],
+                scale_size,
+            )
+            self.assertAlmostEqual(result.abstain_count[index] / len(group), summary["abstain_rate"], places=12)
+            vectors = [verdict_to_stage_probabilities(response["decoded_scores"], scale_size) for response in group]
+            retained = [
+                (vector, response["score_expert_agreement_prob"])
+                for vector, response in zip(vectors, group)
+                if vector.sum() > 0.0
+            ]
+            if retained:
+                self.assertAlmostEqual(result.mean_subset_size[index], summary["mean_subset_size"], places=12)
+                self.assertAlmostEqual(
+                    float(result.geometry[index] @ np.arange(1, scale_size + 1)),
+                    summary["expected_stage"],
+                    places=12,
+                )
+                retained_vectors = [vector for vector, _ in retained]
+                retained_weights = [weight for _, weight in retained]
+                np.testing.assert_allclose(
+                    result.weighted_linear_pool[index],
+                    weighted_linear_opinion_pool(retained_vectors, weights=retained_weights),
+                    atol=1e-12,
+                )
+                np.testing.assert_allclose(
+                    result.log_opinion_pool[index],
+                    log_opinion_pool(retained_vectors, weights=retained_weights),
+                    atol=1e-12,
+                )
+            else:
+                self.assertTrue(np.isnan(result.geometry[index]).all())
+                self.assertTrue(np.isnan(result.weighted_linear_pool[index]).all())
+            for aggregate, probabilities, conflicts in [
+                (aggregate_local_tbm, result.tbm, result.tbm_conflict),
+                (aggregate_local_closed_world, result.closed_world, result.closed_world_conflict),
+            ]:
+                expected = aggregate(group, scale_size=scale_size)
+                if expected is None:
+                    self.assertTrue(np.isnan(conflicts[index]))
+                    self.assertTrue(np.isnan(probabilities[index]).all())
+                    continue
+                self.assertAlmostEqual(conflicts[index], expected.conflict, delta=1e-12)
+                np.testing.assert_allclose(probabilities[index], expected.stage_probabilities, atol=1e-12)
+
+    def test_aggregate_belief_groups_rejects_bad_packing(self) -> None:
+        with self.assertRaises(ValueError):
+            pack_verdict_masks([[0]], 4)
+        with self.assertRaises(ValueError):
+            aggregate_belief_groups([1, 2], group_offsets=[0, 1], scale_size=4)
+        with self.assertRaises(ValueError):
+            aggregate_belief_groups([1, 2], group_offsets=[0, 2, 1, 2], scale_size=4)
+        with self.assertRaises(ValueError):
+            aggregate_belief_groups([1, 16], group_offsets=[0, 2], scale_size=4)
+
+
+def _random_responses(rng: random.Random, scale_size: int) -> list[dict[str, object]]:
+    responses = []
+    for _ in range(rng.randint(1, 8)):
+        abstained = rng.random() < 0.2
+        responses.append(
+            {
+                "decoded_scores": [] if abstained else rng.sample(range(1, scale_size + 1), rng.randint(1, scale_size)),
+                "abstained": abstained,
+                "score_expert_agreement_prob": rng.uniform(0.3, 1.0),
+                "rubric_observability_score": rng.uniform(0.5, 1.0),
+                "rubric_discriminability_score": rng.uniform(0.5, 1.0),
+            }
+        )
+    return responses
+
+
+def _pyds_reference(responses: list[dict[str, object]], *, scale_size: int, closed_world: bool) -> tuple[float, list[float]]:
+    from pyds import MassFunction
+
+    masses = []
+    for response in responses:
+        mass = response_to_mass(
+            decoded_scores=response["decoded_scores"],
+            scale_size=scale_size,
+            abstained=bool(response["abstained"]),
+            score_expert_agreement_prob=response["score_expert_agreement_prob"],
+            rubric_observability_score=response["rubric_observability_score"],
+            rubric_discriminability_score=response["rubric_discriminability_score"],
+            closed_world=closed_world,
+        )
+        if mass is not None:
+            masses.append(
+                MassFunction(
+                    {
+                        frozenset(stage for stage in range(1, scale_size + 1) if mask & (1 << (stage - 1))): value
+                        for mask, value in enumerate(mass)
+                        if value > 0.0
+                    }
+                )
+            )
+    unnormalized = masses[0]
+    for mass in masses[1:]:
+        unnormalized = unnormalized.combine_conjunctive(mass, normalization=False)
+    conflict = float(unnormalized[frozenset()]) if len(masses) > 1 or not closed_world else 0.0
+    if conflict >= 0.9999:
+        return conflict, [0.0] * scale_size
+    combined = masses[0]
+    for mass in masses[1:]:
+        combined = combined.combine_conjunctive(mass, normalization=closed_world)
+    betp = combined.pignistic()
+    return conflict, [float(betp.get(frozenset([stage]), 0.0)) for stage in range(1, scale_size + 1)]
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyds") is not None, "pyds is not installed")
+class DempsterShaferParityTest(unittest.TestCase):
+    def test_combination_and_pignistic_match_pyds(self) -> None:
+        from pyds import MassFunction
+
+        rng = random.Random(7)
+        scale_size = 6
+        stages = range(1, scale_size + 1)
+        for _ in range(200):
+            focal = [frozenset(stage for stage in stages if rng.random() < 0.5) for _ in range(3)]
+            left = MassFunction({focal[0]: 0.5, focal[1]: 0.3, frozenset(stages): 0.2})
+            right = MassFunction({focal[2]: 0.6, frozenset(stages): 0.4})
+            left_vector = mass_vector({stage_mask(key): value for key, value in left.items()}, scale_size)
+            right_vector = mass_vector({stage_mask(key): value for key, value in right.items()}, scale_size)
+            for normalization in [False, True]:
+                if normalization and left.combine_conjunctive(right, normalization=False)[frozenset()] >= 0.9999:
+                    continue
+                expected = left.combine_conjunctive(right, normalization=normalization)
+                actual = combine_conjunctive(np.stack([left_vector, right_vector]), normalization=normalization)
+                for key, value in expected.items():
+                    self.assertAlmostEqual(actual[stage_mask(key)], value, delta=1e-12)
+                self.assertAlmostEqual(actual.sum(), sum(expected.values()), delta=1e-12)
+                if expected[frozenset()] < 0.9999:
+                    betp = expected.pignistic()
+                    np.testing.assert_allclose(
+                        pignistic(actual),
+                        [betp.get(frozenset([stage]), 0.0) for stage in stages],
+                        rtol=0.0,
+                        atol=1e-12,
+                    )
+
+    def test_local_belief_aggregation_matches_pyds(self) -> None:
+        rng = random.Random(11)
+        for _ in range(150):
+            scale_size = rng.randint(2, 7)
+            responses = _random_responses(rng, scale_size)
+            for closed_world, aggregate in [(False, aggregate_local_tbm), (True, aggregate_local_closed_world)]:
+                result = aggregate(responses, scale_size=scale_size)
+                if result is None:
+                    self.assertTrue(closed_world)
+                    continue
+                conflict, probabilities = _pyds_reference(responses, scale_size=scale_size, closed_world=closed_world)
+                self.assertAlmostEqual(result.conflict, conflict, delta=1e-12)
+                np.testing.assert_allclose(result.stage_probabilities, probabilities, rtol=0.0, atol=1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -129,6 +129,58 @@ class AggregationSensitivityTests(unittest.TestCase):
         ].iloc[0]
         self.assertGreaterEqual(float(conflict_tbm["conflict"]), 0.9999)
 
+    def test_compute_sample_method_metrics_handles_mixed_scales_and_abstain_only_samples(self) -> None:
+        extra = pd.DataFrame(
+            [
+                {
+                    "experiment_tag": "exp_binary",
+                    "sample_ordinal": 3,
+                    "model": "gpt-4.1",
+                    "scale_size": 2,
+                    "decoded_scores": [2],
+                    "abstained": False,
+                    "score_expert_agreement_prob": None,
+                    "rubric_observability_score": 1.0,
+                    "rubric_discriminability_score": 1.0,
+                },
+                {
+                    "experiment_tag": "exp_binary",
+                    "sample_ordinal": 4,
+                    "model": "gpt-4.1",
+                    "scale_size": 2,
+                    "decoded_scores": [],
+                    "abstained": True,
+                    "score_expert_agreement_prob": 0.8,
+                    "rubric_observability_score": 1.0,
+                    "rubric_discriminability_score": 1.0,
+                },
+            ]
+        )
+        sample_methods = compute_sample_method_metrics(pd.concat([_responses_frame(), extra], ignore_index=True))
+        self.assertEqual(len(sample_methods), 5 * len(_METHOD_ORDER))
+        self.assertEqual(sample_methods["scale_size"].value_counts().to_dict(), {4: 15, 2: 10})
+
+        binary = sample_methods[sample_methods["experiment_tag"] == "exp_binary"].set_index(["sample_ordinal", "method"])
+        self.assertAlmostEqual(float(binary.loc[(3, "weighted_linear_pool"), "expected_stage"]), 2.0, places=9)
+        self.assertEqual(float(binary.loc[(3, "weighted_linear_pool"), "mid_scale_mass"]), 0.0)
+        self.assertEqual(float(binary.loc[(4, "local_tbm"), "abstain_rate"]), 1.0)
+        self.assertTrue(np.isnan(binary.loc[(4, "geometry_first"), "expected_stage"]))
+        self.assertTrue(np.isnan(binary.loc[(4, "local_closed_world"), "conflict"]))
+        self.assertAlmostEqual(float(binary.loc[(4, "local_tbm"), "expected_stage"]), 1.5, places=9)
+        self.assertAlmostEqual(float(binary.loc[(4, "local_tbm"), "conflict"]), 0.8, places=9)
+
+    def test_compute_sample_method_metrics_reads_precomputed_verdict_masks(self) -> None:
+        responses = _responses_frame()
+        masked = responses.drop(columns=["decoded_scores"]).assign(
+            verdict_mask=[sum(1 << (stage - 1) for stage in scores) for scores in responses["decoded_scores"]],
+        )
+        pd.testing.assert_frame_equal(
+            compute_sample_method_metrics(masked),
+            compute_sample_method_metrics(responses),
+        )
+        with self.assertRaises(ValueError):
+            compute_sample_method_metrics(masked.assign(verdict_mask=None))
+
     def test_summarize_method_sensitivity_builds_contrast_deltas(self) -> None:
         sample_methods = compute_sample_method_metrics(_responses_frame())
         contrast_registry = pd.DataFrame(
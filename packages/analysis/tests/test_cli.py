@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import judge_gym
+
+HEAVY_MODULES = ["matplotlib", "numpy", "pandas", "pyds", "scipy", "seaborn", "sentence_transformers", "statsmodels"]
+
+
+class CliStartupTest(unittest.TestCase):
+    def test_light_subcommands_do_not_import_analysis_stack(self) -> None:
+        script = (
+            "import json, sys\n"
+            "from judge_gym.cli import main\n"
+            "try:\n"
+            "    main(['v3-figure-plan', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print(json.dumps(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)))\n"
+        )
+        source_root = str(Path(judge_gym.__file__).resolve().parents[1])
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([source_root, os.environ.get("PYTHONPATH", "")]))
+        completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env)
+        self.assertEqual(json.loads(completed.stdout.splitlines()[-1]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
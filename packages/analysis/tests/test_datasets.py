@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from judge_gym.analysis_contract import ContractValidationError
 from judge_gym.cache import (
     connect_cache,
@@ -13,7 +17,23 @@ from judge_gym.cache import (
     mark_snapshot_completed,
     write_snapshot_dataset,
 )
-from judge_gym.datasets import load_snapshot_bundle_for_contract
+from judge_gym.columnar_store import columnar_store_available
+from judge_gym.cache import SCHEMA_VERSION, SNAPSHOT_TABLES
+from judge_gym.datasets import (
+    list_cells,
+    list_lengths,
+    load_snapshot_bundle,
+    load_snapshot_bundle_for_contract,
+    materialize_columnar_snapshots,
+)
+from judge_gym.rubric_embeddings import (
+    EmbeddingTable,
+    build_rubric_embedding_tables,
+    centroid_cosine_similarity,
+    connect_embedding_cache,
+    embed_texts,
+    paired_cosine_similarity,
+)
 
 
 def _write_json(path: Path, payload: dict[str, object]) -> None:
@@ -53,6 +73,48 @@ def _manifest(*, experiment_tag: str, export_schema_version: int = 3) -> dict[st
     }
 
 
+def _response_row(*, response_id: str = "resp_1", decoded_scores: list[int] | None = None) -> dict[str, object]:
+    return {
+        "response_id": response_id,
+        "experiment_id": "exp_1",
+        "experiment_tag": "v3_demo",
+        "run_id": "run_1",
+        "sample_id": "sample_1",
+        "sample_ordinal": 1,
+        "score_target_id": "target_1",
+        "score_critic_id": "critic_1",
+        "rubric_id": "rubric_1",
+        "rubric_critic_id": "rubric_critic_1",
+        "model": "gpt-4.1",
+        "concept": "concept",
+        "scale_size": 4,
+        "scoring_method": "subset",
+        "abstain_enabled": True,
+        "evidence_view": "l2_neutralized",
+        "evidence_bundle_size": 1,
+        "bundle_plan_tag": "plan_1",
+        "bundle_strategy": "window_round_robin",
+        "bundle_strategy_version": "v1",
+        "clustering_seed": None,
+        "bundle_signature": "ev_1",
+        "cluster_id": None,
+        "randomizations": [],
+        "decoded_scores": [2] if decoded_scores is None else decoded_scores,
+        "abstained": False,
+        "subset_size": 1,
+        "justification": "ok",
+        "score_expert_agreement_prob": 0.8,
+        "rubric_observability_score": 0.7,
+        "rubric_discriminability_score": 0.6,
+        "evidence_ids": ["ev_1"],
+        "evidence_labels": ["E1"],
+        "evidence_titles": ["Title"],
+        "evidence_urls": ["https://example.com"],
+        "window_ids": ["w1"],
+        "evidence_positions": [0],
+    }
+
+
 class ContractDatasetsTest(unittest.TestCase):
     def test_load_snapshot_bundle_for_contract_filters_frozen_slice(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -69,47 +131,7 @@ class ContractDatasetsTest(unittest.TestCase):
                     connection,
                     snapshot_id=snapshot_id,
                     table="analysis_responses",
-                    rows=[
-                        {
-                            "response_id": "resp_1",
-                            "experiment_id": "exp_1",
-                            "experiment_tag": "v3_demo",
-                            "run_id": "run_1",
-                            "sample_id": "sample_1",
-                            "sample_ordinal": 1,
-                            "score_target_id": "target_1",
-                            "score_critic_id": "critic_1",
-                            "rubric_id": "rubric_1",
-                            "rubric_critic_id": "rubric_critic_1",
-                            "model": "gpt-4.1",
-                            "concept": "concept",
-                            "scale_size": 4,
-                            "scoring_method": "subset",
-                            "abstain_enabled": True,
-                            "evidence_view": "l2_neutralized",
-                            "evidence_bundle_size": 1,
-                            "bundle_plan_tag": "plan_1",
-                            "bundle_strategy": "window_round_robin",
-                            "bundle_strategy_version": "v1",
-                            "clustering_seed": None,
-                            "bundle_signature": "ev_1",
-                            "cluster_id": None,
-                            "randomizations": [],
-                            "decoded_scores": [2],
-                            "abstained": False,
-                            "subset_size": 1,
-                            "justification": "ok",
-                            "score_expert_agreement_prob": 0.8,
-                            "rubric_observability_score": 0.7,
-                            "rubric_discriminability_score": 0.6,
-                            "evidence_ids": ["ev_1"],
-                            "evidence_labels": ["E1"],
-                            "evidence_titles": ["Title"],
-                            "evidence_urls": ["https://example.com"],
-                            "window_ids": ["w1"],
-                            "evidence_positions": [0],
-                        }
-                    ],
+                    rows=[_response_row()],
                 )
                 mark_snapshot_completed(connection, snapshot_id)
             finally:
@@ -188,6 +210,7 @@ class ContractDatasetsTest(unittest.TestCase):
             self.assertEqual(loaded.bundle.snapshot_ids, [snapshot_id])
             self.assertEqual(loaded.bundle.experiment_tags, ["v3_demo"])
             self.assertEqual(len(loaded.bundle.responses), 1)
+            self.assertEqual(set(loaded.bundle.load_timings), {"manifests", *SNAPSHOT_TABLES})
 
     def test_load_snapshot_bundle_for_contract_detects_snapshot_drift(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -271,3 +294,437 @@ class ContractDatasetsTest(unittest.TestCase):
 if __name__ == "__main__":
     unittest.main()
 
+
+
+def _rubric_row() -> dict[str, object]:
+    return {
+        "rubric_id": "rubric_1",
+        "experiment_id": "exp_1",
+        "experiment_tag": "v3_demo",
+        "run_id": "run_1",
+        "sample_id": "sample_1",
+        "sample_ordinal": 1,
+        "model": "gpt-4.1",
+        "concept": "concept",
+        "scale_size": 4,
+        "stages": [{"stage_number": 1, "label": "Low", "criteria": ["a", "b"]}],
+        "label_mapping": {"A": 1},
+        "justification": "ok",
+        "observability_score": 0.5,
+        "discriminability_score": None,
+    }
+
+
+class LazyBundleTest(unittest.TestCase):
+    def test_lazy_bundle_loads_projected_tables_on_first_access(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                snapshot_id = create_snapshot(
+                    connection,
+                    deployment_url="https://example.convex.cloud",
+                    manifest=_manifest(experiment_tag="v3_demo"),
+                )
+                write_snapshot_dataset(
+                    connection,
+                    snapshot_id=snapshot_id,
+                    table="analysis_responses",
+                    rows=[_response_row(), _response_row(response_id="resp_2", decoded_scores=[1, 3])],
+                )
+                write_snapshot_dataset(
+                    connection,
+                    snapshot_id=snapshot_id,
+                    table="analysis_rubrics",
+                    rows=[_rubric_row()],
+                )
+                mark_snapshot_completed(connection, snapshot_id)
+            finally:
+                connection.close()
+
+            bundle = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columns={
+                    "responses": ["experiment_tag", "decoded_scores", "bundle_label"],
+                    "rubrics": ["experiment_tag", "sample_ordinal", "rubric_id", "concept", "stages"],
+                },
+                lazy=True,
+            )
+            self.assertEqual(bundle.loaded_tables, [])
+            self.assertEqual(bundle.experiment_tags, ["v3_demo"])
+
+            responses = bundle.responses
+            self.assertEqual(bundle.loaded_tables, ["responses"])
+            self.assertEqual(list(responses.columns), ["snapshot_id", "experiment_tag", "decoded_scores", "bundle_label"])
+            self.assertEqual(responses["decoded_scores"].tolist(), [[2], [1, 3]])
+            self.assertEqual(responses["bundle_label"].tolist(), ["E1", "E1"])
+            self.assertIn("analysis_responses", bundle.load_timings)
+
+            tables = build_rubric_embedding_tables(
+                bundle,
+                encoder=lambda texts: np.ones((len(texts), 3)),
+                cache_path=Path(tmpdir) / "embeddings.sqlite",
+            )
+            self.assertEqual(bundle.loaded_tables, ["responses", "rubrics"])
+            self.assertEqual(len(tables["criterion"]), 2)
+            self.assertEqual(tables["criterion"].vectors.shape, (2, 3))
+            self.assertEqual(tables["criterion"].vectors.dtype, np.float32)
+            criterion = tables["criterion"].to_frame()
+            self.assertEqual(list(criterion.columns[-2:]), ["embedding_model", "vector_json"])
+            self.assertEqual(json.loads(criterion.loc[0, "vector_json"]), [1.0, 1.0, 1.0])
+
+            with self.assertRaises(ValueError):
+                load_snapshot_bundle(
+                    snapshot_ids=[snapshot_id],
+                    cache_db_path=str(db_path),
+                    columns={"responses": ["not_a_column"]},
+                )
+
+
+class ResponseSchemaMigrationTest(unittest.TestCase):
+    def test_ensure_schema_migrates_legacy_response_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                snapshot_id = create_snapshot(
+                    connection,
+                    deployment_url="https://example.convex.cloud",
+                    manifest=_manifest(experiment_tag="v3_demo"),
+                )
+                mark_snapshot_completed(connection, snapshot_id)
+            finally:
+                connection.close()
+
+            rows = [
+                _response_row(),
+                _response_row(response_id="resp_2", decoded_scores=[1, 3]) | {
+                    "bundle_plan_tag": None,
+                    "evidence_ids": ["ev_1", "ev_2"],
+                    "evidence_labels": ["E1", "E2"],
+                    "evidence_titles": ["Title", "Other"],
+                    "evidence_urls": ["https://example.com", "https://example.org"],
+                    "window_ids": ["w1", "w1"],
+                    "evidence_positions": [0, 1],
+                },
+            ]
+            legacy = sqlite3.connect(db_path)
+            try:
+                legacy.execute("DROP TABLE analysis_responses")
+                columns = ["snapshot_id"] + [
+                    f"{key}_json" if isinstance(value, list) else key
+                    for key, value in rows[0].items()
+                ]
+                legacy.execute(f"CREATE TABLE analysis_responses ({', '.join(columns)})")
+                for row in rows:
+                    values = [snapshot_id] + [
+                        json.dumps(value) if isinstance(value, list) else value
+                        for value in row.values()
+                    ]
+                    legacy.execute(
+                        f"INSERT INTO analysis_responses VALUES ({', '.join(['?'] * len(values))})",
+                        values,
+                    )
+                legacy.execute("PRAGMA user_version=2")
+                legacy.commit()
+            finally:
+                legacy.close()
+
+            bundle = load_snapshot_bundle(snapshot_ids=[snapshot_id], cache_db_path=str(db_path))
+
+            migrated = sqlite3.connect(db_path)
+            try:
+                self.assertEqual(migrated.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+                response_columns = {row[1] for row in migrated.execute("PRAGMA table_info(analysis_responses)")}
+                self.assertIn("experiment_tag_code", response_columns)
+                self.assertNotIn("evidence_labels_json", response_columns)
+                self.assertEqual(migrated.execute("SELECT COUNT(*) FROM analysis_evidence_refs").fetchone()[0], 2)
+            finally:
+                migrated.close()
+
+            responses = bundle.responses.set_index("response_id")
+            self.assertEqual(list(bundle.responses["response_id"]), ["resp_1", "resp_2"])
+            self.assertEqual(responses.loc["resp_1", "experiment_tag"], "v3_demo")
+            self.assertEqual(responses.loc["resp_1", "bundle_plan_tag"], "plan_1")
+            self.assertTrue(pd.isna(responses.loc["resp_2", "bundle_plan_tag"]))
+            self.assertEqual(responses.loc["resp_2", "decoded_scores"], [1, 3])
+            self.assertEqual(responses.loc["resp_2", "evidence_titles"], ["Title", "Other"])
+            self.assertEqual(responses.loc["resp_2", "evidence_urls"], ["https://example.com", "https://example.org"])
+            self.assertEqual(responses.loc["resp_2", "bundle_label"], "E1 | E2")
+            self.assertEqual(responses.loc["resp_2", "verdict_mask"], 5)
+            self.assertEqual(responses.loc["resp_2", "verdict_subset_size"], 2)
+
+    def test_ensure_schema_migrates_legacy_response_item_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                snapshot_id = create_snapshot(
+                    connection,
+                    deployment_url="https://example.convex.cloud",
+                    manifest=_manifest(experiment_tag="v3_demo"),
+                )
+                mark_snapshot_completed(connection, snapshot_id)
+            finally:
+                connection.close()
+
+            rows = [
+                {
+                    "snapshot_id": snapshot_id,
+                    "response_id": "resp_1",
+                    "experiment_tag": "v3_demo",
+                    "run_id": "run_1",
+                    "sample_id": "sample_1",
+                    "sample_ordinal": 1,
+                    "score_target_id": "target_1",
+                    "bundle_plan_tag": "plan_1",
+                    "bundle_strategy": None,
+                    "bundle_signature": "ev_1|ev_2",
+                    "cluster_id": None,
+                    "bundle_size": 2,
+                    "abstained": 0,
+                    "subset_size": 1,
+                    "evidence_id": evidence_id,
+                    "evidence_label": label,
+                    "evidence_title": "Shared title",
+                    "evidence_url": "https://example.com",
+                    "window_id": "w1",
+                    "position": position,
+                }
+                for position, (evidence_id, label) in enumerate([("ev_1", "E1"), ("ev_2", "E2")])
+            ]
+            legacy = sqlite3.connect(db_path)
+            try:
+                legacy.execute("DROP TABLE analysis_response_items")
+                legacy.execute(f"CREATE TABLE analysis_response_items ({', '.join(rows[0])})")
+                legacy.executemany(
+                    f"INSERT INTO analysis_response_items VALUES ({', '.join(['?'] * len(rows[0]))})",
+                    [tuple(row.values()) for row in rows],
+                )
+                legacy.execute("PRAGMA user_version=4")
+                legacy.commit()
+            finally:
+                legacy.close()
+
+            bundle = load_snapshot_bundle(snapshot_ids=[snapshot_id], cache_db_path=str(db_path))
+
+            migrated = sqlite3.connect(db_path)
+            try:
+                self.assertEqual(migrated.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+                item_columns = [row[1] for row in migrated.execute("PRAGMA table_info(analysis_response_items)")]
+                self.assertIn("evidence_ref", item_columns)
+                self.assertNotIn("evidence_title", item_columns)
+                self.assertEqual(migrated.execute("SELECT COUNT(*) FROM analysis_evidence_refs").fetchone()[0], 2)
+            finally:
+                migrated.close()
+
+            items = bundle.response_items
+            self.assertEqual(list(items.columns), ["snapshot_id", *[key for key in rows[0] if key != "snapshot_id"]])
+            self.assertEqual(items["evidence_label"].tolist(), ["E1", "E2"])
+            self.assertEqual(items["evidence_title"].tolist(), ["Shared title", "Shared title"])
+            self.assertEqual(items["evidence_url"].tolist(), ["https://example.com", "https://example.com"])
+            self.assertEqual(items["window_id"].tolist(), ["w1", "w1"])
+            self.assertEqual(items["abstained"].tolist(), [False, False])
+
+            projected = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columns={"response_items": ["response_id", "evidence_label"]},
+            ).response_items
+            self.assertEqual(list(projected.columns), ["snapshot_id", "response_id", "evidence_label"])
+            self.assertEqual(projected["evidence_label"].tolist(), ["E1", "E2"])
+
+    def test_ensure_schema_backfills_verdict_columns(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                snapshot_id = create_snapshot(
+                    connection,
+                    deployment_url="https://example.convex.cloud",
+                    manifest=_manifest(experiment_tag="v3_demo"),
+                )
+                write_snapshot_dataset(
+                    connection,
+                    snapshot_id=snapshot_id,
+                    table="analysis_responses",
+                    rows=[
+                        _response_row(decoded_scores=[]),
+                        _response_row(response_id="resp_2", decoded_scores=[4, 2]),
+                        _response_row(response_id="resp_3", decoded_scores=[0]),
+                    ],
+                )
+                mark_snapshot_completed(connection, snapshot_id)
+                connection.execute("ALTER TABLE analysis_responses DROP COLUMN verdict_mask")
+                connection.execute("ALTER TABLE analysis_responses DROP COLUMN verdict_subset_size")
+                connection.commit()
+            finally:
+                connection.close()
+
+            bundle = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columns={"responses": ["response_id", "verdict_mask", "verdict_subset_size"]},
+            )
+            responses = bundle.responses.set_index("response_id")
+            self.assertEqual(responses.loc["resp_1", "verdict_mask"], 0)
+            self.assertEqual(responses.loc["resp_2", "verdict_mask"], 10)
+            self.assertEqual(responses.loc["resp_2", "verdict_subset_size"], 2)
+            self.assertTrue(pd.isna(responses.loc["resp_3", "verdict_mask"]))
+
+
+
+class EmbeddingCacheTest(unittest.TestCase):
+    def test_embedding_cache_migrates_json_vectors_to_float32_blobs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "embeddings.sqlite"
+            connection = sqlite3.connect(cache_path)
+            try:
+                connection.execute(
+                    """
+                    CREATE TABLE rubric_embedding_cache (
+                      model_name TEXT NOT NULL,
+                      text_hash TEXT NOT NULL,
+                      text TEXT NOT NULL,
+                      vector_json TEXT NOT NULL,
+                      created_at_ms INTEGER NOT NULL,
+                      PRIMARY KEY (model_name, text_hash)
+                    )
+                    """
+                )
+                connection.execute(
+                    "INSERT INTO rubric_embedding_cache VALUES (?, ?, ?, ?, ?)",
+                    ("demo", hashlib.sha256(b"alpha").hexdigest(), "alpha", "[0.5, -1.25, 2.0]", 1),
+                )
+                connection.commit()
+            finally:
+                connection.close()
+
+            connection = connect_embedding_cache(cache_path)
+            try:
+                columns = [row["name"] for row in connection.execute("PRAGMA table_info(rubric_embedding_cache)")]
+                stored = connection.execute("SELECT vector FROM rubric_embedding_cache").fetchone()["vector"]
+            finally:
+                connection.close()
+            self.assertNotIn("vector_json", columns)
+            self.assertEqual(len(stored), 3 * 4)
+
+            def encode(texts: list[str]) -> np.ndarray:
+                self.assertEqual(texts, ["beta"])
+                return np.array([[1.0, 2.0, 3.0]])
+
+            vectors = embed_texts(["alpha", "beta"], model_name="demo", encoder=encode, cache_path=cache_path)
+            self.assertEqual(vectors.dtype, np.float32)
+            np.testing.assert_array_equal(vectors, [[0.5, -1.25, 2.0], [1.0, 2.0, 3.0]])
+            cached = embed_texts(["beta"], model_name="demo", encoder=None, cache_path=cache_path)
+            np.testing.assert_array_equal(cached, [[1.0, 2.0, 3.0]])
+
+
+    def test_similarity_engine_gathers_rows_by_key(self) -> None:
+        vectors = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+        table = EmbeddingTable(
+            model_name="demo",
+            rows=pd.DataFrame({"experiment_tag": ["a", "a", "b"], "sample_ordinal": [1, 2, 1]}),
+            vectors=vectors,
+        )
+        left = table.positions(pd.DataFrame({"experiment_tag": ["a", "a", "b"], "sample_ordinal": [1, 2, 2]}))
+        right = table.positions(pd.DataFrame({"experiment_tag": ["b", "b", "a"], "sample_ordinal": [1, 1, 1]}))
+        self.assertEqual(left.tolist(), [0, 1, -1])
+        np.testing.assert_allclose(paired_cosine_similarity(vectors, left[:2], right[:2]), [3.0, 8.0])
+
+        similarity = centroid_cosine_similarity(vectors, [np.array([0, 1]), np.array([2])])
+        cross = 1.1 / np.sqrt(1.25)
+        np.testing.assert_allclose(similarity, [[1.0, cross], [cross, 1.0]])
+
+
+@unittest.skipUnless(columnar_store_available(), "pyarrow is not installed")
+class ColumnarStoreTest(unittest.TestCase):
+    def test_columnar_store_round_trips_snapshot_bundle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            db_path = root / "cache.sqlite"
+            store_path = root / "columnar"
+            connection = connect_cache(db_path)
+            try:
+                snapshot_id = create_snapshot(
+                    connection,
+                    deployment_url="https://example.convex.cloud",
+                    manifest=_manifest(experiment_tag="v3_demo"),
+                )
+                write_snapshot_dataset(
+                    connection,
+                    snapshot_id=snapshot_id,
+                    table="analysis_responses",
+                    rows=[_response_row(), _response_row(response_id="resp_2", decoded_scores=[1, 3])],
+                )
+                write_snapshot_dataset(
+                    connection,
+                    snapshot_id=snapshot_id,
+                    table="analysis_rubrics",
+                    rows=[_rubric_row()],
+                )
+                mark_snapshot_completed(connection, snapshot_id)
+            finally:
+                connection.close()
+
+            expected = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columnar_store_path=str(store_path),
+            )
+            written = materialize_columnar_snapshots(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columnar_store_path=str(store_path),
+            )
+            self.assertEqual(written, [snapshot_id])
+            self.assertEqual(
+                materialize_columnar_snapshots(
+                    snapshot_ids=[snapshot_id],
+                    cache_db_path=str(db_path),
+                    columnar_store_path=str(store_path),
+                ),
+                [],
+            )
+
+            loaded = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columnar_store_path=str(store_path),
+            )
+
+            self.assertEqual(loaded.manifests, expected.manifests)
+            for name in ["responses", "rubrics", "evidence", "samples", "response_items"]:
+                loaded_frame = getattr(loaded, name).copy()
+                expected_frame = getattr(expected, name)
+                self.assertEqual(list(loaded_frame.columns), list(expected_frame.columns), name)
+                for column in loaded_frame.columns:
+                    if isinstance(loaded_frame[column].dtype, pd.ArrowDtype):
+                        loaded_frame[column] = list_cells(loaded_frame[column])
+                self.assertEqual(
+                    loaded_frame.astype(object).where(loaded_frame.notna(), None).to_dict("records"),
+                    expected_frame.astype(object).where(expected_frame.notna(), None).to_dict("records"),
+                    name,
+                )
+            self.assertIsInstance(loaded.responses["decoded_scores"].dtype, pd.ArrowDtype)
+            self.assertEqual(list_cells(loaded.responses["decoded_scores"]).tolist(), [[2], [1, 3]])
+            self.assertEqual(list_lengths(loaded.responses["decoded_scores"]).tolist(), [1, 2])
+            self.assertEqual(loaded.responses["verdict_mask"].tolist(), [2, 5])
+
+            import pyarrow.parquet as pq
+
+            partition = store_path / "analysis_responses" / f"snapshot_id={snapshot_id}" / "part-0.parquet"
+            pq.write_table(pq.read_table(partition).drop_columns(["verdict_mask", "verdict_subset_size"]), partition)
+            stale = load_snapshot_bundle(
+                snapshot_ids=[snapshot_id],
+                cache_db_path=str(db_path),
+                columnar_store_path=str(store_path),
+                columns={"responses": ["response_id", "verdict_mask", "verdict_subset_size"]},
+            )
+            self.assertEqual(
+                list(stale.responses.columns),
+                ["snapshot_id", "response_id", "verdict_mask", "verdict_subset_size"],
+            )
+            self.assertEqual(stale.responses["verdict_subset_size"].tolist(), [1, 2])
+            self.assertEqual(loaded.rubrics.loc[0, "stages"][0]["criteria"], ["a", "b"])
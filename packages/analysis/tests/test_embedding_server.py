@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from judge_gym.embedding_server import EmbeddingServer, request_embeddings
+
+
+class EmbeddingServerTest(unittest.TestCase):
+    def test_request_embeddings_round_trips_through_the_socket(self) -> None:
+        def encode(texts: list[str], model_name: str) -> np.ndarray:
+            if model_name != "demo":
+                raise ValueError(f"unknown model {model_name}")
+            return np.array([[len(text), 0.5] for text in texts])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "embeddings.sock"
+            self.assertIsNone(request_embeddings(["alpha"], model_name="demo", socket_path=socket_path))
+
+            server = EmbeddingServer(socket_path, encoder=encode)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                vectors = request_embeddings(["alpha", "be"], model_name="demo", socket_path=socket_path)
+                self.assertEqual(vectors.dtype, np.float32)
+                np.testing.assert_array_equal(vectors, [[5.0, 0.5], [2.0, 0.5]])
+                self.assertIsNone(request_embeddings(["alpha"], model_name="other", socket_path=socket_path))
+                with self.assertRaises(ValueError):
+                    EmbeddingServer(socket_path, encoder=encode)
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+            self.assertFalse(socket_path.exists())
+
+            socket_path.touch()
+            self.assertIsNone(request_embeddings(["alpha"], model_name="demo", socket_path=socket_path))
+
+    def test_request_embeddings_times_out_on_a_silent_server(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "embeddings.sock"
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+                listener.bind(str(socket_path))
+                listener.listen()
+                started = time.perf_counter()
+                vectors = request_embeddings(["alpha"], model_name="demo", socket_path=socket_path, timeout=0.2)
+                self.assertIsNone(vectors)
+                self.assertLess(time.perf_counter() - started, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
 import sqlite3
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from typing import Callable
 
 import httpx
 
 from judge_gym.cache import connect_cache
 from judge_gym.datasets import load_snapshot_bundle
-from judge_gym.export import export_experiments
+from judge_gym.export import (
+    AdaptivePageSizer,
+    ConvexAnalysisClient,
+    RetryPolicy,
+    _StreamingQueryDecoder,
+    export_experiments,
+    export_experiments_async,
+)
 
 
 def build_transport() -> httpx.MockTransport:
+    return httpx.MockTransport(build_handler())
+
+
+def build_handler() -> Callable[[httpx.Request], httpx.Response]:
     calls: dict[str, int] = {
         "packages/analysis:listAnalysisResponses": 0,
         "packages/analysis:listAnalysisRubrics": 0,
@@ -32,6 +48,7 @@ def build_transport() -> httpx.MockTransport:
         args = data["args"]
 
         if path == "packages/analysis:getAnalysisManifest":
+            experiment_tag = args.get("experiment_tag", "exp-tag")
             return httpx.Response(
                 200,
                 json={
@@ -39,7 +56,7 @@ def build_transport() -> httpx.MockTransport:
                         "export_schema_version": 3,
                         "experiment": {
                             "experiment_id": "exp_1",
-                            "experiment_tag": "exp-tag",
+                            "experiment_tag": experiment_tag,
                             "pool_id": "pool_1",
                             "pool_tag": "pool-tag",
                             "bundle_plan_id": None,
@@ -61,7 +78,7 @@ def build_transport() -> httpx.MockTransport:
                             "randomizations": [],
                         },
                         "run": {
-                            "run_id": "run_1",
+                            "run_id": "run_1" if experiment_tag == "exp-tag" else f"run_{experiment_tag}",
                             "status": "completed",
                             "created_at": 123,
                             "target_count": 2,
@@ -191,7 +208,27 @@ def build_transport() -> httpx.MockTransport:
 
         raise AssertionError(path)
 
-    return httpx.MockTransport(handler)
+    return handler
+
+
+def build_latency_transport(
+    *,
+    latency_seconds: float,
+    stats: dict[str, int],
+) -> httpx.MockTransport:
+    handler = build_handler()
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        stats["requests"] += 1
+        try:
+            await asyncio.sleep(latency_seconds)
+            return handler(request)
+        finally:
+            stats["in_flight"] -= 1
+
+    return httpx.MockTransport(async_handler)
 
 
 class ExportPipelineTest(unittest.TestCase):
@@ -233,5 +270,582 @@ class ExportPipelineTest(unittest.TestCase):
                 connection.close()
 
 
+    def test_export_writes_each_page_before_fetching_the_next(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            handler = build_handler()
+            committed_before_second_page: list[tuple[int, int]] = []
+
+            def observing_handler(request: httpx.Request) -> httpx.Response:
+                data = json.loads(request.read().decode())
+                cursor = ((data["args"].get("pagination") or {}).get("cursor"))
+                if data["path"] == "packages/analysis:listAnalysisResponses" and cursor == "1":
+                    reader = sqlite3.connect(db_path)
+                    try:
+                        committed_before_second_page.append((
+                            reader.execute("SELECT COUNT(*) FROM analysis_responses").fetchone()[0],
+                            reader.execute("SELECT COUNT(*) FROM analysis_response_items").fetchone()[0],
+                        ))
+                    finally:
+                        reader.close()
+                return handler(request)
+
+            export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=1,
+                transport=httpx.MockTransport(observing_handler),
+            )
+            self.assertEqual(committed_before_second_page, [(1, 2)])
+
+    def test_export_reports_query_stats_per_dataset(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshots = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(Path(tmpdir) / "cache.sqlite"),
+                page_size=1,
+                transport=build_transport(),
+            )
+            stats = snapshots[0].query_stats
+            responses = stats["packages/analysis:listAnalysisResponses"]
+            self.assertEqual(responses["requests"], 2)
+            self.assertEqual(responses["rows"], 2)
+            self.assertEqual(responses["retries"], 0)
+            self.assertGreater(responses["response_bytes"], 0)
+            self.assertEqual(stats["packages/analysis:listAnalysisSamples"]["rows"], 1)
+
+
+class ConvexClientRetryTest(unittest.TestCase):
+    def test_transient_errors_are_retried_honoring_retry_after(self) -> None:
+        handler = build_handler()
+        failures = {"remaining": 2}
+
+        def flaky_handler(request: httpx.Request) -> httpx.Response:
+            if failures["remaining"] > 0:
+                failures["remaining"] -= 1
+                return httpx.Response(503, headers={"Retry-After": "1.5"})
+            return handler(request)
+
+        sleeps: list[float] = []
+        client = ConvexAnalysisClient(
+            "https://example.convex.cloud",
+            transport=httpx.MockTransport(flaky_handler),
+            sleep=sleeps.append,
+        )
+        try:
+            manifest = client.get_manifest(experiment_tag="exp-tag")
+        finally:
+            client.close()
+        self.assertEqual(manifest["run"]["run_id"], "run_1")
+        self.assertEqual(sleeps, [1.5, 1.5])
+        self.assertEqual(client.query_timings[-1].attempts, 3)
+
+    def test_transport_errors_use_bounded_jittered_backoff(self) -> None:
+        def failing_handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        sleeps: list[float] = []
+        client = ConvexAnalysisClient(
+            "https://example.convex.cloud",
+            transport=httpx.MockTransport(failing_handler),
+            retry_policy=RetryPolicy(max_retries=3, backoff_base_seconds=1.0, backoff_max_seconds=3.0),
+            sleep=sleeps.append,
+        )
+        try:
+            with self.assertRaises(httpx.ConnectTimeout):
+                client.get_manifest(experiment_tag="exp-tag")
+        finally:
+            client.close()
+        self.assertEqual(len(sleeps), 3)
+        for attempt, delay in enumerate(sleeps):
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, min(3.0, 2 ** attempt))
+
+    def test_client_errors_are_not_retried(self) -> None:
+        sleeps: list[float] = []
+        client = ConvexAnalysisClient(
+            "https://example.convex.cloud",
+            transport=httpx.MockTransport(lambda request: httpx.Response(400, json={"error": "bad"})),
+            sleep=sleeps.append,
+        )
+        try:
+            with self.assertRaises(httpx.HTTPStatusError):
+                client.get_manifest(experiment_tag="exp-tag")
+        finally:
+            client.close()
+        self.assertEqual(sleeps, [])
+
+
+class StreamingWireFormatTest(unittest.TestCase):
+    def test_streaming_decoder_matches_json_for_any_chunking(self) -> None:
+        document = {
+            "status": "success",
+            "value": {
+                "is_done": False,
+                "page": [
+                    {"response_id": "score_1", "justification": 'brackets ] [ } { and "quotes", commas: ok', "scores": [1, 2]},
+                    {"response_id": "score_2", "justification": "unicode \u00e9\u2713 \\ escape", "nested": {"page": []}},
+                    {"response_id": "score_3", "justification": "", "value": None},
+                ],
+                "continue_cursor": "3",
+                "total_count": 9,
+            },
+            "logLines": ["page = [1, 2]"],
+        }
+        encoded = json.dumps(document, ensure_ascii=False).encode()
+        for chunk_size in [1, 2, 7, 64, len(encoded)]:
+            decoder = _StreamingQueryDecoder()
+            for start in range(0, len(encoded), chunk_size):
+                decoder.feed(encoded[start:start + chunk_size])
+            self.assertEqual(decoder.finish(), document["value"])
+            self.assertEqual(decoder.decoded_bytes, len(encoded))
+
+    def test_streaming_decoder_handles_values_without_pages(self) -> None:
+        decoder = _StreamingQueryDecoder()
+        decoder.feed(b'{"value": [{"experiment_tag": "a"}, {"experiment_tag": "b"}]}')
+        self.assertEqual(decoder.finish(), [{"experiment_tag": "a"}, {"experiment_tag": "b"}])
+
+    def test_truncated_response_is_rejected(self) -> None:
+        decoder = _StreamingQueryDecoder()
+        decoder.feed(b'{"value": {"page": [{"response_id": "score_1"}, {"response_')
+        with self.assertRaises(ValueError):
+            decoder.finish()
+
+    def test_client_requests_compression_and_reports_wire_bytes(self) -> None:
+        handler = build_handler()
+        accept_encodings: list[str] = []
+
+        def gzip_handler(request: httpx.Request) -> httpx.Response:
+            accept_encodings.append(request.headers["Accept-Encoding"])
+            body = handler(request).content
+            return httpx.Response(
+                200,
+                content=iter([gzip.compress(body)]),
+                headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            )
+
+        client = ConvexAnalysisClient(
+            "https://example.convex.cloud",
+            transport=httpx.MockTransport(gzip_handler),
+        )
+        try:
+            rows = client.collect_dataset(
+                "packages/analysis:listAnalysisResponses",
+                run_id="run_1",
+                page_size=1,
+            )
+        finally:
+            client.close()
+        self.assertEqual([row["response_id"] for row in rows], ["score_1", "score_2"])
+        self.assertIn("gzip", accept_encodings[0])
+        timing = client.query_timings[0]
+        self.assertEqual(timing.content_encoding, "gzip")
+        self.assertGreater(timing.wire_bytes, 0)
+        self.assertLess(timing.wire_bytes, timing.response_bytes)
+        self.assertGreaterEqual(timing.decode_seconds, 0.0)
+        summary = client.timing_summary(run_id="run_1")["packages/analysis:listAnalysisResponses"]
+        self.assertEqual(summary["wire_bytes"], sum(item.wire_bytes for item in client.query_timings))
+
+
+class AdaptivePageSizerTest(unittest.TestCase):
+    def test_page_size_tracks_target_latency_and_byte_budget(self) -> None:
+        sizer = AdaptivePageSizer(page_size=100, target_page_seconds=2.0, max_page_bytes=1_000_000)
+        self.assertEqual(sizer.observe(row_count=100, elapsed_seconds=0.1, response_bytes=10_000), 200)
+        self.assertEqual(sizer.observe(row_count=200, elapsed_seconds=4.0, response_bytes=20_000), 100)
+        self.assertEqual(sizer.observe(row_count=100, elapsed_seconds=0.5, response_bytes=500_000), 200)
+        self.assertEqual(sizer.observe(row_count=200, elapsed_seconds=0.5, response_bytes=4_000_000), 50)
+
+    def test_retried_pages_halve_the_page_size_within_bounds(self) -> None:
+        sizer = AdaptivePageSizer(page_size=30, min_page_size=20)
+        self.assertEqual(sizer.observe(row_count=30, elapsed_seconds=1.0, response_bytes=1, attempts=2), 20)
+        self.assertEqual(sizer.observe(row_count=0, elapsed_seconds=1.0, response_bytes=0), 20)
+
+    def test_export_grows_pages_when_requests_are_fast(self) -> None:
+        requests: list[tuple[str, str | None]] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshots = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(Path(tmpdir) / "cache.sqlite"),
+                page_size=10,
+                target_page_seconds=60.0,
+                transport=build_growing_transport({"responses": 70}, requests),
+            )
+        self.assertEqual(
+            [cursor for path, cursor in requests if path == "packages/analysis:listAnalysisResponses"],
+            [None, "10", "30"],
+        )
+        self.assertEqual(snapshots[0].query_stats["packages/analysis:listAnalysisResponses"]["rows"], 70)
+
+
+class ResumableExportTest(unittest.TestCase):
+    def _flaky_transport(self, requests: list[tuple[str, str | None]], *, fail_second_page: bool) -> httpx.MockTransport:
+        handler = build_handler()
+
+        def flaky_handler(request: httpx.Request) -> httpx.Response:
+            data = json.loads(request.read().decode())
+            cursor = ((data["args"].get("pagination") or {}).get("cursor"))
+            requests.append((data["path"], cursor))
+            if fail_second_page and data["path"] == "packages/analysis:listAnalysisResponses" and cursor == "1":
+                return httpx.Response(503, json={"error": "unavailable"})
+            return handler(request)
+
+        return httpx.MockTransport(flaky_handler)
+
+    def _interrupted_export(self, db_path: Path) -> None:
+        with self.assertRaises(httpx.HTTPStatusError):
+            export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=1,
+                retry_policy=RetryPolicy(max_retries=0),
+                transport=self._flaky_transport([], fail_second_page=True),
+            )
+
+    def test_resume_continues_pending_snapshot_from_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            self._interrupted_export(db_path)
+
+            connection = connect_cache(str(db_path))
+            try:
+                pending = connection.execute(
+                    "SELECT snapshot_id FROM export_snapshots WHERE status = 'pending'"
+                ).fetchone()["snapshot_id"]
+                checkpoint = connection.execute(
+                    "SELECT continue_cursor, row_count, is_done FROM export_checkpoints WHERE snapshot_id = ?",
+                    (pending,),
+                ).fetchone()
+                self.assertEqual(tuple(checkpoint), ("1", 1, 0))
+            finally:
+                connection.close()
+
+            requests: list[tuple[str, str | None]] = []
+            snapshots = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=1,
+                resume=True,
+                transport=self._flaky_transport(requests, fail_second_page=False),
+            )
+            self.assertEqual(snapshots[0].snapshot_id, pending)
+            self.assertTrue(snapshots[0].resumed)
+            self.assertNotIn(("packages/analysis:listAnalysisResponses", None), requests)
+            self.assertIn(("packages/analysis:listAnalysisResponses", "1"), requests)
+
+            bundle = load_snapshot_bundle(experiment_tags=["exp-tag"], cache_db_path=str(db_path))
+            self.assertEqual(bundle.responses["response_id"].tolist(), ["score_1", "score_2"])
+            self.assertEqual(len(bundle.response_items), 4)
+
+            connection = connect_cache(str(db_path))
+            try:
+                row = connection.execute(
+                    "SELECT status FROM export_snapshots WHERE snapshot_id = ?",
+                    (pending,),
+                ).fetchone()
+                self.assertEqual(row["status"], "completed")
+                unfinished = connection.execute(
+                    "SELECT COUNT(*) FROM export_checkpoints WHERE snapshot_id = ? AND is_done = 0",
+                    (pending,),
+                ).fetchone()[0]
+                self.assertEqual(unfinished, 0)
+            finally:
+                connection.close()
+
+    def test_fresh_export_discards_abandoned_pending_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            self._interrupted_export(db_path)
+
+            snapshots = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=1,
+                transport=self._flaky_transport([], fail_second_page=False),
+            )
+            self.assertFalse(snapshots[0].resumed)
+
+            connection = connect_cache(str(db_path))
+            try:
+                statuses = [
+                    str(row["status"])
+                    for row in connection.execute("SELECT status FROM export_snapshots").fetchall()
+                ]
+                self.assertEqual(statuses, ["completed"])
+                response_count = connection.execute("SELECT COUNT(*) FROM analysis_responses").fetchone()[0]
+                self.assertEqual(response_count, 2)
+            finally:
+                connection.close()
+
+
+def build_growing_transport(
+    state: dict[str, int],
+    requests: list[tuple[str, str | None]],
+    pending_critics: set[int] | None = None,
+) -> httpx.MockTransport:
+    handler = build_handler()
+    template_request = httpx.Request(
+        "POST",
+        "https://example.com/api/query",
+        json={"path": "packages/analysis:listAnalysisResponses", "args": {"run_id": "run_1"}},
+    )
+    template = handler(template_request).json()["value"]["page"][0]
+
+    def growing_handler(request: httpx.Request) -> httpx.Response:
+        data = json.loads(request.read().decode())
+        path = data["path"]
+        pagination = data["args"].get("pagination") or {}
+        cursor = pagination.get("cursor")
+        requests.append((path, cursor))
+        if path == "packages/analysis:getAnalysisManifest":
+            manifest = handler(request).json()["value"]
+            manifest["counts"]["responses"] = state["responses"]
+            return httpx.Response(200, json={"value": manifest})
+        if path == "packages/analysis:listAnalysisResponses":
+            rows = [
+                template | {"response_id": f"score_{index}", "score_target_id": f"target_{index}"}
+                for index in range(1, state["responses"] + 1)
+            ]
+            for index in pending_critics or ():
+                rows[index - 1] |= {"score_critic_id": None, "score_expert_agreement_prob": None}
+            offset = int(cursor or 0)
+            page = rows[offset:offset + int(pagination.get("limit", 200))]
+            next_offset = offset + len(page)
+            return httpx.Response(
+                200,
+                json={"value": {
+                    "page": page,
+                    "continue_cursor": str(next_offset) if next_offset < len(rows) else None,
+                    "is_done": next_offset >= len(rows),
+                    "total_count": len(rows),
+                }},
+            )
+        if cursor is not None:
+            return httpx.Response(
+                200,
+                json={"value": {"page": [], "continue_cursor": None, "is_done": True, "total_count": 1}},
+            )
+        return handler(request)
+
+    return httpx.MockTransport(growing_handler)
+
+
+class IncrementalExportTest(unittest.TestCase):
+    def test_incremental_export_appends_new_rows_to_child_generation(self) -> None:
+        state = {"responses": 3}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            parent = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=2,
+                transport=build_growing_transport(state, []),
+            )[0]
+
+            state["responses"] = 5
+            requests: list[tuple[str, str | None]] = []
+            child = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=2,
+                incremental=True,
+                transport=build_growing_transport(state, requests),
+            )[0]
+            self.assertNotEqual(child.snapshot_id, parent.snapshot_id)
+            self.assertEqual(child.parent_snapshot_id, parent.snapshot_id)
+            self.assertEqual(
+                [cursor for path, cursor in requests if path == "packages/analysis:listAnalysisResponses"],
+                ["3"],
+            )
+
+            connection = connect_cache(str(db_path))
+            try:
+                own_rows = connection.execute(
+                    "SELECT response_id FROM analysis_responses WHERE snapshot_id = ? ORDER BY rowid",
+                    (child.snapshot_id,),
+                ).fetchall()
+                self.assertEqual([row["response_id"] for row in own_rows], ["score_4", "score_5"])
+            finally:
+                connection.close()
+
+            bundle = load_snapshot_bundle(experiment_tags=["exp-tag"], cache_db_path=str(db_path))
+            self.assertEqual(bundle.snapshot_ids, [child.snapshot_id])
+            self.assertEqual(
+                bundle.responses["response_id"].tolist(),
+                ["score_1", "score_2", "score_3", "score_4", "score_5"],
+            )
+            self.assertEqual(set(bundle.responses["snapshot_id"]), {child.snapshot_id})
+            self.assertEqual(len(bundle.response_items), 10)
+            self.assertEqual(len(bundle.rubrics), 1)
+            self.assertEqual(len(bundle.samples), 1)
+
+            parent_bundle = load_snapshot_bundle(snapshot_ids=[parent.snapshot_id], cache_db_path=str(db_path))
+            self.assertEqual(len(parent_bundle.responses), 3)
+
+    def test_incremental_export_reuses_unchanged_snapshot(self) -> None:
+        state = {"responses": 3}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            parent = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                transport=build_growing_transport(state, []),
+            )[0]
+            requests: list[tuple[str, str | None]] = []
+            again = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                incremental=True,
+                transport=build_growing_transport(state, requests),
+            )[0]
+            self.assertEqual(again.snapshot_id, parent.snapshot_id)
+            self.assertEqual([path for path, _ in requests], ["packages/analysis:getAnalysisManifest"])
+
+    def test_incremental_export_refetches_rows_whose_critic_scores_arrive_later(self) -> None:
+        state = {"responses": 4}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            parent = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=2,
+                transport=build_growing_transport(state, [], pending_critics={2, 4}),
+            )[0]
+            parent_bundle = load_snapshot_bundle(snapshot_ids=[parent.snapshot_id], cache_db_path=str(db_path))
+            self.assertEqual(
+                parent_bundle.responses["score_expert_agreement_prob"].isna().tolist(),
+                [False, True, False, True],
+            )
+
+            requests: list[tuple[str, str | None]] = []
+            child = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=2,
+                incremental=True,
+                transport=build_growing_transport(state, requests),
+            )[0]
+            self.assertEqual(child.parent_snapshot_id, parent.snapshot_id)
+            self.assertEqual(
+                [cursor for path, cursor in requests if path == "packages/analysis:listAnalysisResponses"],
+                ["1", "3"],
+            )
+
+            bundle = load_snapshot_bundle(experiment_tags=["exp-tag"], cache_db_path=str(db_path))
+            self.assertEqual(bundle.snapshot_ids, [child.snapshot_id])
+            self.assertEqual(
+                bundle.responses["response_id"].tolist(),
+                ["score_1", "score_2", "score_3", "score_4"],
+            )
+            self.assertEqual(bundle.responses["score_expert_agreement_prob"].tolist(), [0.7, 0.7, 0.7, 0.7])
+            self.assertEqual(bundle.responses["score_critic_id"].tolist(), ["critic_1"] * 4)
+            self.assertEqual(len(bundle.response_items), 8)
+            self.assertEqual(
+                bundle.response_items.groupby("response_id").size().tolist(),
+                [2, 2, 2, 2],
+            )
+
+            requests.clear()
+            again = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                incremental=True,
+                transport=build_growing_transport(state, requests),
+            )[0]
+            self.assertEqual(again.snapshot_id, child.snapshot_id)
+            self.assertEqual([path for path, _ in requests], ["packages/analysis:getAnalysisManifest"])
+
+
+class AsyncExportPipelineTest(unittest.TestCase):
+    def test_async_export_matches_sync_export_with_bounded_concurrency(self) -> None:
+        tags = [f"exp-{index}" for index in range(6)]
+        latency_seconds = 0.02
+        stats = {"in_flight": 0, "peak_in_flight": 0, "requests": 0}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sync_path = Path(tmpdir) / "sync.sqlite"
+            async_path = Path(tmpdir) / "async.sqlite"
+            export_experiments(
+                experiment_tags=tags,
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(sync_path),
+                page_size=1,
+                transport=build_transport(),
+            )
+
+            started = time.perf_counter()
+            snapshots = asyncio.run(
+                export_experiments_async(
+                    experiment_tags=tags,
+                    deployment_url="https://example.convex.cloud",
+                    cache_db_path=str(async_path),
+                    page_size=1,
+                    max_concurrency=4,
+                    transport=build_latency_transport(latency_seconds=latency_seconds, stats=stats),
+                )
+            )
+            elapsed = time.perf_counter() - started
+
+            self.assertEqual([snapshot.experiment_tag for snapshot in snapshots], tags)
+            self.assertLessEqual(stats["peak_in_flight"], 4)
+            self.assertGreater(stats["peak_in_flight"], 1)
+            self.assertLess(elapsed, stats["requests"] * latency_seconds)
+
+            sync_bundle = load_snapshot_bundle(experiment_tags=tags, cache_db_path=str(sync_path))
+            async_bundle = load_snapshot_bundle(experiment_tags=tags, cache_db_path=str(async_path))
+            for attribute in ["responses", "rubrics", "evidence", "samples", "response_items"]:
+                self.assertEqual(
+                    len(getattr(async_bundle, attribute)),
+                    len(getattr(sync_bundle, attribute)),
+                )
+            self.assertEqual(
+                sorted(async_bundle.response_items["evidence_id"].tolist()),
+                sorted(sync_bundle.response_items["evidence_id"].tolist()),
+            )
+
+            connection = connect_cache(str(async_path))
+            try:
+                statuses = {
+                    str(row["status"])
+                    for row in connection.execute("SELECT status FROM export_snapshots").fetchall()
+                }
+                self.assertEqual(statuses, {"completed"})
+            finally:
+                connection.close()
+
+    def test_async_export_reuses_cached_snapshot(self) -> None:
+        stats = {"in_flight": 0, "peak_in_flight": 0, "requests": 0}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            first = export_experiments(
+                experiment_tags=["exp-tag"],
+                deployment_url="https://example.convex.cloud",
+                cache_db_path=str(db_path),
+                page_size=1,
+                transport=build_transport(),
+            )
+            second = asyncio.run(
+                export_experiments_async(
+                    experiment_tags=["exp-tag"],
+                    deployment_url="https://example.convex.cloud",
+                    cache_db_path=str(db_path),
+                    transport=build_latency_transport(latency_seconds=0.0, stats=stats),
+                )
+            )
+            self.assertEqual(second[0].snapshot_id, first[0].snapshot_id)
+            self.assertEqual(stats["requests"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -300,6 +301,7 @@ class InvestigationReportTest(unittest.TestCase):
                 experiment_tags=[tag for tag, _ in tags],
                 cache_db_path=str(db_path),
                 output_dir=output_dir,
+                rubric_embedding_cache_path=Path(tmpdir) / "embeddings.sqlite",
                 rubric_embedding_encoder=lambda texts: np.array(
                     [
                         [
@@ -334,6 +336,35 @@ class InvestigationReportTest(unittest.TestCase):
             self.assertEqual(len(matching), 1)
             self.assertTrue(bool(matching.iloc[0]["fully_matched"]))
 
+            first_summary = json.loads((report_dir / "summary.json").read_text())
+            self.assertIn("sample_metrics", first_summary["derived_cache"]["misses"])
+            self.assertEqual(first_summary["derived_cache"]["hits"], [])
+            reused = first_summary["reused_intermediates"]
+            self.assertEqual(
+                reused["sample_beliefs_tbm"],
+                ["experiment_metrics", "sample_metrics"],
+            )
+            self.assertIn("matching_tables", reused["sample_metrics"])
+            self.assertIn("scale_matching_tables", reused["sample_metrics"])
+
+            rerun_dir = generate_v3_investigation(
+                experiment_tags=[tag for tag, _ in tags],
+                cache_db_path=str(db_path),
+                output_dir=Path(tmpdir) / "rerun",
+                rubric_embedding_cache_path=Path(tmpdir) / "embeddings.sqlite",
+                rubric_embedding_encoder=lambda texts: np.ones((len(texts), 3)),
+            )
+            rerun_summary = json.loads((rerun_dir / "summary.json").read_text())
+            hits = rerun_summary["derived_cache"]["hits"]
+            for builder in ["sample_metrics", "bundle_belief_tbm", "bundle_belief_closed_world", "family_effects"]:
+                self.assertIn(builder, hits)
+            self.assertNotIn("rubric_embedding_tables", hits)
+            for table in ["sample_metrics.csv", "family_effects.csv", "bundle_belief_tbm.csv"]:
+                self.assertEqual(
+                    (report_dir / "tables" / table).read_text(),
+                    (rerun_dir / "tables" / table).read_text(),
+                )
+
     def test_generate_v3_investigation_adds_v3_1_followup_contrasts(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "cache.sqlite"
@@ -415,6 +446,7 @@ class InvestigationReportTest(unittest.TestCase):
                 ],
                 cache_db_path=str(db_path),
                 output_dir=Path(tmpdir) / "investigation",
+                rubric_embedding_cache_path=Path(tmpdir) / "embeddings.sqlite",
                 rubric_embedding_encoder=lambda texts: np.array(
                     [
                         [
@@ -461,6 +493,101 @@ class InvestigationReportTest(unittest.TestCase):
                 ).exists()
             )
 
+    def test_incremental_investigation_skips_tables_when_only_figures_manifest_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                tags = [
+                    ("v3_a1_gpt_4_1_abstain_false", False),
+                    ("v3_a1_gpt_4_1_abstain_true", True),
+                ]
+                for experiment_tag, abstain_enabled in tags:
+                    _seed_snapshot(
+                        connection,
+                        experiment_tag=experiment_tag,
+                        abstain_enabled=abstain_enabled,
+                    )
+            finally:
+                connection.close()
+
+            manifest_path = Path(tmpdir) / "figures_manifest.json"
+            manifest_path.write_text(json.dumps({"figures": []}))
+
+            def run():
+                report_dir = generate_v3_investigation(
+                    experiment_tags=[tag for tag, _ in tags],
+                    cache_db_path=str(db_path),
+                    output_dir=Path(tmpdir) / "investigation",
+                    figures_manifest_path=str(manifest_path),
+                    rubric_embedding_cache_path=Path(tmpdir) / "embeddings.sqlite",
+                    rubric_embedding_encoder=lambda texts: np.ones((len(texts), 3)),
+                    incremental=True,
+                )
+                return report_dir, json.loads((report_dir / "summary.json").read_text())
+
+            report_dir, first = run()
+            self.assertEqual(first["nodes"]["skipped"], [])
+            self.assertTrue((report_dir / "investigation_state.json").exists())
+            sample_metrics_mtime = (report_dir / "tables" / "sample_metrics.csv").stat().st_mtime_ns
+
+            manifest_path.write_text(json.dumps({"figures": [], "revision": 2}))
+            _, second = run()
+            for node in ["sample_metrics", "family_effects", "bundle_belief_tbm", "matching_tables", "scale_certainty_analysis"]:
+                self.assertIn(node, second["nodes"]["skipped"])
+            self.assertIn("figures", second["nodes"]["rebuilt"])
+            self.assertNotIn("sample_metrics", second["derived_cache"]["misses"])
+            self.assertEqual(second["figure_count"], first["figure_count"])
+            self.assertEqual(
+                (report_dir / "tables" / "sample_metrics.csv").stat().st_mtime_ns,
+                sample_metrics_mtime,
+            )
+
+    def test_parallel_investigation_matches_sequential_tables(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.sqlite"
+            connection = connect_cache(db_path)
+            try:
+                tags = [
+                    ("v3_a1_gpt_4_1_abstain_false", False),
+                    ("v3_a1_gpt_4_1_abstain_true", True),
+                ]
+                for experiment_tag, abstain_enabled in tags:
+                    _seed_snapshot(
+                        connection,
+                        experiment_tag=experiment_tag,
+                        abstain_enabled=abstain_enabled,
+                    )
+            finally:
+                connection.close()
+
+            report_dirs = [
+                generate_v3_investigation(
+                    experiment_tags=[tag for tag, _ in tags],
+                    cache_db_path=str(db_path),
+                    output_dir=Path(tmpdir) / f"workers_{workers}",
+                    rubric_embedding_cache_path=Path(tmpdir) / "embeddings.sqlite",
+                    rubric_embedding_encoder=lambda texts: np.ones((len(texts), 3)),
+                    use_derived_cache=False,
+                    workers=workers,
+                )
+                for workers in [1, 3]
+            ]
+            sequential_tables = sorted(path.name for path in (report_dirs[0] / "tables").glob("*.csv"))
+            self.assertEqual(
+                sequential_tables,
+                sorted(path.name for path in (report_dirs[1] / "tables").glob("*.csv")),
+            )
+            for table in sequential_tables:
+                self.assertEqual(
+                    (report_dirs[0] / "tables" / table).read_text(),
+                    (report_dirs[1] / "tables" / table).read_text(),
+                    table,
+                )
+            parallel_summary = json.loads((report_dirs[1] / "summary.json").read_text())
+            self.assertEqual(parallel_summary["workers"], 3)
+            self.assertIn("bundle_belief_tbm", parallel_summary["build_seconds"])
+
 
 if __name__ == "__main__":
     unittest.main()